@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compares the bytearray control framer in MumbleConnection with the
+StatefulProtocol based framer it replaced.
+
+A burst of control messages, like the one a large server sends during the
+initial sync, is fed to each framer either in one chunk or in TCP segment
+sized pieces.  Message bodies are not parsed, so only framing is timed.
+
+    python benchmarks/bench_control_framing.py [messages] [body size]
+"""
+
+import os
+import sys
+import struct
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import twisted.protocols.stateful
+
+from mumbleclient import MumbleConnection
+
+
+class LegacyFramer(twisted.protocols.stateful.StatefulProtocol):
+    """The previous implementation, with message handling removed"""
+
+    def __init__(self):
+        self.count=0
+
+    def getInitialState(self):
+        return (self.messageHeaderReceived,6)
+
+    def messageHeaderReceived(self,data):
+        msgType,length=struct.unpack(">HI",data)
+        self._msgType = msgType
+        return (self.messageBodyReceived,length)
+
+    def messageBodyReceived(self,data):
+        self.count+=1
+        return (self.messageHeaderReceived,6)
+
+
+class BufferFramer(MumbleConnection.MumbleConnection):
+    """The current implementation, with message handling removed"""
+
+    def __init__(self):
+        MumbleConnection.MumbleConnection.__init__(self)
+        self.count=0
+
+    def messageReceived(self,msgType,data):
+        self.count+=1
+
+    dataReceived=MumbleConnection.MumbleConnection.receiveData
+
+
+class _Transport(object):
+    """All StatefulProtocol looks at"""
+    disconnecting=False
+
+
+def makeStream(messages,bodySize):
+    message = struct.pack(">HI",9,bodySize)+b"x"*bodySize
+    return message*messages
+
+
+def feed(framerClass,chunks,messages):
+    framer = framerClass()
+    # StatefulProtocol sets up its state in makeConnection
+    if isinstance(framer,LegacyFramer):
+        framer.makeConnection(_Transport())
+    for chunk in chunks:
+        framer.dataReceived(chunk)
+    assert framer.count == messages
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bodySize = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    stream = makeStream(messages,bodySize)
+    segments = [stream[i:i+1448] for i in range(0,len(stream),1448)]
+    print("%d messages of %d bytes (%d bytes total)" % (messages,bodySize,len(stream)))
+    for label,chunks in (("single chunk",[stream]),("1448 byte segments",segments)):
+        for framerClass in (LegacyFramer,BufferFramer):
+            t = min(timeit.repeat(lambda: feed(framerClass,chunks,messages),number=1,repeat=5))
+            print("%-20s %-14s %8.2f ms  %8.0f msg/s" % (label,framerClass.__name__,t*1000,messages/t))
+
+
+if __name__ == "__main__":
+    main()
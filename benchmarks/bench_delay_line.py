@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Compares MumbleDelayLine with the heapq polling loop eve-bot2 used before
+it, relaying the voice of several speakers with a long delay.
+
+Both run against a simulated clock, so the timings are pure CPU cost: every
+speaker sends a 20ms packet 50 times a second, and each engine is woken up
+whenever it asked to be.
+
+    python benchmarks/bench_delay_line.py [speakers] [seconds] [delay]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import heapq
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mumbleclient import MumbleDelayLine
+
+
+class SimulatedClock(object):
+
+    def __init__(self):
+        self.now=0.0
+        self._calls=[]
+        self._order=0
+
+    def __call__(self):
+        return self.now
+
+    def callLater(self,delay,f):
+        self._order+=1
+        call=[self.now+delay,self._order,f,True]
+        heapq.heappush(self._calls,call)
+        return _Call(call)
+
+    def advance(self,until):
+        calls=self._calls
+        while calls and calls[0][0] <= until:
+            when,order,f,live=heapq.heappop(calls)
+            if live:
+                self.now=max(self.now,when)
+                f()
+        self.now=until
+
+
+class _Call(object):
+
+    def __init__(self,call):
+        self._call=call
+
+    def cancel(self):
+        self._call[3]=False
+
+
+class HeapRelay(object):
+    """The previous eve-bot2 implementation"""
+
+    def __init__(self,clock,speakers,delay):
+        self.clock=clock
+        self.delay=delay
+        self.queues=[[] for i in range(speakers)]
+        self.sent=0
+        clock.callLater(0.1,self.sendVoiceData)
+
+    def push(self,speaker,prefix,data):
+        heapq.heappush(self.queues[speaker],(self.clock()+self.delay,prefix+data))
+
+    def sendVoiceData(self):
+        while True:
+            sent=False
+            t=self.clock()
+            nt=t+self.delay
+            for vd in self.queues:
+                if len(vd) > 0:
+                    if vd[0][0] <= t:
+                        heapq.heappop(vd)
+                        self.sent+=1
+                        sent=True
+                    if len(vd) > 0:
+                        if vd[0][0] < nt: nt=vd[0][0]
+            if not sent: break
+        self.clock.callLater(nt-t,self.sendVoiceData)
+
+
+class LineRelay(object):
+
+    def __init__(self,clock,speakers,delay):
+        self.line=MumbleDelayLine.DelayLine(clock.callLater,clock)
+        self.streams=[self.line.addStream(self.send,delay) for i in range(speakers)]
+        self.sent=0
+
+    def send(self,data):
+        self.sent+=1
+
+    def push(self,speaker,prefix,data):
+        self.streams[speaker].push(data)
+
+
+def run(relayClass,speakers,seconds,delay):
+    clock=SimulatedClock()
+    relay=relayClass(clock,speakers,delay)
+    prefix=b"\x80"
+    data=b"x"*70
+    packets=int(seconds*50)
+    for i in range(packets):
+        t=i*0.02
+        for speaker in range(speakers):
+            clock.advance(t+speaker*0.0013)
+            relay.push(speaker,prefix,data)
+    clock.advance(seconds+delay+1)
+    assert relay.sent == packets*speakers
+    return relay
+
+
+def main():
+    speakers = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 120
+    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 90
+    total = int(seconds*50)*speakers
+    print("%d speakers, %gs of speech each, %gs delay (%d packets)" % (speakers,seconds,delay,total))
+    for relayClass in (HeapRelay,LineRelay):
+        t = min(timeit.repeat(lambda: run(relayClass,speakers,seconds,delay),number=1,repeat=3))
+        print("%-10s %8.1f ms  %6.2f us/packet" % (relayClass.__name__,t*1000,t*1e6/total))
+    relay = run(LineRelay,speakers,seconds,delay)
+    print("playout lateness:", relay.line.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Compares the memory used to hold a long voice delay in RAM (the heapq lists
+eve-bot2 used to keep, and MumbleDelayLine.MemoryBuffer) with holding it in
+a MumbleRingFile.
+
+Every speaker queues one 20ms packet 50 times a second for the whole delay,
+which is the most a delay line ever holds.  Each variant runs in a fresh
+process and reports how much its peak resident size grew and, on Linux, how
+much of that is anonymous memory (the Python heap).  The ring file's pages
+are counted in the peak while they are mapped, but they belong to the file,
+and the operating system can drop them from RAM at any time.
+
+    python benchmarks/bench_delay_memory.py [speakers] [delay] [packet bytes]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import heapq
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mumbleclient import MumbleDelayLine
+from mumbleclient import MumbleRingFile
+
+
+def fill(variant,speakers,delay,size,path):
+    packets=int(delay*50)
+    data=b"x"*size
+    digits=[str(digit).encode("ascii") for digit in range(10)]
+    if variant == "heap":
+        queues=[[] for i in range(speakers)]
+        push=lambda speaker,due,packet: heapq.heappush(queues[speaker],(due,packet))
+        held=queues
+    elif variant == "memory":
+        buffers=[MumbleDelayLine.MemoryBuffer() for i in range(speakers)]
+        push=lambda speaker,due,packet: buffers[speaker].append(due,packet)
+        held=buffers
+    else:
+        ring=MumbleRingFile.RingFile(path,dataSize=packets*speakers*(size+8),entries=packets*speakers)
+        buffers=[ring.buffer(speaker) for speaker in range(speakers)]
+        push=lambda speaker,due,packet: buffers[speaker].append(due,packet)
+        held=ring
+    i=0
+    while i < packets:
+        for speaker in range(speakers):
+            # A distinct string per packet, as received off the network
+            push(speaker,i*0.02+delay,data[:-1]+digits[i%10])
+        i+=1
+    return held
+
+
+def anonymousKB():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"): return int(line.split()[1])
+    except IOError:
+        pass
+    return -1
+
+
+def child(variant,speakers,delay,size,path):
+    before=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    anonBefore=anonymousKB()
+    held=fill(variant,speakers,delay,size,path)
+    after=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    anonAfter=anonymousKB()
+    print(after-before,(anonAfter-anonBefore if anonBefore >= 0 else -1))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2],int(sys.argv[3]),float(sys.argv[4]),int(sys.argv[5]),sys.argv[6])
+        return
+    speakers = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 90
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 70
+    total = int(delay*50)*speakers
+    print("%d speakers, %gs delay, %d byte packets (%d packets queued)" % (speakers,delay,size,total))
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory,"delay.ring")
+    try:
+        for variant in ("heap","memory","ring"):
+            output = subprocess.check_output([sys.executable,os.path.abspath(__file__),"--child",
+                                              variant,str(speakers),str(delay),str(size),path])
+            grew,anonymous = [int(kb) for kb in output.split()[-2:]]
+            line = "%-8s peak RSS +%6.1f MB %6.1f bytes/packet" % (variant,grew/1024.0,grew*1024.0/total)
+            if anonymous >= 0:
+                line += "   heap +%6.1f MB %6.1f bytes/packet" % (anonymous/1024.0,anonymous*1024.0/total)
+            print(line)
+        print("ring file: %.1f MB on disk" % (os.path.getsize(path)/1048576.0))
+    finally:
+        if os.path.exists(path): os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Compares MumbleRecorder with pickling (time, session, prefix, data) tuples
+from VoiceMessageReceived, for writing a recording and for reading one
+minute from the middle of it.
+
+Every speaker sends a 20ms packet 50 times a second.
+
+    python benchmarks/bench_recorder.py [speakers] [minutes]
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import timeit
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mumbleclient import MumbleRecorder
+from mumbleclient import MumbleVoiceProtocol
+
+
+def makePackets(speakers,minutes):
+    builder=MumbleVoiceProtocol.VoicePacketBuilder()
+    frame=b"o"*60
+    packets=[]
+    count=int(minutes*60*50)
+    i=0
+    while i < count:
+        for speaker in range(speakers):
+            raw=builder.build(i,[frame],session=speaker+1).tobytes()
+            packets.append((1000.0+i*0.02,MumbleVoiceProtocol.VoicePacket(raw)))
+        i+=1
+    return packets
+
+
+def writePickle(path,packets):
+    with open(path,"wb") as f:
+        for now,packet in packets:
+            pickle.dump((now,packet.session,packet.prefix,packet.data),f,pickle.HIGHEST_PROTOCOL)
+
+
+def readPickle(path,start,end):
+    found=0
+    with open(path,"rb") as f:
+        while True:
+            try:
+                now,session,prefix,data=pickle.load(f)
+            except EOFError:
+                break
+            if now >= end: break
+            if now >= start: found+=1
+    return found
+
+
+def writeRecording(path,packets):
+    recorder=MumbleRecorder.Recorder(path)
+    for now,packet in packets:
+        recorder.recordPacket(packet,now)
+    recorder.close()
+
+
+def readRecording(path,start,end):
+    reader=MumbleRecorder.Reader(path)
+    found=0
+    for packet in reader.packets(start,end):
+        found+=1
+    reader.close()
+    return found
+
+
+def main():
+    speakers = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    packets = makePackets(speakers,minutes)
+    print("%d speakers, %g minutes (%d packets)" % (speakers,minutes,len(packets)))
+    middle = 1000.0+minutes*30
+    directory = tempfile.mkdtemp()
+    try:
+        for name,write,read in (("pickle",writePickle,readPickle),
+                                ("recorder",writeRecording,readRecording)):
+            path = os.path.join(directory,name)
+            w = min(timeit.repeat(lambda: write(path,packets),number=1,repeat=3))
+            r = min(timeit.repeat(lambda: read(path,middle,middle+60),number=1,repeat=3))
+            print("%-9s write %7.1f ms (%5.2f us/packet)  read 1 minute from the middle %7.1f ms  %6.1f MB" % (
+                name,w*1000,w*1e6/len(packets),r*1000,os.path.getsize(path)/1048576.0))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Feeds a control stream through MumbleClientCore with no sockets or reactor,
+to time the protocol and handler code on its own.
+
+By default the stream is synthetic: voice packets from several speakers
+interleaved with text messages, cut into TCP segment sized pieces.  A
+file holding a raw control stream captured from a server (the decrypted
+bytes, as received) can be replayed instead.
+
+    python benchmarks/bench_sansio_replay.py [packets] [capture file]
+"""
+
+import os
+import sys
+import struct
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mumbleclient import MumbleClientCore
+from mumbleclient import MumbleConnection
+from mumbleclient import MumbleVoiceProtocol
+
+
+class ReplayClient(MumbleClientCore.MumbleClientCore):
+    """A client whose I/O does nothing, counting the voice it receives"""
+
+    def __init__(self):
+        MumbleClientCore.MumbleClientCore.__init__(self)
+        self.packets=0
+
+    def _callLater(self,delay,f):
+        return None
+
+    def _startPinging(self):
+        pass
+
+    def _dataQueued(self):
+        self.connection.dataToSend()
+
+    def VoicePacketReceived(self,packet,TCP=False):
+        self.packets+=1
+        packet.frames
+
+
+def makeStream(packets,speakers=10):
+    builder = MumbleVoiceProtocol.VoicePacketBuilder()
+    frame = b"x"*60
+    text = MumbleConnection.TextMessage()
+    text.message = "hello"
+    text = text.SerializeToString()
+    parts=[]
+    for i in range(packets):
+        voice = builder.build(i//speakers,[frame],session=i%speakers+1)
+        parts.append(struct.pack(">HI",1,len(voice))+voice.tobytes())
+        if i % 50 == 0:
+            parts.append(struct.pack(">HI",11,len(text))+text)
+    return b"".join(parts)
+
+
+def replay(chunks):
+    client = ReplayClient()
+    client._connectionMade()
+    for chunk in chunks:
+        client._dataReceived(chunk)
+    return client.packets
+
+
+def main():
+    packets = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    if len(sys.argv) > 2:
+        with open(sys.argv[2],"rb") as f:
+            stream = f.read()
+    else:
+        stream = makeStream(packets)
+    chunks = [stream[i:i+1448] for i in range(0,len(stream),1448)]
+    received = replay(chunks)
+    t = min(timeit.repeat(lambda: replay(chunks),number=1,repeat=5))
+    print("%d bytes, %d voice packets" % (len(stream),received))
+    print("%8.2f ms  %8.0f packets/s  %8.1f MB/s" % (t*1000,received/t,len(stream)/t/1e6))
+
+
+if __name__ == "__main__":
+    main()
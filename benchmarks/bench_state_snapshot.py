@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Compares loading a MumbleState snapshot with rebuilding the same state from
+the ChannelState and UserState messages a server sends during its initial
+sync.  The sync side includes parsing the messages, as the client does.
+
+    python benchmarks/bench_state_snapshot.py [users] [channels]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mumbleclient import MumbleConnection
+from mumbleclient import MumbleState
+
+
+def makeSyncMessages(users,channels):
+    messages=[]
+    root = MumbleConnection.ChannelState()
+    root.channel_id = 0
+    root.name = "Root"
+    messages.append((MumbleConnection.ChannelState,root.SerializeToString()))
+    for i in range(1,channels):
+        message = MumbleConnection.ChannelState()
+        message.channel_id = i
+        message.parent = (i-1)//4
+        message.name = "Channel %d" % i
+        message.description = "Description of channel %d" % i
+        messages.append((MumbleConnection.ChannelState,message.SerializeToString()))
+    for i in range(users):
+        message = MumbleConnection.UserState()
+        message.session = i+1
+        message.name = u"User %d" % i
+        message.user_id = i
+        message.channel_id = i % channels
+        message.hash = "%040x" % i
+        message.self_mute = (i % 3 == 0)
+        if i % 5 == 0: message.comment = u"A comment from user %d" % i
+        messages.append((MumbleConnection.UserState,message.SerializeToString()))
+    return messages
+
+
+def fullSync(messages):
+    state = MumbleState.MumbleState()
+    for messageClass,data in messages:
+        message = messageClass()
+        message.ParseFromString(data)
+        if messageClass is MumbleConnection.UserState:
+            state.updateUser(message)
+        else:
+            state.updateChannel(message)
+    return state
+
+
+def loadSnapshot(snapshot):
+    state = MumbleState.MumbleState()
+    state.restore(snapshot)
+    return state
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    channels = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    messages = makeSyncMessages(users,channels)
+    snapshot = fullSync(messages).snapshot()
+    print("%d users, %d channels; sync %d bytes, snapshot %d bytes" % (
+        users,channels,sum(len(data)+6 for c,data in messages),len(snapshot)))
+    tSync = min(timeit.repeat(lambda: fullSync(messages),number=1,repeat=5))
+    tLoad = min(timeit.repeat(lambda: loadSnapshot(snapshot),number=1,repeat=5))
+    print("full sync      %8.2f ms" % (tSync*1000))
+    print("snapshot load  %8.2f ms  (%.1fx faster)" % (tLoad*1000,tSync/tLoad))
+
+
+if __name__ == "__main__":
+    main()
@@ -33,31 +33,19 @@
 #http://frymaster.127001.org/mumble
 
 from mumbleclient import MumbleClient
+from mumbleclient import MumbleClientPool
 from mumbleclient import MumbleControlProtocol
+from mumbleclient import MumbleDelayLine
+from mumbleclient import MumbleRingFile
 
-import heapq
-import time
 import sys
+import time
 import optparse
 
-from twisted.internet import reactor, task
+from twisted.internet import reactor
 
 class MimicClient(MumbleClient.AutoChannelJoinClient):
-
-    def ServerSyncReceived(self,message):
-        #We may have had voice data waiting to be transmitted.  Prune all
-        # voice data set to go out before the current point.
-        t=time.time()
-        vd = self.settings.voiceData
-        while True:
-            someFound = False
-            try:
-                if vd[0][0] < t:
-                    someFound = True
-                    heapq.heappop(vd)
-            except IndexError:
-                pass
-            if not someFound: break
+    pass
 
 
 class ListeningClient(MumbleClient.AutoChannelJoinClient):
@@ -65,58 +53,90 @@ class ListeningClient(MumbleClient.AutoChannelJoinClient):
     users={}
     mimics={}
 
-    def UserStateReceived(self,message):
+    def __init__(self,settings=None):
+        super(ListeningClient,self).__init__(settings)
+        # Every mimic's delayed voice is played out by this
+        self.delayLine = MumbleDelayLine.DelayLine(reactor.callLater)
+        # If spooling to disk, speech still queued when the bot was stopped
+        # is picked up again for the users who are still there
+        self.spool = None
+        if self.settings._mimic_spoolFile is not None:
+            self.spool = MumbleRingFile.RingFile(self.settings._mimic_spoolFile)
+        # Mimics share this client's state and pings
+        self.pool = MumbleClientPool.ClientPool(self)
+        # Only moving channel (which includes joining the server) matters
+        self.watchUsers(self.userMoved,("channel_id",))
+
+    def userMoved(self,user,changes):
         if self.sessionID is not None:
-            self.checkSession(message.session)
+            self.checkSession(user.session)
 
     def checkSession(self,session):
-        user=self.state.users[session]
-        if not hasattr(user,"channel_id"): return
         #If the person isn't us or one of our bots,
         if session != self.sessionID and session not in self.mimics:
             #Then, if they're a tracked person
+            inChannel = session in self.state.usersIn(self.channelID)
             if session in self.users:
                 #Set disconnect True if they aren't in the right channel, and vice versa
-                self.users[session].settings._mimic_wantDisconnect=(user.channel_id != self.channelID)
+                mimic = self.users[session]
+                mimic.settings._mimic_wantDisconnect=not inChannel
+                #A mimic with nothing left to say goes now; otherwise when its speech has been relayed
+                if not inChannel and len(mimic.settings.voiceData)==0:
+                    self.disconnectMimic(session)
             #If they aren't tracked, and should be, add a mimic
-            elif user.channel_id == self.channelID:
+            elif inChannel:
                 self.addMimic(session)
 
 
     def disconnectMimic(self,session):
         mimic = self.users[session]
         del self.users[session]
-        mimic.disconnect()
+        self.delayLine.removeStream(mimic.settings.voiceData)
+        self.pool.retire(mimic)
 
-    def checkMimics(self):
-        mimicsToRemove=[]
-        for i,mimic in self.users.iteritems():
-            if mimic.settings._mimic_wantDisconnect:
-                if len(mimic.settings.voiceData)==0:
-                    mimicsToRemove.append(i)
-        for i in mimicsToRemove:
-            self.disconnectMimic(i)
+    def mimicDrained(self,session):
+        mimic = self.users.get(session)
+        if mimic is not None and mimic.settings._mimic_wantDisconnect:
+            self.disconnectMimic(session)
+
+    def relayVoice(self,session,data):
+        mimic = self.users.get(session)
+        #Voice due while the mimic is not connected is dropped
+        if mimic is not None and mimic.sessionID is not None:
+            mimic.sendVoiceMessage(data)
 
     def mimicDisconnected(self,result,mimicObject=None,userSession=None):
         mimic=mimicObject
-        #Remove this mimic from the list of mimics
-        self.mimics.pop(mimic.sessionID,None)
+        #Remove this mimic from the list of mimics.  Its sessionID has
+        #already been cleared, so look for it
+        connected = False
+        for mimicSession,curMimic in self.mimics.items():
+            if curMimic is mimic:
+                del self.mimics[mimicSession]
+                connected = True
         #Try to remove this mimic from the list of users
         try:
             curMimic = self.users[userSession]
             if curMimic == mimic: del self.users[userSession]
         except KeyError:
             pass
-        if not mimic.settings._mimic_wantDisconnect:
-            if mimic.sessionID is not None:
-                # We didn't ask it to quit, and it _had_ sucessfully connected, so let's try again
-                self.addMimic(userSession,mimic.settings)
+        if not mimic.settings._mimic_wantDisconnect and connected:
+            # We didn't ask it to quit, and it _had_ sucessfully connected, so let's try again
+            self.addMimic(userSession,mimic.settings)
+        else:
+            self.delayLine.removeStream(mimic.settings.voiceData)
         return result
 
     def addMimic(self,session,settings=None):
         if settings is None:
             s = MumbleClient.MumbleSettings()
-            s.voiceData = []
+            buffer = self.spool.buffer(session) if self.spool is not None else None
+            #Speech recovered from the spool waits for the mimic to connect
+            s.voiceData = self.delayLine.addStream(lambda data: self.relayVoice(session,data),
+                                                   self.settings._mimic_delayTime,
+                                                   lambda stream: self.mimicDrained(session),
+                                                   buffer,
+                                                   paused=buffer is not None and len(buffer) > 0)
         else:
             s = settings
         orig = self.settings
@@ -124,64 +144,45 @@ class ListeningClient(MumbleClient.AutoChannelJoinClient):
         s.port = orig.port
         s.password = orig.password
         s._autojoin_joinChannel = self.settings._mimic_mimicChannel
+        s.bulkSync = True
         s.nickname = self.getUnusedName(self.settings._mimic_mimicName.replace("{name}",self.state.users[session].name))
         s._mimic_wantDisconnect=False
         mimic = MimicClient(s)
         self.users[session] = mimic
         mimic.clientConnected.addCallback(self.mimicConnected,mimic)
         mimic.clientDisconnected.addBoth(self.mimicDisconnected,mimicObject=mimic,userSession=session)
-        mimic.connect()
+        self.pool.spawn(mimic)
 
     def getUnusedName(self,proposedName):
-        userNames = set()
-        for u in self.state.users:
-            user = self.state.users[u]
-            try:
-                name = user.name
-            except AttributeError:
-                name = None
-            userNames.add(name)
-        if proposedName not in userNames: return proposedName
-        i=0
-        while True:
-            tryName = proposedName + str(i)
-            if tryName not in userNames: return tryName
-            i+i+1
+        return self.state.findFreeName(proposedName)
 
     def mimicConnected(self,result,mimic):
         self.mimics[mimic.sessionID]=mimic
+        stream = mimic.settings.voiceData
+        if stream.paused:
+            #The recovered speech is due as it was before the restart; move
+            #it on so the last of it plays a full delay after now, as if the
+            #bot had stopped just after it arrived
+            buffer = stream.buffer
+            buffer.shift(time.time()+stream.delay-buffer.tailTime())
+            stream.resume()
         return result
 
     def ServerSyncReceived(self,message):
-        v = task.deferLater(reactor,0.1,self.sendVoiceData)
-        v.addErrback(self.errorCallback)
         for user in self.state.users:
             self.checkSession(user)
-
-    def VoiceMessageReceived(self,prefix,session,data,TCP=False):
-        if session in self.users:
-            mimic = self.users[session]
+        #Users who left while we were reconnecting are not in the state any more
+        for session in list(self.users):
+            if session not in self.state.users:
+                self.checkSession(session)
+        if self.spool is not None:
+            self.spool.discardUnclaimed()
+
+    def VoicePacketReceived(self,packet,TCP=False):
+        if packet.session in self.users:
+            mimic = self.users[packet.session]
             if not mimic.settings._mimic_wantDisconnect:
-                heapq.heappush(mimic.settings.voiceData,(time.time()+self.settings._mimic_delayTime,prefix+data))
-
-    def sendVoiceData(self):
-        self.checkMimics()
-        while True:
-            sent=False
-            t= time.time()
-            nt = t+self.settings._mimic_delayTime
-            for a,mimic in self.mimics.iteritems():
-                vd = mimic.settings.voiceData
-                if len(vd) > 0:
-                    if vd[0][0] <= t:
-                        b,data = heapq.heappop(vd)
-                        mimic.sendVoiceMessage(data)
-                        sent=True
-                    if len(vd) > 0:
-                        if vd[0][0] < nt: nt = vd[0][0]
-            if not sent: break
-        v = task.deferLater(reactor,nt-t,self.sendVoiceData)
-        v.addErrback(self.errorCallback)
+                mimic.settings.voiceData.push(packet.relayData())
 
     def connectionLost(self,reason):
         if reactor.running: reactor.stop()
@@ -200,6 +201,7 @@ def main():
     p.add_option("-d","--delay",help="Time to delay speech by in seconds (default %default)",action="store",type="float",default=90)
     p.add_option("-m","--mimic-name",help="Name for mimic-bots; {name} will be replaced by the player's name (default %default)",action="store",type="string",default="Mimic-{name}")
     p.add_option("--password",help="Password for server, if any",action="store",type="string")
+    p.add_option("--spool",help="File to queue delayed speech in, instead of memory; speech queued when the bot stops is relayed when it restarts",action="store",type="string")
 
     o, arguments = p.parse_args()
 
@@ -221,10 +223,13 @@ def main():
     s._mimic_mimicChannel = o.relay_to
     s._mimic_mimicName = o.mimic_name
     s._mimic_delayTime = o.delay
+    s._mimic_spoolFile = o.spool
     s.nickname = o.nick
     s.host = o.server
     s.port = o.port
     s.password = o.password
+    s.bulkSync = True
+    s.reconnect = MumbleClient.ReconnectPolicy()
     eve = ListeningClient(s)
     eve.connect()
     reactor.run()
@@ -0,0 +1,182 @@
+import asyncio
+import ssl
+
+from . import MumbleClientCore
+
+
+_defaultContexts={}
+
+def _defaultContext(host,port):
+    # Like the twisted client's default, this does not verify the server
+    # certificate.  The context is only built once per server; asyncio
+    # gives no way to resume TLS sessions, so each connection does a full
+    # handshake
+    context=_defaultContexts.get((host,port))
+    if context is None:
+        context=ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname=False
+        context.verify_mode=ssl.CERT_NONE
+        _defaultContexts[(host,port)]=context
+    return context
+
+
+class _ControlProtocol(asyncio.Protocol):
+
+    def __init__(self,client):
+        self.client=client
+
+    def connection_made(self,transport):
+        self.client._transport=transport
+        self.client._connectionMade()
+
+    def data_received(self,data):
+        self.client._dataReceived(data)
+
+    def connection_lost(self,exc):
+        self.client._transportLost(exc)
+
+
+class AsyncioMumbleClient(MumbleClientCore.MumbleClientCore):
+    """
+    A mumble client which uses asyncio as its event and network handler
+
+    This works like :class:`MumbleClient.MumbleClient`: subclass it and
+    implement FooReceived methods, :meth:`VoicePacketReceived` and so on,
+    and configure it with a :class:`MumbleClientCore.MumbleSettings`.  It
+    runs on any asyncio event loop, including uvloop's.
+
+    Where the twisted client has Deferreds, this one has futures:
+    :meth:`connect` returns a task which completes when the TCP connection
+    is made, .clientConnected (also returned by :meth:`sync`) completes at
+    the first ServerSync and .clientDisconnected (also returned by
+    :meth:`disconnect`) completes with the reason once the client has
+    disconnected for good.  All of them can be awaited::
+
+        client = MyClient(settings)
+        await client.connect()
+        await client.sync()
+        ...
+        await client.disconnect()
+
+    settings.SSLOptions, if set, must be an ssl.SSLContext.  By default,
+    the server certificate is not verified.  Outgoing messages are written
+    together once per event loop iteration, and pings are scheduled with
+    loop.call_later.
+
+    asyncio needs Python 3.  This module avoids the async and await
+    keywords, so that it still compiles (though cannot run) on Python 2.
+    """
+
+    def __init__(self,settings=None,loop=None):
+        """
+        :param settings: A :class:`MumbleClientCore.MumbleSettings`, or None for the defaults
+        :param loop: The event loop to run on; by default the current one
+        """
+        MumbleClientCore.MumbleClientCore.__init__(self,settings)
+        self.loop=loop if loop is not None else asyncio.get_event_loop()
+        self.clientConnected=self.loop.create_future()
+        self.clientDisconnected=self.loop.create_future()
+        self._transport=None
+        self._flushHandle=None
+
+    def connect(self):
+        """
+        Asks the client to connect to the server
+
+        :return: A task which completes when the TCP connection is made, or
+            raises if it fails.  This can also be accessed via the
+            controlConnected attribute.
+        """
+        self._wantDisconnect=False
+        self.controlConnected=asyncio.ensure_future(self._createConnection(),loop=self.loop)
+        return self.controlConnected
+
+    def sync(self):
+        """
+        Returns the clientConnected future, which completes when the first
+        ServerSync has been received and .sessionID is set
+        """
+        return self.clientConnected
+
+    def disconnect(self):
+        """
+        Ask the client to disconnect.  This also stops any automatic reconnection.
+
+        :return: The clientDisconnected future
+        """
+        MumbleClientCore.MumbleClientCore.disconnect(self)
+        return self.clientDisconnected
+
+    def waitFor(self,messageType,predicate=None,timeout=None,key=None):
+        """
+        Wait for a message
+
+        As :meth:`MumbleClient.MumbleClient.waitFor`, but returns a future,
+        which raises asyncio.TimeoutError on timeout.  Cancelling it stops
+        the wait.
+        """
+        future=self.loop.create_future()
+        def resolve(message):
+            if not future.done(): future.set_result(message)
+        def timedOut():
+            if not future.done(): future.set_exception(asyncio.TimeoutError())
+        waiter=self._addWaiter(messageType,predicate,timeout,key,resolve,timedOut)
+        future.add_done_callback(lambda future: self._removeWaiter(waiter))
+        return future
+
+    def _createConnection(self):
+        context=self.settings.SSLOptions
+        if context is None:
+            context=_defaultContext(self.settings.host,self.settings.port)
+        return self.loop.create_connection(lambda: _ControlProtocol(self),
+                                           self.settings.host,self.settings.port,ssl=context)
+
+    def _openConnection(self):
+        attempt=asyncio.ensure_future(self._createConnection(),loop=self.loop)
+        attempt.add_done_callback(self._reconnectDone)
+
+    def _reconnectDone(self,attempt):
+        if attempt.cancelled(): return
+        reason=attempt.exception()
+        if reason is not None: self._reconnectFailed(reason)
+
+    def _transportLost(self,exc):
+        self._cancelFlush()
+        self._transport=None
+        self.connection.dataToSend()
+        self._connectionLost(exc)
+
+    def _callLater(self,delay,f):
+        return self.loop.call_later(delay,f)
+
+    def _dataQueued(self):
+        if self._flushHandle is None:
+            self._flushHandle=self.loop.call_soon(self.flush)
+
+    def _cancelFlush(self):
+        if self._flushHandle is not None:
+            self._flushHandle.cancel()
+            self._flushHandle=None
+
+    def flush(self):
+        """
+        Write any queued messages immediately
+
+        Messages sent with :meth:`sendMessage` and :meth:`sendVoiceMessage`
+        are queued and written together once per event loop iteration.
+        """
+        self._cancelFlush()
+        outgoing=self.connection.dataToSend()
+        if outgoing and self._transport is not None:
+            self._transport.writelines(outgoing)
+
+    def _closeConnection(self):
+        if self._transport is not None:
+            self.flush()
+            self._transport.close()
+
+    def _fireConnected(self):
+        if not self.clientConnected.done(): self.clientConnected.set_result(True)
+
+    def _fireDisconnected(self,reason):
+        if not self.clientDisconnected.done(): self.clientDisconnected.set_result(reason)
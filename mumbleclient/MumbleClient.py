@@ -1,14 +1,12 @@
-import platform
-import time
-import collections
+from . import MumbleClientCore
+from . import MumbleControlProtocol
+from . import MumbleTLS
 
-from twisted.internet import reactor,defer, task
-from twisted.internet.protocol import Factory, Protocol
+from twisted.internet import reactor,defer
+from twisted.internet.protocol import Factory
 from twisted.internet.endpoints import SSL4ClientEndpoint
-from twisted.internet.ssl import CertificateOptions
 
-import MumbleControlProtocol
-import MumbleVoiceProtocol
+from .MumbleClientCore import MumbleSettings, ReconnectPolicy, User, _STATE_MESSAGES
 
 
 class _ControlFactory(Factory):
@@ -20,62 +18,14 @@ class _ControlFactory(Factory):
         return MumbleControlProtocol.MumbleControlProtocol(self.mumbleClient)
 
 
-class MumbleSettings(object):
-    """
-    Object to hold settings passed to a MumbleClient.
-
-    Settings used by the base client are:
-
-    .host defaults to "localhost".  At this time MumbleClient is ipv4 only
-    .port defaults to 64738
-    .nickname   defaults to "MumblePythonBot"
-    .password   defaults to "None"
-    .SSLOptions By default a new instance of twisted.internet.ssl.CertificateOptions
-
-    You can assign to a custom instance to provide a client certificate
-    and/or verify the server certificate. See the twisted documentation for details
-
-    You can pass in implementation-specific settings in this object.  They will be ignored by the base client.
-    """
-
-    def __init__(self):
-        """
-        Sets defaults for all required options.  These can be altered as required, and implementation-specific
-        settings added
-        """
-
-        self.host="localhost"
-        """
-        :annotation = "localhost":
-        defaults to "localhost".  At this time MumbleClient is ipv4 only
-        """
-
-        self.port=64738
-        self.nickname="MumblePythonBot"
-        self.SSLOptions=CertificateOptions()
-        self.password=None
-
-
-class User(object):
-    """Stores all information known about a user at this time"""
-    pass
-
-
-class _MumbleState(object):
-
-    def __init__(self):
-        self.numTCPPings=0
-        self.avgTCPPing=0
-        self.users=collections.defaultdict(User)
-
-class Foo(object):
-    pass
-
-class MumbleClient(object):
+class MumbleClient(MumbleClientCore.MumbleClientCore):
     """
     An object representing a mumble client which uses twisted as an event and network handler.
     This should be inherited and methods overridden or implemented to create specific clients.
 
+    This class only does the I/O; the protocol and state handling are in
+    :class:`MumbleClientCore.MumbleClientCore`, which it extends.
+
     Client life-cycle:
 
         - Client will connect to TCP control protocol on the specified host and port.
@@ -86,25 +36,35 @@ class MumbleClient(object):
           To alter the contents of these messages (assuming no setting exists), it
           is probably easiest to override the function, call the parent to get the
           "base" message, and alter what you wish
-        - The server should then send channel and user information
+        - The server should then send channel and user information.  If
+          settings.bulkSync is set, this is only applied to .state, and
+          :meth:`initialStateReady` is called once it is complete
         - The server will then send a ServerSync message. This triggers the
           .clientConnected callback, and the :meth:`ServerSyncReceived`
           method is called.  At this time the .sessionID variable is set
-        - Every 5 seconds, the :meth:`pingMessage`: method is called, and
+        - Every settings.pingInterval (by default 5) seconds, the :meth:`pingMessage`: method is called, and
           the message returned sent to the server
         - When the client disconnects, the .clientDisconnected Deferred is
           triggered (probably via errback and not callback) and the
           :meth:`connectionLost` method called.
+        - Unless settings.reconnect is set, in which case a connection that
+          drops unexpectedly is retried instead.  The client keeps its state
+          and reconciles it with the server's at the next ServerSync, when
+          users and channels that went in the meantime are passed to
+          :meth:`initialStateReady` and :meth:`connectionRecovered` is
+          called.  .clientDisconnected is only triggered if the client gives
+          up or :meth:`disconnect` is called.
 
     In general, the client is informed of activity via method calls. Outside the object, the program is
     informed of (some) activity via the 3 Deferred objects, with more details functionality being the
     responsiblility of the implementer
 
     In general, if a message Foo is received by the client, the method FooReceived(self,message) will be called.
+    Other callables can be added with :meth:`registerHandler`.
     See MumbleControlProtocol for a list of MessageTypes.  Some are implemented in this class and can be
     overridden; some are not needed for base functionality but will be called if defined.  The exception is
     the UDPTunnel message, which is one of two possible ways voice data can be received.  In these cases
-    the :meth:`VoiceMessageRecieved` function is called whether the voice source was UDP or TCP.
+    the :meth:`VoicePacketReceived` method is called whether the voice source was UDP or TCP.
 
     To tell if a message affects you, compare the message's session (target) or, optionally, actor (source)
     to self.sessionID.  Note that you cannot react to events (cannot send arbitrary messages) until
@@ -115,13 +75,11 @@ class MumbleClient(object):
     """
 
     def __init__(self,settings=None):
-
-        self.sessionID=None
-        if settings is None: settings = MumbleSettings()
-        self.settings=settings
-        self.state=_MumbleState()
+        MumbleClientCore.MumbleClientCore.__init__(self,settings)
         self.clientConnected = defer.Deferred()
         self.clientDisconnected = defer.Deferred()
+        self.tlsHandshakeTime=None
+        self.tlsSessionReused=None
 
     def connect(self):
         """
@@ -132,251 +90,95 @@ class MumbleClient(object):
         Note that this only indicates a TCP connection, which might, if the
         client supplies incorrect authentication details, be immediately closed.
 
+        Once the TLS handshake completes, .tlsHandshakeTime holds how long it
+        took in seconds and .tlsSessionReused whether a previous TLS session
+        was resumed (when the Twisted and pyOpenSSL in use allow it).
+
         The clientConnected attribute is a Deferred which will return when
         the login phase is complete.
 
         :return: A Deferred
         """
 
-        self.point=SSL4ClientEndpoint(reactor, self.settings.host, self.settings.port,self.settings.SSLOptions)
+        self._wantDisconnect=False
+        options = self.settings.SSLOptions
+        if options is None:
+            options = MumbleTLS.sharedOptions(self.settings.host,self.settings.port,self.settings.tlsSessionCache)
+        self.point=SSL4ClientEndpoint(reactor, self.settings.host, self.settings.port,options)
         self.controlConnected = self.point.connect(_ControlFactory(self))
         return self.controlConnected
 
-    def _controlMessageReceived(self,type,name,messageObject):
-        try:
-            f = getattr(self,"_"+name+"Received")
-        except AttributeError:
-            f=None
-        if callable(f): f(messageObject)
-        try:
-            f = getattr(self,name+"Received")
-        except AttributeError:
-            f = None
-        if callable(f): f(messageObject)
-
-    def _PingReceived(self,message):
-        now = int(time.time()*1000000)
-        timestamp = message.timestamp
-        if timestamp == self.state.lastTCPTimeStamp:
-            self.state.avgTCPPing = (now - timestamp) / 1000.0
-
-    def _ServerSyncReceived(self,message):
-        self.sessionID=message.session
-        self.clientConnected.callback(True)
-
-    def _UserStateReceived(self,message):
-        user = self.state.users[message.session]
-        for i in message.ListFields():
-            name = i[0].name
-            value = i[1]
-            if name != "actor": setattr(user,name,value)
-
-    def _UserRemoveReceived(self,message):
-        self.state.users.pop(message.session,None)
-
-    def _TCPVoiceMessageReceived(self,data):
-        prefix,session,data = MumbleVoiceProtocol.decodeAudioMessage(data)
-        self.VoiceMessageReceived(prefix,session,data,TCP=True)
-
-    def _unknownMessageReceived(self,type,data):
-        pass
-
-    def _connectionMade(self):
-        self.state.initialTime=time.time()
-        self.sendMessage(self.versionMessage())
-        self.sendMessage(self.authenticationMessage())
-        self.sendMessage(self.codecVersionMessage())
-        self.state.pingTask = task.LoopingCall(self._pingTask)
-        self.state.pingTaskDeferred = self.state.pingTask.start(5.0,now=False)
-        self.state.pingTaskDeferred.addErrback(self.errorCallback)
-
-    def _connectionLost(self,reason):
-        self.clientDisconnected.callback(reason)
-        self.connectionLost(reason)
-
-    def _pingTask(self):
-        self.sendMessage(self.pingMessage())
-
-    def ServerSyncReceived(self,message):
-        """
-        Called upon receipt of a ServerSync message
-
-        By the time this is called, sessionID will be set to the client's
-        session and the clientConnected callback will have completed.
-
-        :param message: A ServerSync message object
-        """
-
-    def sendVoiceMessage(self,data):
-        """
-        Send a voice message via the active voice channel
-
-        :param str data: A stream of bytes
-
-        This will send data either via the TCP control channel or the UDP
-        voice channel if the latter is active.  Data should be a stream of
-        bytes in mumble's voice format.
-        """
-
-        self.controlProtocol.sendVoiceMessage(data)
-
-    def connectionLost(self,reason):
-        """
-        Called when a connection is lost to the control protocol
-
-        This is called after the clientDisconnected callback is returned.
-        Implementors can override this method or listen for the callback,
-        depending on use-case
-        """
-        pass
-
-    def VoiceMessageReceived(self,prefix,session,data,TCP=False):
-        """
-        Called when voice data is received
-
-        :param str prefix:  The one-byte message header indicating codec type and if this
-            was a standard or direct transmission
-        :param int session: The session ID of the source of the transmission
-        :param str data:    The voice data, consisting of a series of voice frames and
-            optionally positional audio at the end
-
-        If you simply wish to output the voice data again, you can call
-        sendVoiceMessage and pass in prefix + data as the data.
-
-        Implementors should override this method to process voice data.
-        """
-        pass
-
-    def sendMessage(self,message):
-        """
-        Send a control message
-
-        If you call this method with :obj:`None`, it will ignore the call. This
-        behavior is so implementers can cancel the sending of an automatic
-        message (like Ping) by overriding :meth:`pingMessage` and returning
-        None
-
-        :param message: Any kind of TCP control message, or :obj:`None`
-
-        """
-        if message is not None: self.controlProtocol.sendMessage(message)
-
-    def versionMessage(self):
-        """
-        Called by the client to ask what message to send when it should send
-        a Version message on initial connect.
-
-        To change the message it's probably easiest to call the superclass
-        method and alter the appropriate fields.
-
-        :return: a Version object
-        """
-
-        message = MumbleControlProtocol.Version()
-        message.release="1.2.5"
-        message.version=66053
-        message.os=platform.system()
-        message.os_version="evebot1.0.2"
-        return message
+    def _openConnection(self):
+        d = self.point.connect(_ControlFactory(self))
+        d.addErrback(self._reconnectFailed)
 
-    def authenticationMessage(self):
-        """
-        Called by the client to ask what message to send when it should send
-        an Authenticate message on initial connect.
+    def _callLater(self,delay,f):
+        return reactor.callLater(delay,f)
 
-        To change the message it's probably easiest to call the superclass
-        method and alter the appropriate fields.
+    def _dataQueued(self):
+        self.controlProtocol.scheduleFlush()
 
-        :return: an Authenticate object
+    def flush(self):
         """
+        Write any queued messages immediately
 
-        message = MumbleControlProtocol.Authenticate()
-        message.username=self.settings.nickname
-        if self.settings.password is not None: message.password=self.settings.password
-        message.celt_versions.append(-2147483637)
-        message.celt_versions.append(-2147483632)
-        message.opus=True
-        return message
-
-    def codecVersionMessage(self):
+        Messages sent with :meth:`sendMessage` and :meth:`sendVoiceMessage`
+        are queued and written together once per reactor iteration.  Call
+        this if something latency-sensitive must go out before control
+        returns to the reactor.
         """
-        Called by the client to ask what message to send when it should send
-        a CodecVersion message on initial connect.
+        self.controlProtocol.flush()
 
-        To change the message it's probably easiest to call the superclass
-        method and alter the appropriate fields.
+    def _closeConnection(self):
+        self.controlProtocol.disconnect()
 
-        :return: a CodecVersion object
+    def waitFor(self,messageType,predicate=None,timeout=None,key=None):
         """
+        Wait for a message
 
-        message = MumbleControlProtocol.CodecVersion()
-        message.alpha=-2147483637
-        message.beta=0
-        message.prefer_alpha=True
-        return message
+        For example, after creating a channel, wait for the server to
+        confirm it with::
 
-    def pingMessage(self):
-        """
-        Called by the client to ask what message to send when it should send
-        a Ping message every five seconds.
+            d = client.waitFor(MumbleControlProtocol.ChannelState,
+                               lambda message: message.name == "New channel",timeout=10)
 
-        To change the message it's probably easiest to call the superclass
-        method and alter the appropriate fields.
+        Waiting does not need a FooReceived method, and costs nothing for
+        messages of other types.  Waiters for UserState, UserRemove and
+        UserStats can be given the session, and for ChannelState,
+        ChannelRemove and PermissionQuery the channel_id, they wait for as
+        key; messages about other sessions or channels do not even check them.
 
-        :return: a Ping object
+        :param messageType: A message class, such as MumbleControlProtocol.UserStats
+        :param predicate: If given, a callable taking the message; only
+            messages for which it returns True are waited for
+        :param float timeout: If given, give up after this many seconds
+        :param key: If given, the session or channel_id of the message
+        :return: A Deferred which fires with the message, after any
+            handlers for it have been called, or errbacks with
+            defer.TimeoutError.  Cancelling it stops the wait.
         """
+        d = defer.Deferred(lambda d: self._removeWaiter(waiter))
+        timedOut = lambda: d.errback(defer.TimeoutError("No %s received within %s seconds" % (messageType.__name__,timeout)))
+        waiter = self._addWaiter(messageType,predicate,timeout,key,d.callback,timedOut)
+        return d
 
-        message = MumbleControlProtocol.Ping()
-        timestamp = int(time.time()*1000000)
-        message.timestamp=timestamp
-        message.good=0
-        message.late=0
-        message.lost=0
-        message.resync=0
-        message.udp_packets=0
-        message.tcp_packets=self.state.numTCPPings
-        message.udp_ping_avg=0
-        message.udp_ping_var=0.0
-        message.tcp_ping_avg=self.state.avgTCPPing
-        message.tcp_ping_var=0
-
-        self.state.numTCPPings+=1
-        self.state.lastTCPTimeStamp=timestamp
-        return message
-
-    def disconnect(self):
-        """
-        Ask the client to disconnect the control channel
-
-        When sucessful, the .clientDisconnected Deferred is triggered (probably via errback and not callback) 
-
-        """
-        self.controlProtocol.disconnect()
+    def _fireConnected(self):
+        self.clientConnected.callback(True)
 
-    def errorCallback(self,result):
-        print result
-        return result
+    def _fireDisconnected(self,reason):
+        self.clientDisconnected.callback(reason)
 
 
 class AutoChannelJoinClient(MumbleClient):
 
-    def ChannelStateReceived(self,message):
-        if message.name==self.settings._autojoin_joinChannel:
-            self.channelID = message.channel_id
-
     def _ServerSyncReceived(self,message):
+        # settings._autojoin_joinChannel can be a channel name or a path
+        channel = self.state.findChannel(self.settings._autojoin_joinChannel)
+        self.channelID = None if channel is None else channel.channel_id
         super(AutoChannelJoinClient,self)._ServerSyncReceived(message)
         #MumbleClient._ServerSyncReceived(self,message)
+        if self.channelID is None: return
         newMessage = MumbleControlProtocol.UserState()
         newMessage.session = self.sessionID
         newMessage.channel_id=self.channelID
         self.sendMessage(newMessage)
-
-
-if __name__ == '__main__':
-    c = MumbleClient()
-#    c.connect()
-    def stop(reason):
-        reactor.stop()
-    c.clientDisconnected.addBoth(stop)
-    reactor.run()
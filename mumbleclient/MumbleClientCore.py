@@ -0,0 +1,851 @@
+import os
+import platform
+import random
+import time
+import collections
+
+from . import MumbleConnection
+from . import MumbleJitterBuffer
+from . import MumbleVoiceProtocol
+from . import MumbleState
+
+
+class MumbleSettings(object):
+    """
+    Object to hold settings passed to a MumbleClient.
+
+    Settings used by the base client are:
+
+    .host defaults to "localhost".  At this time MumbleClient is ipv4 only
+    .port defaults to 64738
+    .nickname   defaults to "MumblePythonBot"
+    .password   defaults to "None"
+    .SSLOptions defaults to None, meaning that all clients connecting to the same
+                host and port share one :class:`MumbleTLS.ResumingCertificateOptions`,
+                and so one SSL context, and resume each other's TLS sessions.
+
+    You can assign to a custom instance of twisted.internet.ssl.CertificateOptions
+    (or, to keep session resumption, MumbleTLS.ResumingCertificateOptions) to provide
+    a client certificate and/or verify the server certificate. See the twisted
+    documentation for details
+
+    .tlsSessionCache    defaults to None.  If set to a filename, the shared TLS session
+                for this host is kept there, so it can be resumed after a restart
+
+    .bulkSync   defaults to False.  If True, the channels and users sent before
+                ServerSync are only applied to the client state; no handlers or
+                watchers are called for them.  See :meth:`MumbleClient.initialStateReady`
+    .pingInterval   defaults to 5.0 seconds.  If None, the client does not send pings
+                itself; something else (such as a :class:`MumbleClientPool.ClientPool`)
+                must call :meth:`MumbleClient.sendPing`
+    .reconnect  defaults to None.  Set to a :class:`ReconnectPolicy` to have the client
+                reconnect automatically if the connection drops
+    .stateSnapshot  defaults to None.  If set to a filename, the client state is
+                loaded from it when the client is created, so it can be queried
+                before the server has sent its own, and saved to it at ServerSync
+                and when the connection is lost.
+    .jitterBuffer   defaults to None.  Set to a :class:`MumbleJitterBuffer.JitterPolicy`
+                to have received voice put in order and played out at a steady rate,
+                per speaker, before it is passed to :meth:`MumbleClient.VoicePacketReceived`.
+                The good, late and lost counts sent in pings then come from the buffers
+
+    You can pass in implementation-specific settings in this object.  They will be ignored by the base client.
+    """
+
+    def __init__(self):
+        """
+        Sets defaults for all required options.  These can be altered as required, and implementation-specific
+        settings added
+        """
+
+        self.host="localhost"
+        """
+        :annotation = "localhost":
+        defaults to "localhost".  At this time MumbleClient is ipv4 only
+        """
+
+        self.port=64738
+        self.nickname="MumblePythonBot"
+        self.SSLOptions=None
+        self.tlsSessionCache=None
+        self.password=None
+        self.bulkSync=False
+        self.pingInterval=5.0
+        self.reconnect=None
+        self.stateSnapshot=None
+        self.jitterBuffer=None
+
+
+_STATE_MESSAGES=frozenset(("UserState","UserRemove","ChannelState","ChannelRemove"))
+
+
+class ReconnectPolicy(object):
+    """
+    Controls how a MumbleClient reconnects after losing its connection
+
+    The n-th consecutive attempt (counting from 0) is made after
+    initialDelay * factor**n seconds, capped at maxDelay, then randomly
+    varied by up to +/- jitter (a fraction) so that many clients dropped at
+    once do not all reconnect at the same moment.  After maxAttempts
+    failed attempts (never, if None) the client gives up.
+    """
+
+    def __init__(self,initialDelay=1.0,maxDelay=60.0,factor=2.0,jitter=0.2,maxAttempts=None):
+        self.initialDelay=initialDelay
+        self.maxDelay=maxDelay
+        self.factor=factor
+        self.jitter=jitter
+        self.maxAttempts=maxAttempts
+
+    def delay(self,attempt):
+        """Returns how long to wait, in seconds, before the given attempt"""
+        delay=min(self.maxDelay,self.initialDelay*(self.factor**attempt))
+        return delay*random.uniform(1-self.jitter,1+self.jitter)
+
+    def shouldRetry(self,attempt):
+        return self.maxAttempts is None or attempt < self.maxAttempts
+
+
+User=MumbleState.User
+
+# Waiters for these messages can be indexed by the session or channel they
+# are about, so that a message only checks the waiters interested in it
+_WAITER_KEYS={
+    "UserState":"session",
+    "UserRemove":"session",
+    "UserStats":"session",
+    "ChannelState":"channel_id",
+    "ChannelRemove":"channel_id",
+    "PermissionQuery":"channel_id",
+}
+
+
+class _Waiter(object):
+    __slots__=("type","key","predicate","resolve","timer","active")
+
+    def __init__(self,type,key,predicate,resolve):
+        self.type=type
+        self.key=key
+        self.predicate=predicate
+        self.resolve=resolve
+        self.timer=None
+        self.active=True
+
+
+class _WaiterIndex(object):
+    """The waiters for one message type"""
+
+    def __init__(self,field):
+        self.field=field
+        self.unkeyed=[]
+        self.byKey={}
+        self.count=0
+
+    def add(self,waiter):
+        if waiter.key is None:
+            self.unkeyed.append(waiter)
+        else:
+            self.byKey.setdefault(waiter.key,[]).append(waiter)
+        self.count+=1
+
+    def remove(self,waiter):
+        waiter.active=False
+        self.count-=1
+        if waiter.key is not None:
+            bucket=self.byKey[waiter.key]
+            bucket.remove(waiter)
+            if not bucket: del self.byKey[waiter.key]
+        # Unkeyed waiters are dropped from the list at the next match
+
+    def match(self,message):
+        """Removes and returns the waiters satisfied by message"""
+        matched=[]
+        if self.byKey and message.HasField(self.field):
+            key=getattr(message,self.field)
+            bucket=self.byKey.get(key)
+            if bucket is not None:
+                remaining=self._match(bucket,message,matched)
+                if remaining: self.byKey[key]=remaining
+                else: del self.byKey[key]
+        if self.unkeyed:
+            self.unkeyed=self._match(self.unkeyed,message,matched)
+        for waiter in matched: waiter.active=False
+        self.count-=len(matched)
+        return matched
+
+    @staticmethod
+    def _match(bucket,message,matched):
+        remaining=[]
+        for waiter in bucket:
+            if not waiter.active: continue
+            if waiter.predicate is None or waiter.predicate(message):
+                matched.append(waiter)
+            else:
+                remaining.append(waiter)
+        return remaining
+
+class MumbleClientCore(object):
+    """
+    Everything a mumble client does that does not depend on how it does I/O
+
+    This is the base of :class:`MumbleClient.MumbleClient`, which uses
+    twisted, and may be used for other event loops.  The core handles the
+    messages, the state and the client life-cycle described below, and
+    keeps its bytes in a :class:`MumbleConnection.MumbleConnection`, in
+    .connection.  A subclass (an adapter) provides the I/O:
+
+        - it calls :meth:`_connectionMade` when a connection to the server is
+          established, :meth:`_dataReceived` with the bytes received from it
+          and :meth:`_connectionLost` when it closes
+        - it implements :meth:`_dataQueued` to arrange for
+          .connection.dataToSend() to be written soon, and :meth:`flush` to
+          write it immediately
+        - it implements :meth:`_callLater` for the core's timers (pings and
+          reconnection), :meth:`_openConnection` to reconnect and
+          :meth:`_closeConnection` to disconnect
+        - it implements :meth:`_fireConnected` and :meth:`_fireDisconnected`
+          to report the end of the login phase and the final disconnection
+          to code outside the client
+
+    See :class:`MumbleClient.MumbleClient` for the client life-cycle and how
+    to write clients; everything there except the Deferreds and the twisted
+    specific settings is implemented here.
+    """
+
+    def __init__(self,settings=None):
+
+        self.sessionID=None
+        if settings is None: settings = MumbleSettings()
+        self.settings=settings
+        self.state=MumbleState.MumbleState()
+        if settings.stateSnapshot is not None and os.path.exists(settings.stateSnapshot):
+            try:
+                self.state.load(settings.stateSnapshot)
+            except (IOError,ValueError):
+                # An unreadable snapshot just means starting from scratch
+                self.state=MumbleState.MumbleState()
+        self.connection=None
+        self.jitterBuffers=None
+        self.voiceStats=MumbleJitterBuffer.VoiceStats()
+        self.sharesState=False
+        self.numTCPPings=0
+        self.avgTCPPing=0
+        self.lastTCPTimeStamp=None
+        self.reconnectAttempts=0
+        self.lastRecoveryTime=None
+        self._wantDisconnect=False
+        self._lostTime=None
+        self._lostReason=None
+        self._reconnectCall=None
+        self._pingCall=None
+        self._extraHandlers=collections.defaultdict(list)
+        self._userWatchers=MumbleState.ChangeWatchers()
+        self._channelWatchers=MumbleState.ChangeWatchers()
+        self._waiters=[None]*len(MumbleConnection._MESSAGE_TYPES)
+        self.refreshHandlers()
+
+    def _reconnect(self):
+        self._reconnectCall=None
+        self.reconnectAttempts+=1
+        self._openConnection()
+
+    def _reconnectFailed(self,reason):
+        """Called by the adapter if a connection started by :meth:`_openConnection` fails"""
+        self._scheduleReconnect(reason)
+
+    def _scheduleReconnect(self,reason):
+        policy = self.settings.reconnect
+        if self._wantDisconnect or policy is None or not policy.shouldRetry(self.reconnectAttempts):
+            self._disconnected(reason)
+            return
+        self._lostReason=reason
+        self._reconnectCall=self._callLater(policy.delay(self.reconnectAttempts),self._reconnect)
+
+    def _controlMessageReceived(self,type,name,messageObject):
+        for f in self._activeHandlers[type]: f(messageObject)
+
+    def shareState(self,state):
+        """
+        Use a state object maintained by another client
+
+        The client will no longer apply channel and user messages to its
+        state, or parse them at all unless it has FooReceived methods for
+        them.  Used by :class:`MumbleClientPool.ClientPool`; call before
+        connecting.
+
+        :param state: The other client's :class:`MumbleState.MumbleState`
+        """
+        self.state=state
+        self.sharesState=True
+        self.refreshHandlers()
+
+    def _resolveHandlers(self,type):
+        name = MumbleConnection.getMessageName(type)
+        handlers = []
+        attributes = ("_"+name+"Received",name+"Received")
+        if self.sharesState and name in _STATE_MESSAGES:
+            # Another client keeps the shared state up to date
+            attributes = attributes[1:]
+        for attribute in attributes:
+            f = getattr(self,attribute,None)
+            if callable(f): handlers.append(f)
+        if name == "UserRemove" and self.settings.jitterBuffer is not None:
+            # Whoever keeps the state, a speaker who has left needs no buffer
+            handlers.append(self._dropJitterBuffer)
+        handlers.extend(self._extraHandlers[type])
+        return tuple(handlers)
+
+    def refreshHandlers(self):
+        """
+        Rebuild the table of methods called for each message type
+
+        The _FooReceived and FooReceived methods for every message type are
+        looked up once, when the client is created.  If you add or replace
+        such methods on an instance afterwards, call this method so that
+        they are used.
+        """
+        self._handlers = [self._resolveHandlers(i) for i in range(len(MumbleConnection._MESSAGE_TYPES))]
+        # Before ServerSync, with bulkSync set, the state messages are only
+        # applied to the state
+        self._syncHandlers = list(self._handlers)
+        for messageType,f in ((MumbleConnection.UserState,self._syncUserState),
+                              (MumbleConnection.UserRemove,self._syncUserRemove),
+                              (MumbleConnection.ChannelState,self._syncChannelState),
+                              (MumbleConnection.ChannelRemove,self._syncChannelRemove)):
+            self._syncHandlers[MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType]] = () if self.sharesState else (f,)
+        if self.sessionID is None and self.settings.bulkSync:
+            self._activeHandlers = self._syncHandlers
+        else:
+            self._activeHandlers = self._handlers
+
+    def registerHandler(self,messageType,handler):
+        """
+        Call handler(message) whenever a message of the given type is received
+
+        Registered handlers are called after the FooReceived methods, in the
+        order they were registered.
+
+        :param messageType: A message class, such as MumbleConnection.UserState
+        :param handler: A callable taking the message object
+        """
+        type = MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType]
+        self._extraHandlers[type].append(handler)
+        self._updateHandlers(type)
+
+    def unregisterHandler(self,messageType,handler):
+        """
+        Stop calling a handler added with :meth:`registerHandler`
+
+        :raises ValueError: if the handler was not registered for that type
+        """
+        type = MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType]
+        self._extraHandlers[type].remove(handler)
+        self._updateHandlers(type)
+
+    def _updateHandlers(self,type):
+        handlers = self._resolveHandlers(type)
+        if self._syncHandlers[type] is self._handlers[type]:
+            self._syncHandlers[type] = handlers
+        self._handlers[type] = handlers
+
+    def _syncUserState(self,message):
+        self.state.updateUser(message)
+
+    def _syncUserRemove(self,message):
+        self.state.removeUser(message.session)
+
+    def _syncChannelState(self,message):
+        self.state.updateChannel(message)
+
+    def _syncChannelRemove(self,message):
+        self.state.removeChannel(message.channel_id)
+
+    def _CodecVersionReceived(self,message):
+        self.state.codecVersion=(message.alpha,message.beta,message.prefer_alpha,message.opus)
+
+    def _PingReceived(self,message):
+        now = int(time.time()*1000000)
+        timestamp = message.timestamp
+        if timestamp == self.lastTCPTimeStamp:
+            self.avgTCPPing = (now - timestamp) / 1000.0
+
+    def _ServerSyncReceived(self,message):
+        self.sessionID=message.session
+        bulk = self._activeHandlers is self._syncHandlers
+        self._activeHandlers=self._handlers
+        users,channels = ([],[]) if self.sharesState else self.state.endResync()
+        if not bulk:
+            for user in users: self._userWatchers.notify(user,{"session":(user.session,None)})
+            for channel in channels: self._channelWatchers.notify(channel,{"channel_id":(channel.channel_id,None)})
+        self.saveStateSnapshot()
+        self.initialStateReady(users,channels)
+        if self._lostTime is None:
+            self._fireConnected()
+        else:
+            self.lastRecoveryTime = time.time()-self._lostTime
+            self._lostTime=None
+            self.reconnectAttempts=0
+            self.connectionRecovered(self.lastRecoveryTime)
+
+    def _UserStateReceived(self,message):
+        user,changes = self.state.updateUser(message)
+        self._userWatchers.notify(user,changes)
+
+    def _UserRemoveReceived(self,message):
+        user = self.state.removeUser(message.session)
+        if user is not None: self._userWatchers.notify(user,{"session":(user.session,None)})
+
+    def _dropJitterBuffer(self,message):
+        if self.jitterBuffers is not None: self.jitterBuffers.remove(message.session)
+
+    def _ChannelStateReceived(self,message):
+        channel,changes = self.state.updateChannel(message)
+        self._channelWatchers.notify(channel,changes)
+
+    def _ChannelRemoveReceived(self,message):
+        channel = self.state.removeChannel(message.channel_id)
+        if channel is not None: self._channelWatchers.notify(channel,{"channel_id":(channel.channel_id,None)})
+
+    def _addWaiter(self,messageType,predicate,timeout,key,resolve,timedOut):
+        """
+        Call resolve(message) for the next message of messageType that
+        matches, or timedOut() if none has after timeout seconds.  Used by
+        the adapters' waitFor methods
+
+        :return: The waiter, which can be passed to :meth:`_removeWaiter`
+        """
+        type = MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType]
+        name = MumbleConnection.getMessageName(type)
+        if key is not None and name not in _WAITER_KEYS:
+            raise ValueError("%s messages have no session or channel to wait for" % name)
+        index = self._waiters[type]
+        if index is None:
+            index = self._waiters[type] = _WaiterIndex(_WAITER_KEYS.get(name))
+        waiter = _Waiter(type,key,predicate,resolve)
+        index.add(waiter)
+        if timeout is not None:
+            waiter.timer = self._callLater(timeout,lambda: self._waiterTimedOut(waiter,timedOut))
+        return waiter
+
+    def _removeWaiter(self,waiter):
+        if not waiter.active: return
+        if waiter.timer is not None: waiter.timer.cancel()
+        index = self._waiters[waiter.type]
+        index.remove(waiter)
+        if not index.count: self._waiters[waiter.type]=None
+
+    def _waiterTimedOut(self,waiter,timedOut):
+        waiter.timer=None
+        self._removeWaiter(waiter)
+        timedOut()
+
+    def _resolveWaiters(self,type,message):
+        index = self._waiters[type]
+        matched = index.match(message)
+        if not index.count and self._waiters[type] is index: self._waiters[type]=None
+        for waiter in matched:
+            if waiter.timer is not None: waiter.timer.cancel()
+            waiter.resolve(message)
+
+    def watchUsers(self,callback,fields=None):
+        """
+        Call callback(user,changes) when users change
+
+        changes is a dictionary of field name to (old value, new value) for
+        only the fields that changed, so for example a user moving channel
+        gives {"channel_id":(old,new)}.  Users joining or leaving are
+        reported as a change to "session" from or to None; joining is also
+        reported as a change to "channel_id" from None.
+
+        :param callback: A callable taking a :class:`MumbleState.User` and the changes
+        :param fields: If given, an iterable of field names; callback is only
+            called when one of them changes
+        """
+        self._userWatchers.add(callback,fields)
+
+    def unwatchUsers(self,callback):
+        """Stop calling a callback added with :meth:`watchUsers`"""
+        self._userWatchers.remove(callback)
+
+    def watchChannels(self,callback,fields=None):
+        """
+        Call callback(channel,changes) when channels change
+
+        As :meth:`watchUsers`, but for channels.  Channels being created or
+        removed are reported as a change to "channel_id" from or to None.
+        """
+        self._channelWatchers.add(callback,fields)
+
+    def unwatchChannels(self,callback):
+        """Stop calling a callback added with :meth:`watchChannels`"""
+        self._channelWatchers.remove(callback)
+
+    def _unknownMessageReceived(self,type,data):
+        pass
+
+    def _dataReceived(self,data):
+        """Called by the adapter with the bytes received from the server"""
+        for event in self.connection.receiveData(data):
+            kind = type(event)
+            if kind is MumbleConnection.ControlMessage:
+                # Messages nothing handles are dropped without being parsed
+                if self._activeHandlers[event.type]:
+                    self._controlMessageReceived(event.type,event.name,event.message)
+                if self._waiters[event.type] is not None:
+                    self._resolveWaiters(event.type,event.message)
+            elif kind is MumbleVoiceProtocol.VoicePacket:
+                if self.jitterBuffers is not None and event.codec != MumbleVoiceProtocol.PING:
+                    self.jitterBuffers.add(event)
+                else:
+                    self.VoicePacketReceived(event,TCP=True)
+            else:
+                self._unknownMessageReceived(event.type,event.data)
+
+    def _connectionMade(self):
+        """Called by the adapter when a connection to the server is established"""
+        self.connection=MumbleConnection.MumbleConnection()
+        self.voiceStats=MumbleJitterBuffer.VoiceStats()
+        if self.settings.jitterBuffer is not None:
+            self.jitterBuffers=MumbleJitterBuffer.JitterBuffers(self._jitterBufferRelease,self._callLater,
+                                                                policy=self.settings.jitterBuffer,
+                                                                stats=self.voiceStats)
+        if self._wantDisconnect:
+            # disconnect() was called while a reconnection attempt was under way
+            self._closeConnection()
+            return
+        if self.settings.bulkSync: self._activeHandlers=self._syncHandlers
+        # Anything already known (from a snapshot) is reconciled with what
+        # the server sends before ServerSync
+        if not self.sharesState and (self.state.users or self.state.channels): self.state.beginResync()
+        self.initialTime=time.time()
+        self.sendMessage(self.versionMessage())
+        self.sendMessage(self.authenticationMessage())
+        self.sendMessage(self.codecVersionMessage())
+        self._startPinging()
+
+    def _connectionLost(self,reason):
+        """Called by the adapter when the connection to the server has closed"""
+        self._stopPinging()
+        if self.jitterBuffers is not None:
+            self.jitterBuffers.clear()
+            self.jitterBuffers=None
+        self.saveStateSnapshot()
+        # Only a connection that got as far as ServerSync is worth retrying
+        if self.sessionID is not None and self._lostTime is None:
+            self._lostTime=time.time()
+        self.sessionID=None
+        if self._lostTime is None:
+            self._disconnected(reason)
+        else:
+            self._scheduleReconnect(reason)
+
+    def _disconnected(self,reason):
+        self._lostTime=None
+        self._fireDisconnected(reason)
+        self.connectionLost(reason)
+
+    def _startPinging(self):
+        if self.settings.pingInterval is not None:
+            self._pingCall=self._callLater(self.settings.pingInterval,self._pingTick)
+
+    def _pingTick(self):
+        self._pingCall=self._callLater(self.settings.pingInterval,self._pingTick)
+        self.sendPing()
+
+    def _stopPinging(self):
+        if self._pingCall is not None:
+            self._pingCall.cancel()
+            self._pingCall=None
+
+    def _callLater(self,delay,f):
+        """
+        Implemented by the adapter: call f() after delay seconds
+
+        :return: An object with a cancel() method
+        """
+        raise NotImplementedError()
+
+    def _dataQueued(self):
+        """
+        Implemented by the adapter: write .connection.dataToSend() soon
+        """
+        raise NotImplementedError()
+
+    def _openConnection(self):
+        """
+        Implemented by the adapter: connect to the server again, calling
+        :meth:`_reconnectFailed` if that fails
+        """
+        raise NotImplementedError()
+
+    def _closeConnection(self):
+        """
+        Implemented by the adapter: write anything queued and close the connection
+        """
+        raise NotImplementedError()
+
+    def _fireConnected(self):
+        """
+        Implemented by the adapter: report that the first ServerSync has been received
+        """
+        raise NotImplementedError()
+
+    def _fireDisconnected(self,reason):
+        """
+        Implemented by the adapter: report that the client has disconnected for good
+        """
+        raise NotImplementedError()
+
+    def sendPing(self):
+        """
+        Send the message returned by :meth:`pingMessage`
+
+        This is called every settings.pingInterval seconds
+        """
+        self.sendMessage(self.pingMessage())
+
+    def saveStateSnapshot(self):
+        """
+        Saves the client state to the file named by settings.stateSnapshot,
+        if set.  This is done automatically at ServerSync and when the
+        connection is lost
+        """
+        if self.settings.stateSnapshot is not None and not self.sharesState and not self.state.resyncing:
+            self.state.save(self.settings.stateSnapshot)
+
+    def connectionRecovered(self,recoveryTime):
+        """
+        Called when the client has reconnected after losing its connection
+
+        By this time the state has been reconciled with the server's and
+        :meth:`initialStateReady` and :meth:`ServerSyncReceived` have been
+        called again.  The new session is in .sessionID.
+
+        :param float recoveryTime: Seconds between the connection being lost
+            and the server sync completing.  Also stored in .lastRecoveryTime
+        """
+        pass
+
+    def initialStateReady(self,removedUsers,removedChannels):
+        """
+        Called once the server has sent all channels and users
+
+        This is called when ServerSync is received, after sessionID is set
+        and before the clientConnected callback and :meth:`ServerSyncReceived`.
+        If the client reconnects, it is called again after each resync.
+        If settings.bulkSync is set, this is the only notification of the
+        initial channels and users; self.state holds them all.
+
+        :param removedUsers: The :class:`MumbleState.User` objects the client
+            knew of (from before the connection was lost, or from a snapshot)
+            which the server no longer has.  Without bulkSync their removal
+            has also been reported to watchers
+        :param removedChannels: Likewise, the :class:`MumbleState.Channel` objects
+        """
+        pass
+
+    def ServerSyncReceived(self,message):
+        """
+        Called upon receipt of a ServerSync message
+
+        By the time this is called, sessionID will be set to the client's
+        session and the clientConnected callback will have completed.
+
+        :param message: A ServerSync message object
+        """
+
+    def sendVoiceMessage(self,data,flush=False):
+        """
+        Send a voice message via the active voice channel
+
+        :param str data: A stream of bytes (a str, bytearray or memoryview)
+        :param bool flush: If True, write this and any other queued messages
+            immediately instead of at the end of the current reactor iteration
+
+        This will send data either via the TCP control channel or the UDP
+        voice channel if the latter is active.  Data should be a stream of
+        bytes in mumble's voice format, such as one assembled by
+        :class:`MumbleVoiceProtocol.VoicePacketBuilder`.
+        """
+
+        self.connection.sendVoiceMessage(data)
+        if flush: self.flush()
+        else: self._dataQueued()
+
+    def connectionLost(self,reason):
+        """
+        Called when a connection is lost to the control protocol
+
+        This is called after the clientDisconnected callback is returned.
+        Implementors can override this method or listen for the callback,
+        depending on use-case
+        """
+        pass
+
+    def _jitterBufferRelease(self,packet):
+        self.VoicePacketReceived(packet,TCP=True)
+
+    def VoicePacketReceived(self,packet,TCP=False):
+        """
+        Called when voice data is received
+
+        :param packet: A :class:`MumbleVoiceProtocol.VoicePacket`
+
+        The packet only decodes its frames if asked to, and refers to the
+        received bytes rather than copying them, so this is the cheapest
+        way to handle voice.  To output the voice data again, pass
+        packet.relayData() to sendVoiceMessage.
+
+        By default this calls :meth:`VoiceMessageReceived`.
+        """
+        self.VoiceMessageReceived(packet.prefix,packet.session,packet.data,TCP)
+
+    def VoiceMessageReceived(self,prefix,session,data,TCP=False):
+        """
+        Called when voice data is received
+
+        :param str prefix:  The one-byte message header indicating codec type and if this
+            was a standard or direct transmission
+        :param int session: The session ID of the source of the transmission
+        :param str data:    The voice data, consisting of a series of voice frames and
+            optionally positional audio at the end
+
+        If you simply wish to output the voice data again, you can call
+        sendVoiceMessage and pass in prefix + data as the data.
+
+        Implementors should override this method or, to avoid copying the
+        voice data, :meth:`VoicePacketReceived`.
+        """
+        pass
+
+    def sendMessage(self,message):
+        """
+        Send a control message
+
+        If you call this method with :obj:`None`, it will ignore the call. This
+        behavior is so implementers can cancel the sending of an automatic
+        message (like Ping) by overriding :meth:`pingMessage` and returning
+        None
+
+        :param message: Any kind of TCP control message, or :obj:`None`
+
+        """
+        if message is not None:
+            self.connection.sendMessage(message)
+            self._dataQueued()
+
+    def flush(self):
+        """
+        Write any queued messages immediately
+
+        Messages sent with :meth:`sendMessage` and :meth:`sendVoiceMessage`
+        are queued and written together once per reactor iteration.  Call
+        this if something latency-sensitive must go out before control
+        returns to the reactor.
+
+        Implemented by the adapter.
+        """
+        raise NotImplementedError()
+
+    def versionMessage(self):
+        """
+        Called by the client to ask what message to send when it should send
+        a Version message on initial connect.
+
+        To change the message it's probably easiest to call the superclass
+        method and alter the appropriate fields.
+
+        :return: a Version object
+        """
+
+        message = MumbleConnection.Version()
+        message.release="1.2.5"
+        message.version=66053
+        message.os=platform.system()
+        message.os_version="evebot1.0.2"
+        return message
+
+    def authenticationMessage(self):
+        """
+        Called by the client to ask what message to send when it should send
+        an Authenticate message on initial connect.
+
+        To change the message it's probably easiest to call the superclass
+        method and alter the appropriate fields.
+
+        :return: an Authenticate object
+        """
+
+        message = MumbleConnection.Authenticate()
+        message.username=self.settings.nickname
+        if self.settings.password is not None: message.password=self.settings.password
+        message.celt_versions.append(-2147483637)
+        message.celt_versions.append(-2147483632)
+        message.opus=True
+        return message
+
+    def codecVersionMessage(self):
+        """
+        Called by the client to ask what message to send when it should send
+        a CodecVersion message on initial connect.
+
+        To change the message it's probably easiest to call the superclass
+        method and alter the appropriate fields.
+
+        :return: a CodecVersion object
+        """
+
+        message = MumbleConnection.CodecVersion()
+        message.alpha=-2147483637
+        message.beta=0
+        message.prefer_alpha=True
+        return message
+
+    def pingMessage(self):
+        """
+        Called by the client to ask what message to send when it should send
+        a Ping message, every settings.pingInterval seconds.
+
+        To change the message it's probably easiest to call the superclass
+        method and alter the appropriate fields.
+
+        :return: a Ping object
+        """
+
+        message = MumbleConnection.Ping()
+        timestamp = int(time.time()*1000000)
+        message.timestamp=timestamp
+        message.good=self.voiceStats.good
+        message.late=self.voiceStats.late
+        message.lost=self.voiceStats.lost
+        message.resync=self.voiceStats.resync
+        message.udp_packets=0
+        message.tcp_packets=self.numTCPPings
+        message.udp_ping_avg=0
+        message.udp_ping_var=0.0
+        message.tcp_ping_avg=self.avgTCPPing
+        message.tcp_ping_var=0
+
+        self.numTCPPings+=1
+        self.lastTCPTimeStamp=timestamp
+        return message
+
+    def disconnect(self):
+        """
+        Ask the client to disconnect the control channel
+
+        When sucessful, the .clientDisconnected Deferred is triggered (probably via errback and not callback) 
+
+        This also stops any automatic reconnection.
+        """
+        self._wantDisconnect=True
+        if self._reconnectCall is not None:
+            self._reconnectCall.cancel()
+            self._reconnectCall=None
+            self._disconnected(self._lostReason)
+        else:
+            self._closeConnection()
+
+    def errorCallback(self,result):
+        print(result)
+        return result
@@ -0,0 +1,116 @@
+import collections
+
+from twisted.internet import defer, task
+
+
+class ClientPool(object):
+    """
+    Manages many client connections to one server from one reactor
+
+    One client, the primary, keeps the server state up to date.  Every
+    client added to the pool uses the primary's state instead of keeping a
+    copy of its own, and so does not even parse channel and user messages
+    unless it has FooReceived methods for them.
+
+    The pool pings all its clients, including the primary, from a single
+    LoopingCall, and limits how many clients may be connecting (from the TCP
+    connection until ServerSync) at once; further clients wait their turn.
+
+    The primary should be added to a pool before it connects, and must be
+    connected for the pool's clients to see any state.
+    """
+
+    def __init__(self,primary,maxHandshakes=4,pingInterval=5.0):
+        """
+        :param primary: The MumbleClient whose state the pool's clients share
+        :param int maxHandshakes: How many clients may be connecting at once
+        :param float pingInterval: Seconds between pings of every client
+        """
+        self.primary=primary
+        self.maxHandshakes=maxHandshakes
+        self.clients=set()
+        self._connecting=set()
+        self._waiting=collections.deque()
+        primary.settings.pingInterval=None
+        self.pingTask=task.LoopingCall(self._pingAll)
+        self.pingTaskDeferred=self.pingTask.start(pingInterval,now=False)
+        self.pingTaskDeferred.addErrback(primary.errorCallback)
+
+    def spawn(self,client):
+        """
+        Adds a client to the pool and connects it when a handshake slot is free
+
+        :param client: An unconnected MumbleClient (or subclass) instance
+        :return: The client.  Its clientConnected Deferred fires as usual
+        """
+        client.settings.pingInterval=None
+        client.shareState(self.primary.state)
+        self.clients.add(client)
+        client.clientDisconnected.addBoth(self._clientDisconnected,client)
+        self._waiting.append(client)
+        self._admit()
+        return client
+
+    def retire(self,client):
+        """
+        Disconnects a client and removes it from the pool
+
+        A client that has not started connecting yet is just dropped, and
+        one still making its TCP connection has the attempt cancelled.
+        """
+        if client in self._waiting:
+            self._waiting.remove(client)
+            self.clients.discard(client)
+        elif client in self.clients:
+            if not client.controlConnected.called:
+                client.controlConnected.cancel()
+            else:
+                client.disconnect()
+
+    def broadcast(self,message):
+        """Sends a control message from every connected client in the pool"""
+        for client in self.clients:
+            if client.sessionID is not None: client.sendMessage(message)
+
+    def broadcastVoice(self,data):
+        """Sends voice data from every connected client in the pool"""
+        for client in self.clients:
+            if client.sessionID is not None: client.sendVoiceMessage(data)
+
+    def stop(self):
+        """Retires every client and stops pinging"""
+        for client in list(self.clients): self.retire(client)
+        if self.pingTask.running: self.pingTask.stop()
+
+    def _admit(self):
+        while self._waiting and len(self._connecting) < self.maxHandshakes:
+            client=self._waiting.popleft()
+            self._connecting.add(client)
+            client.clientConnected.addBoth(self._handshakeDone,client)
+            client.connect().addErrback(self._connectFailed,client)
+
+    def _handshakeDone(self,result,client):
+        self._connecting.discard(client)
+        self._admit()
+        return result
+
+    def _connectFailed(self,reason,client):
+        # The TCP connection itself failed, so nothing else will report it,
+        # unless it was cancelled by retire()
+        self._connecting.discard(client)
+        self.clients.discard(client)
+        self._admit()
+        if not reason.check(defer.CancelledError):
+            client.errorCallback(reason)
+
+    def _clientDisconnected(self,result,client):
+        self.clients.discard(client)
+        if client in self._connecting:
+            self._connecting.discard(client)
+            self._admit()
+        return result
+
+    def _pingAll(self):
+        if self.primary.sessionID is not None: self.primary.sendPing()
+        for client in self.clients:
+            if client.sessionID is not None: client.sendPing()
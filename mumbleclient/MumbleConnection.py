@@ -0,0 +1,209 @@
+import collections
+import struct
+import sys
+
+from . import Mumble_pb2
+from . import MumbleVoiceProtocol
+
+_MESSAGE_HEADER=">HI"
+_HEADER=struct.Struct(_MESSAGE_HEADER)
+_HEADER_LENGTH=_HEADER.size
+
+_MESSAGE_TYPES= [
+    "Version",
+    "UDPTunnel",
+    "Authenticate",
+    "Ping",
+    "Reject",
+    "ServerSync",
+    "ChannelRemove",
+    "ChannelState",
+    "UserRemove",
+    "UserState",
+    "BanList",
+    "TextMessage",
+    "PermissionDenied",
+    "ACL",
+    "QueryUsers",
+    "CryptSetup",
+    "ContextActionModify",
+    "ContextAction",
+    "UserList",
+    "VoiceTarget",
+    "PermissionQuery",
+    "CodecVersion",
+    "UserStats",
+    "RequestBlob",
+    "ServerConfig",
+    "SuggestConfig"
+]
+
+_MESSAGE_LOOKUP_BY_OBJECT={}
+_MESSAGE_LOOKUP_BY_NUMBER={}
+
+def getMessageObject(messageId):
+    return _MESSAGE_LOOKUP_BY_NUMBER[messageId]()
+
+def getMessageId(messageObject):
+    return _MESSAGE_LOOKUP_BY_OBJECT[type(messageObject)]
+
+def getMessageName(id):
+    return _MESSAGE_TYPES[id]
+
+def _addMessageObjectsToModule():
+    module = sys.modules[__name__]
+    for i in range(len(_MESSAGE_TYPES)):
+        message = getattr(Mumble_pb2,_MESSAGE_TYPES[i])
+        _MESSAGE_LOOKUP_BY_OBJECT[message]=i
+        _MESSAGE_LOOKUP_BY_NUMBER[i]=message
+        setattr(module,_MESSAGE_TYPES[i],message)
+
+
+class ControlMessage(object):
+    """
+    A control message received by a :class:`MumbleConnection`
+
+    .type is the message type id and .data the body.  The body is kept as a
+    view of the data it was received in, and only copied out when .data is
+    first read and parsed when .message is first read, so messages nobody is
+    interested in cost neither.
+    """
+
+    __slots__=("type","_view","_data","_message")
+
+    def __init__(self,type,data):
+        """
+        :param int type: The message type id
+        :param data: The body; a str, or a memoryview which must stay valid
+            until .data or .message is read (or the message is dropped)
+        """
+        self.type=type
+        if isinstance(data,memoryview):
+            self._view=data
+            self._data=None
+        else:
+            self._view=None
+            self._data=data
+        self._message=None
+
+    @property
+    def name(self):
+        return _MESSAGE_TYPES[self.type]
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data=self._view.tobytes()
+            self._view=None
+        return self._data
+
+    @property
+    def message(self):
+        if self._message is None:
+            message=getMessageObject(self.type)
+            message.ParseFromString(self.data)
+            self._message=message
+        return self._message
+
+
+UnknownMessage=collections.namedtuple("UnknownMessage","type data")
+"""A message with a type id this library does not know, and its body"""
+
+
+class MumbleConnection(object):
+    """
+    The Mumble control protocol, without any I/O
+
+    Feed the bytes received from the server to :meth:`receiveData`, which
+    returns the events they complete: a :class:`ControlMessage` for each
+    control message, a :class:`MumbleVoiceProtocol.VoicePacket` for voice
+    tunnelled over TCP and an :class:`UnknownMessage` for anything else.
+    Messages to send are queued with :meth:`sendMessage` and
+    :meth:`sendVoiceMessage`; :meth:`dataToSend` returns the queued bytes,
+    which it is up to the caller to write.
+
+    Incoming data is parsed in place where possible: every complete message
+    in a chunk is handled in a single pass, and only an incomplete trailing
+    message is kept, in a bytearray, until the rest of it arrives.  Control
+    message bodies are not copied out of the chunk unless they are read.
+    """
+
+    def __init__(self):
+        self._buffer=bytearray()
+        self._outgoing=[]
+
+    def receiveData(self,data):
+        """
+        Handles bytes received from the server
+
+        :param data: A str, bytearray or memoryview.  The events returned
+            may refer to it, so it must not be changed while they are in use
+        :return: A list of the events completed by this data, in order
+        """
+        events=[]
+        buf=self._buffer
+        if buf:
+            buf.extend(data)
+            data=buf
+        view=memoryview(data)
+        end=len(data)
+        offset=0
+        unpackHeader=_HEADER.unpack_from
+        while end-offset >= _HEADER_LENGTH:
+            msgType,length=unpackHeader(data,offset)
+            start=offset+_HEADER_LENGTH
+            if end-start < length: break
+            offset=start+length
+            event=self.messageReceived(msgType,view[start:offset])
+            if event is not None: events.append(event)
+        if data is buf:
+            if offset:
+                # The events may still be looking at the buffer, so it cannot
+                # be resized; start a new one with what is left
+                self._buffer=bytearray(view[offset:])
+        elif offset < end:
+            buf.extend(view[offset:])
+        return events
+
+    def messageReceived(self,msgType,data):
+        """
+        Turns one message into an event.  data is a memoryview of the body
+        """
+        if msgType < len(_MESSAGE_TYPES):
+            if msgType == 1:
+                return MumbleVoiceProtocol.decodeAudioMessage(data.tobytes())
+            return ControlMessage(msgType,data)
+        return UnknownMessage(msgType,data.tobytes())
+
+    def sendMessage(self,messageObject):
+        """Queues a control message"""
+        self._queue(getMessageId(messageObject),messageObject.SerializeToString())
+
+    def sendVoiceMessage(self,bytesMessage):
+        """Queues voice data (a str, bytearray or memoryview) to tunnel over TCP"""
+        if isinstance(bytesMessage,memoryview):
+            bytesMessage = bytesMessage.tobytes()
+        elif isinstance(bytesMessage,bytearray):
+            bytesMessage = bytes(bytesMessage)
+        self._queue(1,bytesMessage)
+
+    def _queue(self,msgType,data):
+        self._outgoing.append(_HEADER.pack(msgType,len(data)))
+        self._outgoing.append(data)
+
+    @property
+    def pending(self):
+        """True if there is queued data that has not been taken by :meth:`dataToSend`"""
+        return bool(self._outgoing)
+
+    def dataToSend(self):
+        """
+        Returns, and forgets, everything queued since the last call
+
+        :return: A list of strs (message headers and bodies) to write in order
+        """
+        outgoing=self._outgoing
+        self._outgoing=[]
+        return outgoing
+
+_addMessageObjectsToModule()
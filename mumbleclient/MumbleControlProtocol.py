@@ -1,106 +1,98 @@
-import twisted.protocols.stateful
-
-import Mumble_pb2
+from twisted.internet import reactor
+from twisted.internet.protocol import Protocol
+from zope.interface import classImplements
+try:
+    from twisted.internet.interfaces import IHandshakeListener
+except ImportError:
+    IHandshakeListener = None
+
+from . import MumbleConnection
+from . import MumbleTLS
+from .MumbleConnection import _MESSAGE_TYPES, _MESSAGE_LOOKUP_BY_OBJECT, _MESSAGE_LOOKUP_BY_NUMBER
+from .MumbleConnection import getMessageObject, getMessageId, getMessageName
 
 import sys
-import struct
-
-_MESSAGE_HEADER=">HI"
-
-_MESSAGE_TYPES= [
-    "Version",
-    "UDPTunnel",
-    "Authenticate",
-    "Ping",
-    "Reject",
-    "ServerSync",
-    "ChannelRemove",
-    "ChannelState",
-    "UserRemove",
-    "UserState",
-    "BanList",
-    "TextMessage",
-    "PermissionDenied",
-    "ACL",
-    "QueryUsers",
-    "CryptSetup",
-    "ContextActionModify",
-    "ContextAction",
-    "UserList",
-    "VoiceTarget",
-    "PermissionQuery",
-    "CodecVersion",
-    "UserStats",
-    "RequestBlob",
-    "ServerConfig",
-    "SuggestConfig"
-]
-
-_MESSAGE_LOOKUP_BY_OBJECT={}
-_MESSAGE_LOOKUP_BY_NUMBER={}
-
-def getMessageObject(messageId):
-    return _MESSAGE_LOOKUP_BY_NUMBER[messageId]()
-
-def getMessageId(messageObject):
-    return _MESSAGE_LOOKUP_BY_OBJECT[type(messageObject)]
-
-def getMessageName(id):
-    return _MESSAGE_TYPES[id]
+import time
 
 def _addMessageObjectsToModule():
     module = sys.modules[__name__]
-    for i in range(len(_MESSAGE_TYPES)):
-        message = getattr(Mumble_pb2,_MESSAGE_TYPES[i])
-        _MESSAGE_LOOKUP_BY_OBJECT[message]=i
-        _MESSAGE_LOOKUP_BY_NUMBER[i]=message
-        setattr(module,_MESSAGE_TYPES[i],message)
-
-class MumbleControlProtocol(twisted.protocols.stateful.StatefulProtocol):
-
-    def __init__(self,client):
+    for name in _MESSAGE_TYPES:
+        setattr(module,name,getattr(MumbleConnection,name))
+
+class MumbleControlProtocol(Protocol):
+    """
+    Connects a client's :class:`MumbleConnection.MumbleConnection` to a
+    Twisted transport
+
+    Received data is passed straight to the client.  Outgoing messages are
+    queued by the client's connection and written with a single
+    writeSequence call once per reactor iteration.  Call :meth:`flush` to
+    write the queue immediately.
+
+    Over TLS, when the handshake completes the client has .tlsHandshakeTime
+    set to the seconds it took and .tlsSessionReused to whether the session
+    was resumed (or None if that cannot be determined).  This needs a Twisted
+    with IHandshakeListener.
+    """
+
+    def __init__(self,client,clock=reactor):
         self.client=client
         client.controlProtocol=self
+        self.clock=clock
+        self._flushCall=None
+        self._handshakeStart=None
 
-    def getInitialState(self):
-        return (self.messageHeaderReceived,6)
-
-    def messageHeaderReceived(self,data):
-        msgType,length=struct.unpack(_MESSAGE_HEADER,data)
-        self._msgType = msgType
-        return (self.messageBodyReceived,length)
-
-    def messageBodyReceived(self,data):
-        if self._msgType < len(_MESSAGE_TYPES):
-            if self._msgType ==1:
-                self.client._TCPVoiceMessageReceived(data)
-            else:
-                message=getMessageObject(self._msgType)
-                message.ParseFromString(data)
-                self.client._controlMessageReceived(self._msgType,_MESSAGE_TYPES[self._msgType],message)
-        else:
-            self.client._unknownMessageReceived(self._msgType,data)
-        return (self.messageHeaderReceived,6)
+    def dataReceived(self,data):
+        self.client._dataReceived(data)
 
     def sendMessage(self,messageObject):
-        id = getMessageId(messageObject)
-        bytesMessage = messageObject.SerializeToString()
-        length = len(bytesMessage)
-        message = struct.pack(_MESSAGE_HEADER,id,length)+bytesMessage
-        self.transport.write(message)
-
-    def sendVoiceMessage(self,bytesMessage):
-        length = len(bytesMessage)
-        message = struct.pack(_MESSAGE_HEADER,1,length)+bytesMessage
-        self.transport.write(message)
+        self.client.sendMessage(messageObject)
+
+    def sendVoiceMessage(self,bytesMessage,flush=False):
+        self.client.sendVoiceMessage(bytesMessage,flush)
+
+    def scheduleFlush(self):
+        """
+        Arranges for the queue to be written at the end of this reactor iteration
+        """
+        if self._flushCall is None:
+            self._flushCall = self.clock.callLater(0,self.flush)
+
+    def flush(self):
+        """
+        Writes all queued messages to the transport now
+        """
+        if self._flushCall is not None:
+            if self._flushCall.active(): self._flushCall.cancel()
+            self._flushCall = None
+        outgoing = self.client.connection.dataToSend()
+        if outgoing: self.transport.writeSequence(outgoing)
 
     def connectionMade(self):
+        # The TLS handshake is still under way at this point
+        self._handshakeStart = time.time()
         self.client._connectionMade()
 
+    def handshakeCompleted(self):
+        if self._handshakeStart is None: return
+        self.client.tlsHandshakeTime = time.time()-self._handshakeStart
+        self._handshakeStart = None
+        getHandle = getattr(self.transport,"getHandle",None)
+        if getHandle is not None:
+            self.client.tlsSessionReused = MumbleTLS.sessionReused(getHandle())
+
     def connectionLost(self,reason):
+        if self._flushCall is not None:
+            if self._flushCall.active(): self._flushCall.cancel()
+            self._flushCall = None
+        self.client.connection.dataToSend()
         self.client._connectionLost(reason)
 
     def disconnect(self):
+        self.flush()
         self.transport.loseConnection()
 
+if IHandshakeListener is not None:
+    classImplements(MumbleControlProtocol,IHandshakeListener)
+
 _addMessageObjectsToModule()
@@ -0,0 +1,282 @@
+import collections
+import math
+import time
+
+
+class PlayoutStats(object):
+    """
+    Running statistics of how late packets were played out, in seconds
+
+    .count, .mean, .maximum and :meth:`stddev` (the playout jitter)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count=0
+        self.mean=0.0
+        self.maximum=0.0
+        self._m2=0.0
+
+    def add(self,lateness):
+        # Welford's method, so no samples are kept
+        self.count+=1
+        delta=lateness-self.mean
+        self.mean+=delta/self.count
+        self._m2+=delta*(lateness-self.mean)
+        if lateness > self.maximum: self.maximum=lateness
+
+    def stddev(self):
+        if self.count < 2: return 0.0
+        return math.sqrt(self._m2/(self.count-1))
+
+    def __repr__(self):
+        return "<PlayoutStats count=%d mean=%.2fms max=%.2fms jitter=%.2fms>" % (
+            self.count,self.mean*1000,self.maximum*1000,self.stddev()*1000)
+
+
+class MemoryBuffer(object):
+    """
+    Keeps a stream's packets in memory, as given; nothing is copied
+
+    This is the default buffer for a :class:`DelayStream`.  Other buffers
+    (such as :class:`MumbleRingFile.RingFileBuffer`) provide the same
+    methods: append(due,data), headTime(), popleft(), clear() and len().
+    """
+
+    def __init__(self):
+        self._times=collections.deque()
+        self._packets=collections.deque()
+
+    def __len__(self):
+        return len(self._packets)
+
+    def append(self,due,data):
+        self._times.append(due)
+        self._packets.append(data)
+
+    def headTime(self):
+        """Returns the time the first packet is due, or None if there are none"""
+        return self._times[0] if self._times else None
+
+    def popleft(self):
+        self._times.popleft()
+        return self._packets.popleft()
+
+    def clear(self):
+        self._times.clear()
+        self._packets.clear()
+
+
+class DelayStream(object):
+    """
+    One speaker's packets, waiting in a :class:`DelayLine`
+
+    Every packet in a stream is delayed by the same amount, so the order
+    packets arrive in is also the order they are due in, and a FIFO is all
+    that is needed.
+
+    A paused stream keeps queueing packets but plays none out, however
+    overdue, until it is resumed.
+    """
+
+    def __init__(self,line,send,delay,drained=None,buffer=None,paused=False):
+        self.line=line
+        self.send=send
+        self.delay=delay
+        self.drained=drained
+        self.buffer=buffer if buffer is not None else MemoryBuffer()
+        self.paused=paused
+        self._dueTick=None
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def push(self,data,now=None):
+        """
+        Queues data to be passed to send(data) after the stream's delay
+
+        :param float now: The time data arrived, if not now
+        """
+        if self.line is None: return
+        if now is None: now=self.line.clock()
+        buffer=self.buffer
+        buffer.append(now+self.delay,data)
+        if len(buffer) == 1 and not self.paused:
+            self.line._schedule(self)
+
+    def clear(self):
+        """Drops every queued packet"""
+        if self.line is not None: self.line._unschedule(self)
+        self.buffer.clear()
+
+    def headTime(self):
+        """Returns the time the next packet is due, or None if the stream is empty"""
+        return self.buffer.headTime()
+
+    def pause(self):
+        """Stops playing packets out; they stay queued"""
+        self.paused=True
+        if self.line is not None: self.line._unschedule(self)
+
+    def resume(self):
+        """Plays packets out again, starting with any now overdue"""
+        self.paused=False
+        if self.line is not None and len(self.buffer) and self._dueTick is None:
+            self.line._schedule(self)
+
+    def _release(self,now,stats):
+        buffer=self.buffer
+        send=self.send
+        due=buffer.headTime()
+        while due is not None and due <= now:
+            stats.add(now-due)
+            send(buffer.popleft())
+            due=buffer.headTime()
+        if due is None and self.drained is not None:
+            self.drained(self)
+
+
+class DelayLine(object):
+    """
+    Plays packets back a fixed time after they arrive
+
+    Each speaker has a :class:`DelayStream`.  The streams that have packets
+    queued sit in one hashed timer wheel, in the slot for the tick their
+    first packet is due; a stream is only looked at when that tick comes,
+    and the line only wakes up (through callLater) when some packet is due.
+    The wheel holds at most one entry per speaker, however long the delay.
+
+    How late each packet is played out is measured in .stats, a
+    :class:`PlayoutStats`.
+    """
+
+    def __init__(self,callLater,clock=time.time,tick=0.002,slots=4096):
+        """
+        :param callLater: A function like reactor.callLater or loop.call_later
+            returning an object with a cancel() method
+        :param clock: The time source, which must match callLater's
+        :param float tick: The wheel's resolution in seconds.  Packets may be
+            played out up to this late
+        :param int slots: The size of the wheel, a power of two
+        """
+        if slots & (slots-1):
+            raise ValueError("The number of slots must be a power of two")
+        self.callLater=callLater
+        self.clock=clock
+        self.tick=tick
+        self.stats=PlayoutStats()
+        self._slots=[[] for i in range(slots)]
+        self._mask=slots-1
+        self._count=0
+        self._processedTick=int(clock()/tick)
+        self._wakeTick=None
+        self._wakeCall=None
+        self._waking=False
+
+    def addStream(self,send,delay,drained=None,buffer=None,paused=False):
+        """
+        Creates a stream
+
+        :param send: Called with each packet when it is due
+        :param float delay: Seconds to delay the stream's packets by
+        :param drained: If given, called with the stream each time it
+            becomes empty by playing out its last packet
+        :param buffer: Where to keep the stream's packets; by default a
+            :class:`MemoryBuffer`.  A buffer that already holds packets (one
+            recovered from a :class:`MumbleRingFile.RingFile`, say) is
+            played out from where it left off
+        :param bool paused: Start the stream paused; see :meth:`DelayStream.resume`
+        :return: A :class:`DelayStream`; push packets to it
+        """
+        stream=DelayStream(self,send,delay,drained,buffer,paused)
+        if len(stream.buffer) and not paused: self._schedule(stream)
+        return stream
+
+    def removeStream(self,stream):
+        """Drops a stream's packets and stops playing it out"""
+        stream.clear()
+        self._unschedule(stream)
+        stream.line=None
+
+    def stop(self):
+        """Cancels the pending wakeup.  Queued packets stay queued"""
+        if self._wakeCall is not None:
+            self._wakeCall.cancel()
+            self._wakeCall=None
+            self._wakeTick=None
+
+    def _schedule(self,stream):
+        dueTick=int(math.ceil(stream.buffer.headTime()/self.tick))
+        if dueTick <= self._processedTick: dueTick=self._processedTick+1
+        stream._dueTick=dueTick
+        self._slots[dueTick & self._mask].append(stream)
+        self._count+=1
+        if self._waking: return
+        if self._wakeTick is None or dueTick < self._wakeTick:
+            self._wakeAt(dueTick)
+
+    def _unschedule(self,stream):
+        if stream._dueTick is None: return
+        self._slots[stream._dueTick & self._mask].remove(stream)
+        stream._dueTick=None
+        self._count-=1
+        if not self._count: self.stop()
+
+    def _wakeAt(self,tick):
+        if self._wakeCall is not None: self._wakeCall.cancel()
+        self._wakeTick=tick
+        self._wakeCall=self.callLater(max(0.0,tick*self.tick-self.clock()),self._wake)
+
+    def _wake(self):
+        self._wakeCall=None
+        self._wakeTick=None
+        now=self.clock()
+        # Allow for rounding, so a wakeup exactly on a tick processes it
+        current=int(now/self.tick+1e-6)
+        due=[]
+        slots=self._slots
+        mask=self._mask
+        # (while rather than range, which would build a list on Python 2)
+        t=self._processedTick
+        last=min(current,self._processedTick+len(slots))
+        while t < last:
+            t+=1
+            slot=slots[t & mask]
+            if not slot: continue
+            remaining=[]
+            for stream in slot:
+                if stream._dueTick <= current: due.append(stream)
+                else: remaining.append(stream)
+            slot[:]=remaining
+        self._processedTick=current
+        self._count-=len(due)
+        # Streams rescheduled now (or pushed to by send) may not be the
+        # earliest in the wheel, so the next wakeup is worked out at the end
+        self._waking=True
+        try:
+            for stream in due:
+                stream._dueTick=None
+                stream._release(now,self.stats)
+                if len(stream.buffer) and stream.line is self and stream._dueTick is None and not stream.paused:
+                    self._schedule(stream)
+        finally:
+            self._waking=False
+        if self._count:
+            self._wakeAt(self._nextTick())
+
+    def _nextTick(self):
+        # The first occupied tick after the current one; entries for later
+        # laps of the wheel are skipped over
+        slots=self._slots
+        mask=self._mask
+        earliest=None
+        t=self._processedTick
+        last=t+len(slots)
+        while t < last:
+            t+=1
+            for stream in slots[t & mask]:
+                if stream._dueTick == t: return t
+                if earliest is None or stream._dueTick < earliest: earliest=stream._dueTick
+        return earliest
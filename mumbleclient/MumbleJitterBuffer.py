@@ -0,0 +1,257 @@
+import collections
+import time
+
+from . import MumbleOgg
+from . import MumbleVoiceProtocol
+
+# Seconds of audio per sequence number
+FRAME=0.01
+
+
+class JitterPolicy(object):
+    """
+    Controls how a :class:`JitterBuffer` adapts
+
+    At the start of each transmission the playout delay is set to
+    jitterMultiple times the speaker's measured jitter, kept between
+    minDelay and maxDelay.  A jump of more than resyncGap seconds in the
+    sequence numbers is taken as the speaker's client starting again, and
+    playout restarts from the new packets instead of waiting out the gap.
+    """
+
+    def __init__(self,minDelay=0.02,maxDelay=0.2,jitterMultiple=4.0,resyncGap=1.0):
+        self.minDelay=minDelay
+        self.maxDelay=maxDelay
+        self.jitterMultiple=jitterMultiple
+        self.resyncGap=resyncGap
+
+    def delay(self,jitter):
+        """Returns the playout delay to use for a given jitter"""
+        return min(max(self.minDelay,jitter*self.jitterMultiple),self.maxDelay)
+
+
+class VoiceStats(object):
+    """
+    Counts of received voice packets, as reported to the server in Ping messages
+
+    .good       packets played out in time
+    .late       packets that arrived after their turn to play
+    .lost       packets that never arrived
+    .duplicate  packets received more than once
+    .resync     times playout restarted because the sequence numbers jumped
+    """
+
+    def __init__(self):
+        self.good=0
+        self.late=0
+        self.lost=0
+        self.duplicate=0
+        self.resync=0
+
+    def __repr__(self):
+        return "<VoiceStats good=%d late=%d lost=%d duplicate=%d resync=%d>" % (
+            self.good,self.late,self.lost,self.duplicate,self.resync)
+
+
+def packetFrames(packet):
+    """
+    Returns how many sequence numbers (10ms frames) a
+    :class:`MumbleVoiceProtocol.VoicePacket` covers
+    """
+    if packet.codec == MumbleVoiceProtocol.OPUS:
+        if not packet.frames: return 1
+        return max(1,MumbleOgg.opusPacketSamples(packet.frame(0))//MumbleOgg.SAMPLES_PER_SEQUENCE)
+    return max(1,len(packet.frames))
+
+
+class JitterBuffer(object):
+    """
+    Plays one speaker's voice packets out in sequence, at a steady rate
+
+    Packets are held by sequence number and released, in order, each at
+    its own time: the start of the transmission plus the playout delay plus
+    10ms per sequence number.  Duplicates, and packets that arrive after
+    their turn, are dropped; a packet missing when its turn comes is
+    counted as lost.  Counts go to .stats, a :class:`VoiceStats`.
+
+    .jitter is the speaker's interarrival jitter in seconds, estimated as
+    in RFC 3550, and .delay the playout delay in use, which is chosen from
+    it at the start of each transmission.
+    """
+
+    def __init__(self,release,callLater,clock=time.time,policy=None,stats=None):
+        """
+        :param release: Called with each packet when it is played out
+        :param callLater: A function like reactor.callLater or loop.call_later
+            returning an object with a cancel() method
+        :param clock: The time source
+        :param policy: A :class:`JitterPolicy`, or None for the defaults
+        :param stats: A :class:`VoiceStats` to count in, or None for a new one
+        """
+        self.release=release
+        self.callLater=callLater
+        self.clock=clock
+        self.policy=policy if policy is not None else JitterPolicy()
+        self.stats=stats if stats is not None else VoiceStats()
+        self.jitter=0.0
+        self.delay=self.policy.minDelay
+        self._packets={}
+        self._played=collections.deque(maxlen=64)
+        self._nextSequence=None
+        self._base=0.0
+        self._lastTransit=None
+        self._endSequence=None
+        self._ended=True
+        self._frames=1
+        self._call=None
+
+    def __len__(self):
+        return len(self._packets)
+
+    @property
+    def playing(self):
+        """True while a transmission is being played out"""
+        return self._nextSequence is not None
+
+    def add(self,packet,now=None):
+        """
+        Adds a :class:`MumbleVoiceProtocol.VoicePacket`
+
+        :param float now: The time it arrived, if not now
+        """
+        if now is None: now=self.clock()
+        sequence=packet.sequence
+        # RFC 3550 jitter, ignoring the jumps between transmissions
+        transit=now-sequence*FRAME
+        jumped=True
+        if self._lastTransit is not None:
+            difference=abs(transit-self._lastTransit)
+            if difference < self.policy.resyncGap:
+                self.jitter+=(difference-self.jitter)/16.0
+                jumped=False
+        self._lastTransit=transit
+        if self._nextSequence is not None and sequence < self._nextSequence:
+            if sequence in self._played: self.stats.duplicate+=1
+            else: self.stats.late+=1
+            return
+        if self._nextSequence is None and self._endSequence is not None and not jumped:
+            # Between transmissions, a straggler from the last one must not
+            # start playing again (unless the speaker's client restarted its
+            # sequence numbers, which moves the transit time)
+            if sequence in self._played:
+                self.stats.duplicate+=1
+                return
+            if sequence < self._endSequence:
+                self.stats.late+=1
+                return
+        if sequence in self._packets:
+            self.stats.duplicate+=1
+            return
+        self._packets[sequence]=packet
+        if self._nextSequence is None:
+            self._start(sequence,now)
+
+    def clear(self):
+        """Drops every held packet and stops playing out"""
+        if self._call is not None:
+            self._call.cancel()
+            self._call=None
+        self._packets.clear()
+        self._nextSequence=None
+        self._endSequence=None
+        self._ended=True
+
+    def _start(self,sequence,now):
+        # Packets skipped between a transmission that stalled and its
+        # continuation were lost
+        if not self._ended and self._endSequence is not None:
+            gap=sequence-self._endSequence
+            if 0 < gap*FRAME <= self.policy.resyncGap:
+                self.stats.lost+=(gap+self._frames-1)//self._frames
+        self.delay=self.policy.delay(self.jitter)
+        self._nextSequence=sequence
+        self._base=now+self.delay-sequence*FRAME
+        self._schedule(now)
+
+    def _schedule(self,now):
+        self._call=self.callLater(max(0.0,self._base+self._nextSequence*FRAME-now),self._tick)
+
+    def _tick(self):
+        self._call=None
+        now=self.clock()
+        packets=self._packets
+        stats=self.stats
+        # Allow for rounding, so a wakeup exactly on time plays its frame
+        while self._base+self._nextSequence*FRAME <= now+1e-6:
+            sequence=self._nextSequence
+            packet=packets.pop(sequence,None)
+            if packet is not None:
+                stats.good+=1
+                self._played.append(sequence)
+                self._frames=packetFrames(packet)
+                self._nextSequence=sequence+self._frames
+                self._ended=packet.terminator
+                self.release(packet)
+                if self._nextSequence is None: return
+                if self._ended and not packets:
+                    self._stop()
+                    return
+            elif packets:
+                first=min(packets)
+                if (first-sequence)*FRAME > self.policy.resyncGap:
+                    stats.resync+=1
+                    self._nextSequence=first
+                    self._base=now-first*FRAME
+                else:
+                    # One packet, as long as the one before it, is missing
+                    stats.lost+=1
+                    self._nextSequence=min(sequence+self._frames,first)
+            else:
+                # Nothing more has arrived; start again when it does
+                self._stop()
+                return
+        self._schedule(now)
+
+    def _stop(self):
+        self._endSequence=self._nextSequence
+        self._nextSequence=None
+
+
+class JitterBuffers(object):
+    """
+    A :class:`JitterBuffer` for each speaker, created as they are heard,
+    all counting in one .stats
+    """
+
+    def __init__(self,release,callLater,clock=time.time,policy=None,stats=None):
+        """
+        :param release: Called with each packet when it is played out
+        :param callLater: As for :class:`JitterBuffer`
+        :param clock: The time source
+        :param policy: A :class:`JitterPolicy`, or None for the defaults
+        :param stats: A :class:`VoiceStats` to count in, or None for a new one
+        """
+        self.release=release
+        self.callLater=callLater
+        self.clock=clock
+        self.policy=policy
+        self.stats=stats if stats is not None else VoiceStats()
+        self.buffers={}
+
+    def add(self,packet,now=None):
+        """Adds a :class:`MumbleVoiceProtocol.VoicePacket` to its speaker's buffer"""
+        buffer=self.buffers.get(packet.session)
+        if buffer is None:
+            buffer=JitterBuffer(self.release,self.callLater,self.clock,self.policy,self.stats)
+            self.buffers[packet.session]=buffer
+        buffer.add(packet,now)
+
+    def remove(self,session):
+        """Drops a speaker's buffer, if there is one"""
+        buffer=self.buffers.pop(session,None)
+        if buffer is not None: buffer.clear()
+
+    def clear(self):
+        """Drops every buffer"""
+        for buffer in self.buffers.values(): buffer.clear()
+        self.buffers.clear()
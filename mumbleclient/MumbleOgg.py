@@ -0,0 +1,235 @@
+import struct
+
+from . import MumbleVoiceProtocol
+
+# Opus always runs at 48kHz as far as Ogg is concerned, and Mumble counts
+# sequence numbers in 10ms frames
+_SAMPLE_RATE=48000
+SAMPLES_PER_SEQUENCE=480
+
+# Opus packets decoding to 20ms and 10ms of silence (CELT, one frame)
+SILENCE_20MS=b"\xf8\xff\xfe"
+SILENCE_10MS=b"\xf0\xff\xfe"
+
+_PAGE_HEADER=struct.Struct("<4sBBqIIIB")
+_BOS=0x02
+_EOS=0x04
+
+def _buildCRCTable():
+    # Ogg's CRC32: polynomial 0x04c11db7, not reflected, no final xor
+    table=[]
+    for i in range(256):
+        r=i << 24
+        for j in range(8):
+            if r & 0x80000000:
+                r=((r << 1) ^ 0x04c11db7) & 0xFFFFFFFF
+            else:
+                r=(r << 1) & 0xFFFFFFFF
+        table.append(r)
+    return tuple(table)
+
+_CRC_TABLE=_buildCRCTable()
+
+def oggCRC(data,crc=0):
+    """Returns the Ogg checksum of data (a bytearray, or anything bytearray() accepts)"""
+    table=_CRC_TABLE
+    for byte in bytearray(data):
+        crc=((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ byte]
+    return crc
+
+# Frame sizes, in samples at 48kHz, for each Opus TOC configuration
+_OPUS_FRAME_SAMPLES=(
+    (480,960,1920,2880)*3+   # SILK: NB, MB, WB
+    (480,960)*2+             # Hybrid: SWB, FB
+    (120,240,480,960)*4      # CELT: NB, WB, SWB, FB
+)
+
+def opusPacketSamples(packet):
+    """
+    Returns the number of samples (at 48kHz) an Opus packet decodes to,
+    from its TOC byte
+    """
+    packet=bytearray(packet[:2])
+    if not packet: return 0
+    toc=packet[0]
+    count=toc & 0x03
+    if count == 0: frames=1
+    elif count < 3: frames=2
+    elif len(packet) > 1: frames=packet[1] & 0x3F
+    else: raise ValueError("Opus packet is missing its frame count")
+    return frames*_OPUS_FRAME_SAMPLES[toc >> 3]
+
+
+class OggOpusWriter(object):
+    """
+    Writes Opus packets to an Ogg Opus stream, as they are
+
+    Nothing is decoded or re-encoded.  Packets are placed by their Mumble
+    sequence numbers: a gap in the sequence is filled with silence, so the
+    file plays back with the speaker's pauses.  At most one page (by default
+    about a second of audio) is held in memory.
+    """
+
+    def __init__(self,fileobj,serial=0,channels=1,vendor="mumbleclient",pageSamples=_SAMPLE_RATE,maxGap=60.0):
+        """
+        :param fileobj: Where to write the stream; anything with a write method
+        :param int serial: The Ogg stream serial number
+        :param int channels: 1 for mono, 2 for stereo
+        :param str vendor: The vendor string for the OpusTags header
+        :param int pageSamples: Audio (in 48kHz samples) to collect per page
+        :param float maxGap: The longest gap, in seconds, taken from sequence
+            numbers.  A longer gap, or a sequence number going backwards (a
+            client restarting its count), is treated as no gap unless the
+            receive times of the packets are given
+        """
+        self.fileobj=fileobj
+        self.serial=serial
+        self.pageSamples=pageSamples
+        self.maxGap=maxGap
+        self.granule=0
+        self._pageNumber=0
+        self._segments=bytearray()
+        self._body=[]
+        self._pageGranule=None
+        self._pageStart=0
+        self._nextSequence=None
+        self._lastTime=None
+        self._lastSamples=0
+        head=struct.pack("<8sBBHIhB",b"OpusHead",1,channels,0,_SAMPLE_RATE,0,0)
+        self._writePage([head],bytearray([len(head)]),0,_BOS)
+        vendor=vendor.encode("utf-8")
+        tags=b"OpusTags"+struct.pack("<I",len(vendor))+vendor+struct.pack("<I",0)
+        self._writePage([tags],self._lacing(len(tags)),0,0)
+
+    def writePacket(self,sequence,packet,now=None):
+        """
+        Adds an Opus packet
+
+        :param int sequence: The Mumble sequence number of the packet
+        :param packet: The Opus packet; a str, bytearray or memoryview
+        :param float now: The time it was received, if known, used for gaps
+            the sequence numbers cannot account for
+        """
+        samples=opusPacketSamples(packet)
+        gap=0
+        if self._nextSequence is not None:
+            gap=sequence-self._nextSequence
+            if (gap < 0 or gap*0.01 > self.maxGap):
+                gap=0
+                if now is not None and self._lastTime is not None:
+                    elapsed=int(round((now-self._lastTime)*100))
+                    gap=max(0,elapsed-self._lastSamples//SAMPLES_PER_SEQUENCE)
+        if gap:
+            self._fillSilence(gap)
+        if isinstance(packet,memoryview):
+            packet=packet.tobytes()
+        elif isinstance(packet,bytearray):
+            packet=bytes(packet)
+        self._addPacket(packet,samples)
+        self._nextSequence=sequence+max(1,samples//SAMPLES_PER_SEQUENCE)
+        self._lastTime=now
+        self._lastSamples=samples
+
+    def _fillSilence(self,frames):
+        while frames >= 2:
+            self._addPacket(SILENCE_20MS,960)
+            frames-=2
+        if frames:
+            self._addPacket(SILENCE_10MS,480)
+
+    def _lacing(self,length):
+        return bytearray([255]*(length//255)+[length%255])
+
+    def _addPacket(self,packet,samples):
+        lacing=self._lacing(len(packet))
+        if len(lacing) > 255:
+            raise ValueError("Opus packet too long: %d bytes" % len(packet))
+        if len(self._segments)+len(lacing) > 255:
+            self._flushPage()
+        self._segments+=lacing
+        self._body.append(packet)
+        self.granule+=samples
+        self._pageGranule=self.granule
+        if self.granule-self._pageStart >= self.pageSamples:
+            self._flushPage()
+
+    def _flushPage(self,flags=0):
+        if not self._body and not flags: return
+        granule=self._pageGranule if self._pageGranule is not None else -1
+        self._writePage(self._body,self._segments,granule,flags)
+        self._segments=bytearray()
+        self._body=[]
+        self._pageGranule=None
+        self._pageStart=self.granule
+
+    def _writePage(self,body,segments,granule,flags):
+        header=bytearray(_PAGE_HEADER.pack(b"OggS",0,flags,granule,self.serial,self._pageNumber,0,len(segments)))
+        header+=segments
+        body=b"".join(body)
+        crc=oggCRC(body,oggCRC(header))
+        struct.pack_into("<I",header,22,crc)
+        self.fileobj.write(bytes(header))
+        self.fileobj.write(body)
+        self._pageNumber+=1
+
+    def close(self):
+        """Writes the last page, marked as the end of the stream.  The file is left open"""
+        self._flushPage(_EOS)
+
+
+class OpusRemuxer(object):
+    """
+    Remuxes received Opus voice into one :class:`OggOpusWriter` per speaker
+
+    Give it every voice packet, either from a client::
+
+        class ArchivingClient(MumbleClient.MumbleClient):
+            def VoiceMessageReceived(self,prefix,session,data,TCP=False):
+                self.remuxer.addPacket(prefix,session,data)
+
+    or from a recording, with :meth:`addRecording`.  Packets using another
+    codec are ignored.
+    """
+
+    def __init__(self,opener,**options):
+        """
+        :param opener: Called with a session to get the file object for that
+            speaker's stream; the remuxer closes it when done
+        :param options: Passed on to :class:`OggOpusWriter`
+        """
+        self.opener=opener
+        self.options=options
+        self.writers={}
+
+    def addPacket(self,prefix,session,data,now=None):
+        """
+        Adds a voice packet, in the form VoiceMessageReceived is given it
+
+        :param float now: The time it was received, if known
+        """
+        if not isinstance(prefix,int): prefix=struct.unpack(">B",prefix)[0]
+        if prefix >> 5 != MumbleVoiceProtocol.OPUS: return
+        sequence,frames,terminator,position=MumbleVoiceProtocol.getAudioFrames(data,MumbleVoiceProtocol.OPUS)
+        if not frames: return
+        offset,length=frames[0]
+        writer=self.writers.get(session)
+        if writer is None:
+            writer=self.writers[session]=OggOpusWriter(self.opener(session),serial=session,**self.options)
+        writer.writePacket(sequence,memoryview(data)[offset:offset+length],now)
+
+    def addRecording(self,reader,start=None,end=None):
+        """Adds the packets from a :class:`MumbleRecorder.Reader`"""
+        for packet in reader.packets(start,end):
+            self.addPacket(packet.prefix,packet.session,packet.payload,packet.time)
+
+    def endSession(self,session):
+        """Finishes and closes a speaker's stream, if there is one"""
+        writer=self.writers.pop(session,None)
+        if writer is not None:
+            writer.close()
+            writer.fileobj.close()
+
+    def close(self):
+        """Finishes and closes every stream"""
+        for session in list(self.writers):
+            self.endSession(session)
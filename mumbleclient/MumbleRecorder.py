@@ -0,0 +1,240 @@
+import bisect
+import collections
+import mmap
+import struct
+import time
+
+from . import MumbleVoiceProtocol
+
+_MAGIC=b"MUMBLREC"
+_INDEX_MAGIC=b"MUMBLIDX"
+# magic, version, index interval in seconds
+_HEADER=struct.Struct("<8sHxxd")
+# receive time, session, header byte, payload length
+_RECORD=struct.Struct("<dIBH")
+_INDEX_ENTRY=struct.Struct("<dQ")
+# index offset, index entries, magic
+_TRAILER=struct.Struct("<QQ8s")
+
+
+class RecordedPacket(collections.namedtuple("RecordedPacket","time session prefix payload")):
+    """
+    A voice packet read back from a recording
+
+    .prefix is the header byte as a one-byte string and .payload everything
+    after the session, as passed to VoiceMessageReceived.
+    """
+
+    __slots__=()
+
+    @property
+    def codec(self):
+        return struct.unpack(">B",self.prefix)[0] >> 5
+
+    def relayData(self):
+        """Returns the packet in the form a client sends it"""
+        return self.prefix+self.payload
+
+
+class Recorder(object):
+    """
+    Appends received voice packets to a recording
+
+    A recording is a header, then one record per packet (receive time,
+    session, header byte, payload length and payload), then an index of
+    (time, offset) pairs, one every .interval seconds of recording, which
+    :class:`Reader` uses to start reading from any time without scanning
+    everything before it.  The index is written by :meth:`close`; a
+    recording that was never closed can still be read, but is scanned once
+    when opened.
+
+    Only audio is recorded: PING packets, which have no session, are
+    skipped.  Records are collected in memory and written bufferSize bytes
+    at a time.  To record everything a client hears::
+
+        class RecordingClient(MumbleClient.MumbleClient):
+            def VoicePacketReceived(self,packet,TCP=False):
+                self.recorder.recordPacket(packet)
+    """
+
+    def __init__(self,path,interval=1.0,bufferSize=65536):
+        """
+        :param path: The file to write; it is replaced if it exists
+        :param float interval: Seconds of recording between index entries
+        :param int bufferSize: Bytes to collect before writing them out
+        """
+        self.path=path
+        self.interval=interval
+        self.bufferSize=bufferSize
+        # Records are buffered here, so the file itself is not
+        self._file=open(path,"wb",0)
+        self._buffer=bytearray(_HEADER.pack(_MAGIC,1,interval))
+        self._offset=0
+        self._index=[]
+        self._nextIndexTime=None
+
+    def record(self,prefix,session,data,now=None):
+        """
+        Appends a packet, in the form VoiceMessageReceived is given it
+
+        :param prefix: The header byte, as a one-byte string or an int
+        :param int session: The speaker's session; None (a PING packet) is
+            not recorded
+        :param data: The rest of the packet after the session; a str,
+            bytearray or memoryview
+        :param float now: The time it was received, if not now
+        """
+        if not isinstance(prefix,int): prefix=struct.unpack(">B",prefix)[0]
+        if session is None or prefix >> 5 == MumbleVoiceProtocol.PING: return
+        if now is None: now=time.time()
+        length=len(data)
+        if length > 0xFFFF:
+            raise ValueError("Voice packet too long to record: %d bytes" % length)
+        buf=self._buffer
+        if self._nextIndexTime is None or now >= self._nextIndexTime:
+            self._index.append((now,self._offset+len(buf)))
+            self._nextIndexTime=now+self.interval
+        buf.extend(_RECORD.pack(now,session,prefix,length))
+        buf.extend(data)
+        if len(buf) >= self.bufferSize: self.flush()
+
+    def recordPacket(self,packet,now=None):
+        """Appends a :class:`MumbleVoiceProtocol.VoicePacket`, unless it is a PING"""
+        # As record(), without converting anything
+        if packet.session is None: return
+        if now is None: now=time.time()
+        raw=packet.raw
+        bodyStart=packet.bodyStart
+        length=len(raw)-bodyStart
+        if length > 0xFFFF:
+            raise ValueError("Voice packet too long to record: %d bytes" % length)
+        buf=self._buffer
+        if self._nextIndexTime is None or now >= self._nextIndexTime:
+            self._index.append((now,self._offset+len(buf)))
+            self._nextIndexTime=now+self.interval
+        buf+=_RECORD.pack(now,packet.session,packet.header,length)
+        buf+=raw[bodyStart:]
+        if len(buf) >= self.bufferSize: self.flush()
+
+    def flush(self):
+        """Writes out any buffered records"""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._offset+=len(self._buffer)
+            self._buffer=bytearray()
+
+    def close(self):
+        """Writes out any buffered records and the index, and closes the file"""
+        if self._file is None: return
+        self.flush()
+        buf=bytearray()
+        for entry in self._index:
+            buf.extend(_INDEX_ENTRY.pack(*entry))
+        buf.extend(_TRAILER.pack(self._offset,len(self._index),_INDEX_MAGIC))
+        self._file.write(buf)
+        self._file.close()
+        self._file=None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+
+class Reader(object):
+    """
+    Reads a recording made by :class:`Recorder`
+
+    The file is memory-mapped, and packets are only read as they are asked
+    for.  Iterating over a reader yields every :class:`RecordedPacket`;
+    :meth:`packets` yields those in a time range, using the index to start
+    close to the first one.
+    """
+
+    def __init__(self,path):
+        self.path=path
+        self._file=open(path,"rb")
+        self._map=mmap.mmap(self._file.fileno(),0,access=mmap.ACCESS_READ)
+        magic,version,self.interval=_HEADER.unpack_from(self._map,0)
+        if magic != _MAGIC or version != 1:
+            self.close()
+            raise ValueError("%s is not a voice recording" % path)
+        self._start=_HEADER.size
+        self._end=len(self._map)
+        index=self._readIndex()
+        if index is None:
+            index=self._scan()
+        self._times=[entry[0] for entry in index]
+        self._offsets=[entry[1] for entry in index]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map=None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+    def __iter__(self):
+        return self.packets()
+
+    @property
+    def startTime(self):
+        """The time the first packet was received, or None if there are none"""
+        return self._times[0] if self._times else None
+
+    def _readIndex(self):
+        if self._end-self._start < _TRAILER.size: return None
+        indexOffset,count,magic=_TRAILER.unpack_from(self._map,self._end-_TRAILER.size)
+        indexStart=indexOffset
+        if magic != _INDEX_MAGIC or indexStart+count*_INDEX_ENTRY.size != self._end-_TRAILER.size:
+            return None
+        self._end=indexStart
+        unpack=_INDEX_ENTRY.unpack_from
+        return [unpack(self._map,indexStart+i*_INDEX_ENTRY.size) for i in range(count)]
+
+    def _scan(self):
+        # No index (the recording was not closed), so build one, and drop
+        # any record cut short
+        index=[]
+        nextTime=None
+        offset=self._start
+        end=self._end
+        unpack=_RECORD.unpack_from
+        while offset+_RECORD.size <= end:
+            when,session,prefix,length=unpack(self._map,offset)
+            if offset+_RECORD.size+length > end: break
+            if nextTime is None or when >= nextTime:
+                index.append((when,offset))
+                nextTime=when+self.interval
+            offset+=_RECORD.size+length
+        self._end=offset
+        return index
+
+    def packets(self,start=None,end=None):
+        """
+        Yields the packets received from start until before end
+
+        :param float start: A time, or None to start at the beginning
+        :param float end: A time, or None to carry on to the end
+        """
+        offset=self._start
+        if start is not None:
+            i=bisect.bisect_right(self._times,start)-1
+            if i >= 0: offset=self._offsets[i]
+        mm=self._map
+        last=self._end
+        unpack=_RECORD.unpack_from
+        prefixes=MumbleVoiceProtocol._PREFIXES
+        while offset < last:
+            when,session,prefix,length=unpack(mm,offset)
+            if end is not None and when >= end: return
+            offset+=_RECORD.size
+            if start is None or when >= start:
+                yield RecordedPacket(when,session,prefixes[prefix],mm[offset:offset+length])
+            offset+=length
@@ -0,0 +1,261 @@
+import mmap
+import os
+import struct
+
+_MAGIC=b"MDLRING1"
+_HEADER=struct.Struct("<8sIIQQQQQ")
+_HEADER_SIZE=64
+# due time, data offset, length, session, next entry in the session, state
+_ENTRY=struct.Struct("<dQIIqI4x")
+_DUE=struct.Struct("<d")
+_NEXT=struct.Struct("<q")
+_STATE=struct.Struct("<I")
+_NEXT_OFFSET=24
+_STATE_OFFSET=32
+
+_QUEUED=1
+_PLAYED=2
+
+
+class RingFile(object):
+    """
+    An append-only ring file holding delayed voice packets, memory-mapped
+
+    The file has a fixed size: a header, an index of fixed-size entries
+    (due time, data offset, length and speaker session) and a ring of packet
+    data.  Packets are appended at the tail; space is reused once every
+    packet before it has been played, which with one delay for all speakers
+    is as soon as it is played.  A packet that does not fit is dropped and
+    counted in .dropped.
+
+    Each speaker's packets are chained together through the index, so no
+    Python object is kept per queued packet: a :class:`RingFileBuffer` is
+    two entry numbers and a count.  How much of the file is in RAM is up to
+    the operating system's page cache.
+
+    Because the index is in the file, the queue survives a restart: opening
+    an existing file recovers the packets it still held, and
+    :meth:`buffer` hands them back to the same session.  Call
+    :meth:`discardUnclaimed` once it is known which sessions are still
+    wanted, or their packets will hold up the ring.
+    """
+
+    def __init__(self,path,dataSize=16*1024*1024,entries=256*1024):
+        """
+        :param path: The file to use.  If it exists, it is reopened with the
+            sizes it was created with
+        :param int dataSize: Bytes of packet data the ring can hold
+        :param int entries: Packets the ring can hold
+        """
+        self.path=path
+        self.dropped=0
+        exists=os.path.exists(path) and os.path.getsize(path) >= _HEADER_SIZE
+        self._file=open(path,"r+b" if exists else "w+b")
+        if exists:
+            header=_HEADER.unpack(self._file.read(_HEADER.size))
+            magic,version,entrySize,dataSize,entries,head,tail,dataTail=header
+            if magic != _MAGIC or version != 1 or entrySize != _ENTRY.size:
+                self._file.close()
+                raise ValueError("%s is not a delay ring file" % path)
+        else:
+            head=tail=dataTail=0
+        self.dataSize=dataSize
+        self.entries=entries
+        self._dataStart=_HEADER_SIZE+entries*_ENTRY.size
+        if not exists:
+            self._file.truncate(self._dataStart+dataSize)
+        self._map=mmap.mmap(self._file.fileno(),self._dataStart+dataSize)
+        self._head=head
+        self._tail=tail
+        self._dataTail=dataTail
+        self._writeHeader()
+        self._recovered={}
+        self._recover()
+
+    def close(self):
+        """Unmaps and closes the file; queued packets stay in it"""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map=None
+
+    def __len__(self):
+        """The number of entries in use, including played ones not yet reused"""
+        return self._tail-self._head
+
+    def buffer(self,session):
+        """
+        Returns a :class:`RingFileBuffer` for a session, holding any of its
+        packets recovered when the file was opened
+        """
+        buffer=RingFileBuffer(self,session)
+        recovered=self._recovered.pop(session,None)
+        if recovered is not None:
+            buffer._first,buffer._last,buffer._count=recovered
+        return buffer
+
+    def recoveredSessions(self):
+        """The sessions with recovered packets not yet claimed by :meth:`buffer`"""
+        return list(self._recovered)
+
+    def discardUnclaimed(self):
+        """Drops the recovered packets of every session not claimed by :meth:`buffer`"""
+        for session in list(self._recovered):
+            first,last,count=self._recovered.pop(session)
+            self._dropChain(first)
+        self._reclaim()
+
+    def _writeHeader(self):
+        _HEADER.pack_into(self._map,0,_MAGIC,1,_ENTRY.size,self.dataSize,self.entries,
+                          self._head,self._tail,self._dataTail)
+
+    def _entryOffset(self,seq):
+        return _HEADER_SIZE+(seq % self.entries)*_ENTRY.size
+
+    def _recover(self):
+        # The chains are rebuilt from the index rather than trusted, since a
+        # link may have been written for an entry the header never counted
+        chains=self._recovered
+        seq=self._head
+        while seq < self._tail:
+            offset=self._entryOffset(seq)
+            due,dataOffset,length,session,next,state=_ENTRY.unpack_from(self._map,offset)
+            if state == _QUEUED:
+                _NEXT.pack_into(self._map,offset+_NEXT_OFFSET,-1)
+                chain=chains.get(session)
+                if chain is None:
+                    chains[session]=(seq,seq,1)
+                else:
+                    _NEXT.pack_into(self._map,self._entryOffset(chain[1])+_NEXT_OFFSET,seq)
+                    chains[session]=(chain[0],seq,chain[2]+1)
+            seq+=1
+        self._reclaim()
+
+    def _append(self,due,data,session):
+        if self._tail-self._head >= self.entries:
+            self.dropped+=1
+            return None
+        if isinstance(data,(bytearray,memoryview)):
+            data=bytes(data)
+        length=len(data)
+        dataTail=self._dataTail
+        pos=dataTail % self.dataSize
+        if pos+length > self.dataSize:
+            # Packets are never split; skip the end of the ring
+            dataTail+=self.dataSize-pos
+            pos=0
+        if dataTail+length-self._dataHead() > self.dataSize:
+            self.dropped+=1
+            return None
+        start=self._dataStart+pos
+        self._map[start:start+length]=data
+        seq=self._tail
+        _ENTRY.pack_into(self._map,self._entryOffset(seq),due,dataTail,length,session,-1,_QUEUED)
+        self._tail=seq+1
+        self._dataTail=dataTail+length
+        self._writeHeader()
+        return seq
+
+    def _dataHead(self):
+        if self._head == self._tail: return self._dataTail
+        return _ENTRY.unpack_from(self._map,self._entryOffset(self._head))[1]
+
+    def _link(self,seq,next):
+        _NEXT.pack_into(self._map,self._entryOffset(seq)+_NEXT_OFFSET,next)
+
+    def _due(self,seq):
+        return _DUE.unpack_from(self._map,self._entryOffset(seq))[0]
+
+    def _take(self,seq):
+        """Marks an entry played, returning its data and the next entry in its chain"""
+        offset=self._entryOffset(seq)
+        due,dataOffset,length,session,next,state=_ENTRY.unpack_from(self._map,offset)
+        start=self._dataStart+dataOffset % self.dataSize
+        data=self._map[start:start+length]
+        _STATE.pack_into(self._map,offset+_STATE_OFFSET,_PLAYED)
+        return data,next
+
+    def _dropChain(self,seq):
+        while seq >= 0:
+            offset=self._entryOffset(seq)
+            _STATE.pack_into(self._map,offset+_STATE_OFFSET,_PLAYED)
+            seq=_NEXT.unpack_from(self._map,offset+_NEXT_OFFSET)[0]
+
+    def _reclaim(self):
+        head=self._head
+        tail=self._tail
+        while head < tail and _STATE.unpack_from(self._map,self._entryOffset(head)+_STATE_OFFSET)[0] != _QUEUED:
+            head+=1
+        if head != self._head:
+            self._head=head
+            self._writeHeader()
+
+
+class RingFileBuffer(object):
+    """
+    One session's packets in a :class:`RingFile`
+
+    A buffer for :class:`MumbleDelayLine.DelayStream`; get one from
+    :meth:`RingFile.buffer`.  Packets are copied into the file as they are
+    queued, and read back out as they are played.
+    """
+
+    def __init__(self,ring,session):
+        self.ring=ring
+        self.session=session
+        self._first=-1
+        self._last=-1
+        self._count=0
+
+    def __len__(self):
+        return self._count
+
+    def append(self,due,data):
+        seq=self.ring._append(due,data,self.session)
+        if seq is None: return
+        if self._count:
+            self.ring._link(self._last,seq)
+        else:
+            self._first=seq
+        self._last=seq
+        self._count+=1
+
+    def headTime(self):
+        """Returns the time the first packet is due, or None if there are none"""
+        if not self._count: return None
+        return self.ring._due(self._first)
+
+    def tailTime(self):
+        """Returns the time the last packet is due, or None if there are none"""
+        if not self._count: return None
+        return self.ring._due(self._last)
+
+    def shift(self,seconds):
+        """
+        Moves the due time of every packet held by seconds
+
+        Recovered packets are due when they were before the restart; this
+        moves them to when they should play now.
+        """
+        seq=self._first
+        for i in range(self._count):
+            offset=self.ring._entryOffset(seq)
+            _DUE.pack_into(self.ring._map,offset,_DUE.unpack_from(self.ring._map,offset)[0]+seconds)
+            seq=_NEXT.unpack_from(self.ring._map,offset+_NEXT_OFFSET)[0]
+
+    def popleft(self):
+        data,next=self.ring._take(self._first)
+        self._count-=1
+        if self._count:
+            self._first=next
+        else:
+            self._first=self._last=-1
+        self.ring._reclaim()
+        return data
+
+    def clear(self):
+        if self._count:
+            self.ring._dropChain(self._first)
+            self._first=self._last=-1
+            self._count=0
+            self.ring._reclaim()
@@ -0,0 +1,594 @@
+import collections
+import hashlib
+import marshal
+import os
+
+try:
+    _text=unicode
+except NameError:
+    # Python 3
+    _text=str
+
+
+class BlobStore(object):
+    """
+    Holds large values (textures, comments, channel descriptions) out of line
+
+    Blobs are keyed by their SHA1 hash, which is also what the server uses to
+    identify them, so users and channels with identical blobs share one copy.
+    A key is reference-counted from the moment a record refers to it, whether
+    or not the blob itself has been received yet, and the blob is discarded
+    when the last reference goes.
+    """
+
+    def __init__(self):
+        self._blobs={}
+
+    @staticmethod
+    def key(data):
+        if isinstance(data,_text): data=data.encode("utf-8")
+        return hashlib.sha1(data).digest()
+
+    def ref(self,key):
+        entry=self._blobs.get(key)
+        if entry is None:
+            self._blobs[key]=[None,1]
+        else:
+            entry[1]+=1
+
+    def unref(self,key):
+        entry=self._blobs.get(key)
+        if entry is None: return
+        entry[1]-=1
+        if entry[1] <= 0: del self._blobs[key]
+
+    def store(self,key,data):
+        """Stores data under key, if anything refers to key"""
+        entry=self._blobs.get(key)
+        if entry is not None: entry[0]=data
+
+    def get(self,key,default=None):
+        entry=self._blobs.get(key)
+        if entry is None or entry[0] is None: return default
+        return entry[0]
+
+    def __contains__(self,key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self._blobs)
+
+
+def _setBlobKey(record,slot,key,blobs,changes=None):
+    old=getattr(record,slot)
+    if old == key: return
+    if key is not None: blobs.ref(key)
+    if old is not None: blobs.unref(old)
+    setattr(record,slot,key)
+    if changes is not None: changes[slot]=(old,key)
+
+
+class ChangeWatchers(object):
+    """
+    Callbacks interested in changes to users or channels
+
+    Each callback is called as callback(record, changes), where changes is a
+    dictionary of field name to (old value, new value) containing only the
+    fields that actually changed.  A callback can be limited to a set of
+    fields, in which case it is not called at all unless one of those
+    fields changed.
+
+    Creation and removal of a record are reported as a change of its id
+    field ("session" for users, "channel_id" for channels) from or to None.
+    """
+
+    def __init__(self):
+        self._all=[]
+        self._byField=collections.defaultdict(list)
+
+    def add(self,callback,fields=None):
+        if fields is None:
+            self._all.append(callback)
+        else:
+            for field in fields: self._byField[field].append(callback)
+
+    def remove(self,callback):
+        if callback in self._all: self._all.remove(callback)
+        for field,callbacks in list(self._byField.items()):
+            if callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks: del self._byField[field]
+
+    def notify(self,record,changes):
+        if not changes: return
+        for callback in self._all: callback(record,changes)
+        if self._byField:
+            called=[]
+            for field in changes:
+                for callback in self._byField.get(field,()):
+                    if callback not in called:
+                        called.append(callback)
+                        callback(record,changes)
+
+
+class User(object):
+    """
+    Stores all information known about a user at this time
+
+    Attributes are named after the fields of the UserState message.  Fields
+    the server has not sent yet are None (or False for flags), except
+    .channel_id, which is 0: the server leaves it out for users in the root
+    channel.  The texture
+    and comment are not stored on the user; look them up in the state's
+    blob store using .texture_hash and .comment_hash
+    """
+
+    __slots__=("session","name","user_id","channel_id","mute","deaf","suppress",
+               "self_mute","self_deaf","priority_speaker","recording",
+               "plugin_context","plugin_identity","hash","comment_hash","texture_hash")
+
+    def __init__(self,session):
+        self.session=session
+        self.name=None
+        self.user_id=None
+        self.channel_id=0
+        self.mute=False
+        self.deaf=False
+        self.suppress=False
+        self.self_mute=False
+        self.self_deaf=False
+        self.priority_speaker=False
+        self.recording=False
+        self.plugin_context=None
+        self.plugin_identity=None
+        self.hash=None
+        self.comment_hash=None
+        self.texture_hash=None
+
+    def apply(self,message,blobs):
+        """
+        Updates this user from a UserState message
+
+        :param message: A UserState message
+        :param blobs: The :class:`BlobStore` to keep the texture and comment in
+        :return: A dictionary of field name to (old value, new value) for
+            each field that changed.  A new texture or comment is reported
+            as a change to texture_hash or comment_hash
+        """
+        changes={}
+        has=message.HasField
+        for name in _USER_SIMPLE_FIELDS:
+            if has(name):
+                value=getattr(message,name)
+                old=getattr(self,name)
+                if old != value:
+                    setattr(self,name,value)
+                    changes[name]=(old,value)
+        for blob,slot in (("texture","texture_hash"),("comment","comment_hash")):
+            if has(blob):
+                value=getattr(message,blob)
+                if value:
+                    key=BlobStore.key(value)
+                    _setBlobKey(self,slot,key,blobs,changes)
+                    blobs.store(key,value)
+                else:
+                    _setBlobKey(self,slot,None,blobs,changes)
+            elif has(slot):
+                _setBlobKey(self,slot,getattr(message,slot) or None,blobs,changes)
+        return changes
+
+    def release(self,blobs):
+        """Drops this user's references to blobs; called when the user is removed"""
+        _setBlobKey(self,"texture_hash",None,blobs)
+        _setBlobKey(self,"comment_hash",None,blobs)
+
+# The UserState fields stored as they are, in User.__slots__ order
+_USER_SIMPLE_FIELDS=("name","user_id","channel_id","mute","deaf","suppress",
+                     "self_mute","self_deaf","priority_speaker","recording",
+                     "plugin_context","plugin_identity","hash")
+
+
+class Channel(object):
+    """
+    Stores all information known about a channel at this time
+
+    Attributes are named after the fields of the ChannelState message, except
+    that .links is a set.  The description is kept in the state's blob store
+    under .description_hash
+    """
+
+    __slots__=("channel_id","parent","name","links","temporary","position","description_hash")
+
+    def __init__(self,channel_id):
+        self.channel_id=channel_id
+        self.parent=None
+        self.name=None
+        self.links=set()
+        self.temporary=False
+        self.position=0
+        self.description_hash=None
+
+    def apply(self,message,blobs):
+        """
+        Updates this channel from a ChannelState message
+
+        :param message: A ChannelState message
+        :param blobs: The :class:`BlobStore` to keep the description in
+        :return: A dictionary of field name to (old value, new value) for
+            each field that changed.  Any change to links is reported under
+            "links", and a new description as a change to description_hash
+        """
+        changes={}
+        has=message.HasField
+        for name in _CHANNEL_SIMPLE_FIELDS:
+            if has(name):
+                value=getattr(message,name)
+                old=getattr(self,name)
+                if old != value:
+                    setattr(self,name,value)
+                    changes[name]=(old,value)
+        oldLinks=None
+        if message.links or message.links_add or message.links_remove:
+            oldLinks=frozenset(self.links)
+            if message.links: self.links=set(message.links)
+            self.links.update(message.links_add)
+            self.links.difference_update(message.links_remove)
+        if has("description"):
+            value=message.description
+            if value:
+                key=BlobStore.key(value)
+                _setBlobKey(self,"description_hash",key,blobs,changes)
+                blobs.store(key,value)
+            else:
+                _setBlobKey(self,"description_hash",None,blobs,changes)
+        elif has("description_hash"):
+            _setBlobKey(self,"description_hash",message.description_hash or None,blobs,changes)
+        if oldLinks is not None and oldLinks != self.links:
+            changes["links"]=(oldLinks,frozenset(self.links))
+        return changes
+
+    def release(self,blobs):
+        """Drops this channel's references to blobs; called when the channel is removed"""
+        _setBlobKey(self,"description_hash",None,blobs)
+
+# The ChannelState fields stored as they are, in Channel.__slots__ order
+_CHANNEL_SIMPLE_FIELDS=("parent","name","temporary","position")
+
+
+def _differences(old,new):
+    changes={}
+    for slot in type(new).__slots__:
+        a=getattr(old,slot)
+        b=getattr(new,slot)
+        if a != b:
+            if isinstance(b,set): a,b=frozenset(a),frozenset(b)
+            changes[slot]=(a,b)
+    return changes
+
+_SNAPSHOT_VERSION=1
+
+
+class MumbleState(object):
+    """
+    Everything a client knows about the server it is connected to
+
+    .users      A dictionary of session to :class:`User`
+    .channels   A dictionary of channel id to :class:`Channel`
+    .blobs      A :class:`BlobStore` of textures, comments and descriptions
+
+    The channel tree is indexed by parent, by path and by name, users are
+    indexed by name, registered user id and channel, so the lookup methods
+    below do not need to scan the users or channels.  A channel's path is
+    the tuple of channel names leading to it from (but not including) the
+    root channel.
+
+    The state can be saved to and loaded from a snapshot file.  A loaded
+    state can be answered from straight away, and is reconciled with the
+    server's own by calling :meth:`beginResync` before the server's initial
+    sync and :meth:`endResync` at ServerSync.
+    """
+
+    def __init__(self):
+        self.users={}
+        self.channels={}
+        self.blobs=BlobStore()
+        self._children=collections.defaultdict(set)
+        self._channelUsers=collections.defaultdict(set)
+        self._channelNames=collections.defaultdict(set)
+        self._paths={}
+        self._channelPaths={}
+        self._userNames={}
+        self._userIds={}
+        self._unseenUsers=set()
+        self._unseenChannels=set()
+        self.codecVersion=None
+
+    def updateUser(self,message):
+        """
+        Applies a UserState message
+
+        :return: A tuple of the :class:`User` and a dictionary of the
+            fields that changed, as described in :class:`ChangeWatchers`
+        """
+        user=old=self.users.get(message.session)
+        new=user is None
+        stale=not new and message.session in self._unseenUsers
+        if new or stale:
+            user=self.users[message.session]=User(message.session)
+        if stale:
+            oldChannel,oldName,oldUserId=old.channel_id,old.name,old.user_id
+        else:
+            oldChannel,oldName,oldUserId=user.channel_id,user.name,user.user_id
+        changes=user.apply(message,self.blobs)
+        if new:
+            changes["session"]=(None,user.session)
+            changes["channel_id"]=(None,user.channel_id)
+        elif stale:
+            # The server sends everything about a user during its initial
+            # sync, so a stale record is replaced rather than updated
+            self._unseenUsers.discard(user.session)
+            changes=_differences(old,user)
+            old.release(self.blobs)
+        if new or user.channel_id != oldChannel:
+            if not new: self._discard(self._channelUsers,oldChannel,user.session)
+            self._channelUsers[user.channel_id].add(user.session)
+        if user.name != oldName:
+            if self._userNames.get(oldName) == user.session: del self._userNames[oldName]
+            self._userNames[user.name]=user.session
+        if user.user_id != oldUserId:
+            if self._userIds.get(oldUserId) == user.session: del self._userIds[oldUserId]
+            self._userIds[user.user_id]=user.session
+        return user,changes
+
+    def removeUser(self,session):
+        """Forgets a user, returning the :class:`User` or None if it was unknown"""
+        user=self.users.pop(session,None)
+        if user is not None:
+            user.release(self.blobs)
+            self._discard(self._channelUsers,user.channel_id,session)
+            if self._userNames.get(user.name) == session: del self._userNames[user.name]
+            if self._userIds.get(user.user_id) == session: del self._userIds[user.user_id]
+        return user
+
+    def userByName(self,name):
+        """Returns the connected :class:`User` with the given name, or None"""
+        session=self._userNames.get(name)
+        return None if session is None else self.users[session]
+
+    def userByUserId(self,user_id):
+        """Returns the connected :class:`User` with the given registered user id, or None"""
+        session=self._userIds.get(user_id)
+        return None if session is None else self.users[session]
+
+    def findFreeName(self,template):
+        """
+        Returns a name no connected user has
+
+        If template contains "{n}", it is replaced by "" and then by 0, 1,
+        2... until a free name is found.  Otherwise template itself is tried
+        first, then template with a number appended.
+        """
+        if "{n}" not in template: template+="{n}"
+        name=template.replace("{n}","")
+        i=0
+        while name in self._userNames:
+            name=template.replace("{n}",str(i))
+            i+=1
+        return name
+
+    def updateChannel(self,message):
+        """
+        Applies a ChannelState message
+
+        :return: A tuple of the :class:`Channel` and a dictionary of the
+            fields that changed, as described in :class:`ChangeWatchers`
+        """
+        channel=old=self.channels.get(message.channel_id)
+        new=channel is None
+        stale=not new and message.channel_id in self._unseenChannels
+        if new or stale:
+            channel=self.channels[message.channel_id]=Channel(message.channel_id)
+        if stale:
+            oldParent,oldName=old.parent,old.name
+        else:
+            oldParent,oldName=channel.parent,channel.name
+        changes=channel.apply(message,self.blobs)
+        if new:
+            changes["channel_id"]=(None,channel.channel_id)
+        elif stale:
+            self._unseenChannels.discard(channel.channel_id)
+            changes=_differences(old,channel)
+            old.release(self.blobs)
+        if new or channel.parent != oldParent:
+            if oldParent is not None: self._discard(self._children,oldParent,channel.channel_id)
+            if channel.parent is not None: self._children[channel.parent].add(channel.channel_id)
+        if channel.name != oldName:
+            if oldName is not None: self._discard(self._channelNames,oldName,channel.channel_id)
+            self._channelNames[channel.name].add(channel.channel_id)
+        if new or channel.parent != oldParent or channel.name != oldName:
+            self._indexPaths(channel.channel_id)
+        return channel,changes
+
+    def removeChannel(self,channel_id):
+        """Forgets a channel, returning the :class:`Channel` or None if it was unknown"""
+        channel=self.channels.pop(channel_id,None)
+        if channel is not None:
+            channel.release(self.blobs)
+            if channel.parent is not None: self._discard(self._children,channel.parent,channel_id)
+            if channel.name is not None: self._discard(self._channelNames,channel.name,channel_id)
+            path=self._channelPaths.pop(channel_id,None)
+            if path is not None and self._paths.get(path) == channel_id: del self._paths[path]
+            # The server removes child channels separately, but their paths
+            # are no longer valid
+            self._indexPaths(channel_id)
+        return channel
+
+    def beginResync(self):
+        """
+        Marks every user and channel as stale
+
+        Call this before the server's initial sync when the state already
+        holds users and channels, for example after loading a snapshot or
+        reconnecting.  The first UserState or ChannelState for a stale
+        record replaces it, and :meth:`endResync` removes any the server
+        did not send.
+        """
+        self._unseenUsers=set(self.users)
+        self._unseenChannels=set(self.channels)
+
+    def endResync(self):
+        """
+        Removes the users and channels the server did not send since
+        :meth:`beginResync`
+
+        :return: A tuple of the list of removed :class:`User` and the list
+            of removed :class:`Channel`
+        """
+        users=[self.removeUser(session) for session in self._unseenUsers]
+        channels=[self.removeChannel(id) for id in self._unseenChannels]
+        self._unseenUsers=set()
+        self._unseenChannels=set()
+        return [user for user in users if user is not None],[channel for channel in channels if channel is not None]
+
+    @property
+    def resyncing(self):
+        """True if some users or channels have not been confirmed by the server since :meth:`beginResync`"""
+        return bool(self._unseenUsers or self._unseenChannels)
+
+    def snapshot(self):
+        """
+        Returns the users, channels, blobs and codec version as a string
+        which :meth:`restore` can load
+        """
+        users=[tuple(getattr(user,slot) for slot in User.__slots__) for user in self.users.values()]
+        linksIndex=Channel.__slots__.index("links")
+        channels=[]
+        for channel in self.channels.values():
+            values=[getattr(channel,slot) for slot in Channel.__slots__]
+            values[linksIndex]=tuple(values[linksIndex])
+            channels.append(tuple(values))
+        blobs=[(key,entry[0]) for key,entry in self.blobs._blobs.items() if entry[0] is not None]
+        return marshal.dumps((_SNAPSHOT_VERSION,User.__slots__,Channel.__slots__,users,channels,blobs,self.codecVersion))
+
+    def restore(self,data):
+        """
+        Replaces the users, channels, blobs and codec version with those
+        from a string returned by :meth:`snapshot`
+
+        :raises ValueError: if data is not a snapshot this version can read
+        """
+        try:
+            version,userSlots,channelSlots,users,channels,blobs,codecVersion=marshal.loads(data)
+        except (EOFError,TypeError,ValueError):
+            raise ValueError("Not a state snapshot")
+        if version != _SNAPSHOT_VERSION or userSlots != User.__slots__ or channelSlots != Channel.__slots__:
+            raise ValueError("Unsupported state snapshot version")
+        self.__init__()
+        for values in users:
+            user=User(None)
+            for slot,value in zip(User.__slots__,values): setattr(user,slot,value)
+            if user.channel_id is None: user.channel_id=0
+            self.users[user.session]=user
+            self._indexUser(user)
+        for values in channels:
+            channel=Channel(None)
+            for slot,value in zip(Channel.__slots__,values): setattr(channel,slot,value)
+            channel.links=set(channel.links)
+            self.channels[channel.channel_id]=channel
+            if channel.parent is not None: self._children[channel.parent].add(channel.channel_id)
+            if channel.name is not None: self._channelNames[channel.name].add(channel.channel_id)
+            if channel.description_hash is not None: self.blobs.ref(channel.description_hash)
+        for channel in self.channels.values():
+            if channel.parent is None: self._indexPaths(channel.channel_id)
+        for key,data in blobs: self.blobs.store(key,data)
+        self.codecVersion=codecVersion
+
+    def save(self,path):
+        """Writes a snapshot to a file, replacing it atomically"""
+        temporary=path+".tmp"
+        with open(temporary,"wb") as f:
+            f.write(self.snapshot())
+        os.rename(temporary,path)
+
+    def load(self,path):
+        """
+        Restores a snapshot written by :meth:`save`
+
+        :raises IOError: if the file cannot be read
+        :raises ValueError: if it is not a usable snapshot
+        """
+        with open(path,"rb") as f:
+            self.restore(f.read())
+
+    def _indexUser(self,user):
+        self._channelUsers[user.channel_id].add(user.session)
+        if user.name is not None: self._userNames[user.name]=user.session
+        if user.user_id is not None: self._userIds[user.user_id]=user.session
+        if user.texture_hash is not None: self.blobs.ref(user.texture_hash)
+        if user.comment_hash is not None: self.blobs.ref(user.comment_hash)
+
+    @staticmethod
+    def _discard(index,key,value):
+        values=index.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values: del index[key]
+
+    def _indexPaths(self,channel_id):
+        # Recomputes the path of a channel and all channels below it
+        stack=[channel_id]
+        while stack:
+            id=stack.pop()
+            oldPath=self._channelPaths.pop(id,None)
+            if oldPath is not None and self._paths.get(oldPath) == id: del self._paths[oldPath]
+            channel=self.channels.get(id)
+            if channel is not None:
+                if channel.parent is None:
+                    path=()
+                else:
+                    parentPath=self._channelPaths.get(channel.parent)
+                    path=None if parentPath is None else parentPath+(channel.name,)
+                if path is not None:
+                    self._channelPaths[id]=path
+                    self._paths[path]=id
+            stack.extend(self._children.get(id,()))
+
+    def channelPath(self,channel_id):
+        """Returns the path of a channel as a tuple of names, or None if unknown"""
+        return self._channelPaths.get(channel_id)
+
+    def channelByPath(self,path):
+        """
+        Returns the :class:`Channel` at path, or None
+
+        :param path: A tuple of channel names, or a string of them separated by "/"
+        """
+        if not isinstance(path,tuple):
+            path=tuple(name for name in path.split("/") if name)
+        id=self._paths.get(path)
+        return None if id is None else self.channels[id]
+
+    def channelsNamed(self,name):
+        """Returns a list of every :class:`Channel` with the given name"""
+        return [self.channels[id] for id in self._channelNames.get(name,())]
+
+    def findChannel(self,name):
+        """
+        Returns the channel with the given path or, failing that, the given
+        name.  Returns None if there is no such channel, or if the name is
+        not unique.
+        """
+        channel=self.channelByPath(name)
+        if channel is None:
+            ids=self._channelNames.get(name,())
+            if len(ids) == 1:
+                for id in ids: channel=self.channels[id]
+        return channel
+
+    def childChannels(self,channel_id):
+        """Returns the set of ids of the channels directly inside a channel"""
+        return self._children.get(channel_id,frozenset())
+
+    def usersIn(self,channel_id):
+        """Returns the set of sessions of the users in a channel"""
+        return self._channelUsers.get(channel_id,frozenset())
@@ -0,0 +1,153 @@
+import os
+
+from OpenSSL import SSL
+from twisted.internet.interfaces import IOpenSSLClientConnectionCreator
+from twisted.internet.ssl import CertificateOptions
+from zope.interface import implementer
+
+try:
+    from OpenSSL._util import ffi as _ffi, lib as _lib
+except ImportError:
+    _ffi = _lib = None
+
+
+# pyOpenSSL has no public way to serialise a session or to ask whether one
+# was resumed, so those use the OpenSSL bindings underneath it, and only
+# where the parts they need are there
+_CAN_RESUME=hasattr(SSL.Connection,"set_session") and hasattr(SSL.Connection,"get_session")
+_CAN_SERIALISE=(_lib is not None and hasattr(SSL,"Session") and
+                all(hasattr(_lib,name) for name in ("i2d_SSL_SESSION","d2i_SSL_SESSION","SSL_SESSION_free")))
+_CAN_CHECK_REUSE=_lib is not None and hasattr(_lib,"SSL_session_reused")
+
+# OpenSSL only resumes a session under the session id context it was made
+# in, and Twisted picks a random one for each process
+_SESSION_ID_CONTEXT=b"mumbleclient"
+
+
+def _sessionToBytes(session):
+    if not _CAN_SERIALISE: return None
+    try:
+        length = _lib.i2d_SSL_SESSION(session._session,_ffi.NULL)
+        if length <= 0: return None
+        buf = _ffi.new("unsigned char[]",length)
+        _lib.i2d_SSL_SESSION(session._session,_ffi.new("unsigned char **",buf))
+        return _ffi.buffer(buf,length)[:]
+    except (AttributeError,TypeError):
+        return None
+
+
+def _sessionFromBytes(data,context):
+    if not _CAN_SERIALISE: return None
+    try:
+        buf = _ffi.new("unsigned char[]",data)
+        pointer = _lib.d2i_SSL_SESSION(_ffi.NULL,_ffi.new("const unsigned char **",buf),len(data))
+        if pointer == _ffi.NULL: return None
+        session = SSL.Session.__new__(SSL.Session)
+        session._session = _ffi.gc(pointer,_lib.SSL_SESSION_free)
+        # Newer pyOpenSSL only sets a session on a connection with the
+        # context it came from, as recorded by get_session
+        session._context = context
+        return session
+    except (AttributeError,TypeError):
+        return None
+
+
+def sessionReused(connection):
+    """
+    Returns whether an OpenSSL.SSL.Connection resumed a previous session,
+    or None if that cannot be determined
+    """
+    if not _CAN_CHECK_REUSE: return None
+    try:
+        return bool(_lib.SSL_session_reused(connection._ssl))
+    except (AttributeError,TypeError):
+        return None
+
+
+@implementer(IOpenSSLClientConnectionCreator)
+class ResumingCertificateOptions(CertificateOptions):
+    """
+    CertificateOptions which resume TLS sessions
+
+    All connections made with one instance share a single SSL context, and
+    each new connection offers the session from the last successful
+    handshake, so that only the first connection to a server pays for a full
+    handshake.  If sessionCache is the name of a file, the session is also
+    saved there and loaded again in later processes, where the OpenSSL
+    bindings beneath pyOpenSSL allow sessions to be serialised.
+    """
+
+    def __init__(self,sessionCache=None,*args,**kwargs):
+        """
+        :param sessionCache: A filename to keep the TLS session in, or None.
+            Use a different file for each server.
+        Other arguments are passed to CertificateOptions.
+        """
+        CertificateOptions.__init__(self,*args,**kwargs)
+        self.sessionCache=sessionCache
+        self._session=None
+        self._contextConfigured=False
+        if sessionCache is not None and os.path.exists(sessionCache):
+            try:
+                with open(sessionCache,"rb") as f:
+                    self._session=_sessionFromBytes(f.read(),self.getContext())
+            except IOError:
+                pass
+
+    def getContext(self):
+        context = CertificateOptions.getContext(self)
+        if not self._contextConfigured:
+            context.set_session_cache_mode(SSL.SESS_CACHE_CLIENT)
+            context.set_session_id(_SESSION_ID_CONTEXT)
+            context.set_info_callback(self._infoCallback)
+            self._contextConfigured=True
+        return context
+
+    def clientConnectionForTLS(self,tlsProtocol):
+        connection = SSL.Connection(self.getContext(),None)
+        connection.set_app_data(tlsProtocol)
+        if self._session is not None:
+            try:
+                connection.set_session(self._session)
+            except (AttributeError,TypeError,ValueError,SSL.Error):
+                # A session this pyOpenSSL will not take; do a full handshake
+                self._session=None
+        return connection
+
+    def _infoCallback(self,connection,where,ret):
+        # A successful exit follows the handshake and, with TLS 1.3, each
+        # session ticket the server sends after it; keep the latest session
+        if not (where & SSL.SSL_CB_CONNECT_EXIT and ret > 0): return
+        self._session = connection.get_session()
+        self._saveSession()
+
+    def _saveSession(self):
+        if self.sessionCache is None or self._session is None: return
+        data = _sessionToBytes(self._session)
+        if data is None: return
+        temporary = self.sessionCache+".tmp"
+        try:
+            with open(temporary,"wb") as f:
+                f.write(data)
+            os.rename(temporary,self.sessionCache)
+        except (IOError,OSError):
+            pass
+
+
+_sharedOptions={}
+
+def sharedOptions(host,port,sessionCache=None):
+    """
+    Returns the options shared by every client connecting to host and port
+    with default TLS settings: a ResumingCertificateOptions, or plain
+    CertificateOptions if this pyOpenSSL cannot resume sessions
+    """
+    key=(host,port,sessionCache)
+    options=_sharedOptions.get(key)
+    if options is None:
+        if _CAN_RESUME:
+            options=ResumingCertificateOptions(sessionCache)
+        else:
+            options=CertificateOptions()
+        _sharedOptions[key]=options
+    return options
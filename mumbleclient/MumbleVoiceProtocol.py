@@ -1,4 +1,57 @@
-import sys
+import struct
+
+# Codec types, stored in the top three bits of a voice packet's header byte
+CELT_ALPHA=0
+PING=1
+SPEEX=2
+CELT_BETA=3
+OPUS=4
+
+# PDS ("packet data stream") integers are prefixed by a lead byte whose high
+# bits give the total width of the encoding.  The kinds below are looked up
+# once per integer from _PDS_KIND, which is indexed by the lead byte.
+_PDS_7BIT=0
+_PDS_14BIT=1
+_PDS_21BIT=2
+_PDS_28BIT=3
+_PDS_32BIT=4
+_PDS_64BIT=5
+_PDS_NEGATIVE=6
+_PDS_SMALL_NEGATIVE=7
+
+def _buildPDSKindTable():
+    table=[]
+    for v in range(256):
+        if (v & 0x80) == 0x00:
+            table.append(_PDS_7BIT)
+        elif (v & 0xC0) == 0x80:
+            table.append(_PDS_14BIT)
+        elif (v & 0xE0) == 0xC0:
+            table.append(_PDS_21BIT)
+        elif (v & 0xF0) == 0xE0:
+            table.append(_PDS_28BIT)
+        elif (v & 0xFC) == 0xF0:
+            table.append(_PDS_32BIT)
+        elif (v & 0xFC) == 0xF4:
+            table.append(_PDS_64BIT)
+        elif (v & 0xFC) == 0xF8:
+            table.append(_PDS_NEGATIVE)
+        else:
+            table.append(_PDS_SMALL_NEGATIVE)
+    return tuple(table)
+
+_PDS_KIND=_buildPDSKindTable()
+
+# struct.unpack_from works directly on str, bytearray, buffer and memoryview
+# objects, so none of the decoders below need to slice or ord() the input
+_unpackU8=struct.Struct(">B").unpack_from
+_unpackU16=struct.Struct(">H").unpack_from
+_unpackU32=struct.Struct(">I").unpack_from
+_unpackU64=struct.Struct(">Q").unpack_from
+_packU16=struct.Struct(">H").pack_into
+_packU32=struct.Struct(">I").pack_into
+_packU64=struct.Struct(">Q").pack_into
+_POSITION=struct.Struct("<3f")
 
 def decodePDSInt(m,si=0):
     """
@@ -8,57 +61,369 @@ def decodePDSInt(m,si=0):
     and the number of bytes the integer was stored in, as PDS ints can be of
     variable length.  The original starting position plus the length will be
     the start of the next piece of data in the byte sequence
+
+    m can be a str, bytearray, buffer or memoryview; it is never copied.
+    """
+    v = _unpackU8(m,si)[0]
+    kind = _PDS_KIND[v]
+    if kind == _PDS_7BIT:
+        return (v,1)
+    negative = False
+    length = 0
+    if kind == _PDS_NEGATIVE:
+        # A negative number is a marker byte followed by the bitwise inverse
+        si += 1
+        v = _unpackU8(m,si)[0]
+        kind = _PDS_KIND[v]
+        negative = True
+        length = 1
+    if kind == _PDS_7BIT:
+        result,width = v,1
+    elif kind == _PDS_14BIT:
+        result,width = _unpackU16(m,si)[0] & 0x3FFF,2
+    elif kind == _PDS_21BIT:
+        result,width = (v & 0x1F) << 16 | _unpackU16(m,si+1)[0],3
+    elif kind == _PDS_28BIT:
+        result,width = _unpackU32(m,si)[0] & 0x0FFFFFFF,4
+    elif kind == _PDS_32BIT:
+        result,width = _unpackU32(m,si+1)[0],5
+    elif kind == _PDS_64BIT:
+        result,width = _unpackU64(m,si+1)[0],9
+    elif kind == _PDS_SMALL_NEGATIVE:
+        result,width = ~(v & 0x03),1
+    else:
+        raise ValueError("Malformed PDS integer: repeated negative marker at %d" % si)
+    if negative: result = ~result
+    return (result,length+width)
+
+def decodePDSInts(m,si=0,count=None):
+    """
+    Decodes consecutive PDS ints from a single buffer
+
+    Starting at position si, decodes count integers (or, if count is None,
+    integers until the end of the buffer).  Returns a list of the integers
+    and the position immediately after the last one decoded.
+
+    Like :func:`decodePDSInt`, this works on any buffer type without copying.
     """
-    v = ord(m[si])
-    if ((v & 0x80) == 0x00):
-        return ((v & 0x7F),1)
-    elif ((v & 0xC0) == 0x80):
-        return ((v & 0x3F) << 8 | ord(m[si+1]),2)
-    elif ((v & 0xF0) == 0xF0):
-        if ((v & 0xFC) == 0xF0):
-            return (ord(m[si+1]) << 24 | ord(m[si+2]) << 16 | ord(m[si+3]) << 8 | ord(m[si+4]),5)
-        elif ((v & 0xFC) == 0xF4):
-            return (ord(m[si+1]) << 56 | ord(m[si+2]) << 48 | ord(m[si+3]) << 40 | ord(m[si+4]) << 32 | ord(m[si+5]) << 24 | ord(m[si+6]) << 16 | ord(m[si+7]) << 8 | ord(m[si+8]),9)
-        elif ((v & 0xFC) == 0xF8):
-            result,length=decodePDSInt(m,si+1)
-            return(-result,length+1)
-        elif ((v & 0xFC) == 0xFC):
-            return (-(v & 0x03),1)
+    values=[]
+    append=values.append
+    end=len(m)
+    while si < end and (count is None or len(values) < count):
+        v = _unpackU8(m,si)[0]
+        if v < 0x80:
+            # Small positive values are by far the most common, so skip the
+            # call for them
+            append(v)
+            si += 1
         else:
-            print time.strftime("%a, %d %b %Y %H:%M:%S +0000"),"Help Help, out of cheese :("
-            sys.exit(1)
-    elif ((v & 0xF0) == 0xE0):
-        return ((v & 0x0F) << 24 | ord(m[si+1]) << 16 | ord(m[si+2]) << 8 | ord(m[si+3]),4)
-    elif ((v & 0xE0) == 0xC0):
-        return ((v & 0x1F) << 16 | ord(m[si+1]) << 8 | ord(m[si+2]),3)
+            value,length = decodePDSInt(m,si)
+            append(value)
+            si += length
+    if count is not None and len(values) < count:
+        raise ValueError("Buffer ended after %d of %d PDS integers" % (len(values),count))
+    return values,si
+
+def pdsIntLength(value):
+    """
+    Returns the number of bytes :func:`encodePDSInt` will use to store value
+    """
+    length=0
+    if value < 0:
+        value=~value
+        if value <= 0x03: return 1
+        length=1
+    if value < 0x80: return length+1
+    elif value < 0x4000: return length+2
+    elif value < 0x200000: return length+3
+    elif value < 0x10000000: return length+4
+    elif value < 0x100000000: return length+5
+    else: return length+9
+
+def encodePDSInt(value,buf,si=0):
+    """
+    Encodes a PDS int
+    Writes value into the bytearray buf at position si and returns the
+    position immediately after it.  buf must already be large enough; use
+    :func:`pdsIntLength` to find out how many bytes are needed.
+    """
+    if value < 0:
+        value=~value
+        if value <= 0x03:
+            buf[si]=0xFC | value
+            return si+1
+        buf[si]=0xF8
+        si+=1
+    if value < 0x80:
+        buf[si]=value
+        return si+1
+    elif value < 0x4000:
+        _packU16(buf,si,value | 0x8000)
+        return si+2
+    elif value < 0x200000:
+        buf[si]=(value >> 16) | 0xC0
+        _packU16(buf,si+1,value & 0xFFFF)
+        return si+3
+    elif value < 0x10000000:
+        _packU32(buf,si,value | 0xE0000000)
+        return si+4
+    elif value < 0x100000000:
+        buf[si]=0xF0
+        _packU32(buf,si+1,value)
+        return si+5
     else:
-        print time.strftime("%a, %d %b %Y %H:%M:%S +0000"),"out of cheese?"
-        sys.exit(1)
+        buf[si]=0xF4
+        _packU64(buf,si+1,value)
+        return si+9
+
+class VoicePacketBuilder(object):
+    """
+    Assembles outgoing voice packets into a reusable buffer
+
+    A builder is bound to one codec and voice target.  Each call to
+    :meth:`build` writes the header byte, sequence number, frames, optional
+    terminator and optional positional data in one pass, and returns a
+    memoryview of the finished packet.  The view is only valid until the
+    next call to :meth:`build`; call .tobytes() on it if you need to keep it.
+    """
+
+    def __init__(self,codec=OPUS,target=0,size=1024):
+        """
+        :param int codec: One of the codec constants in this module
+        :param int target: The voice target, 0 for normal talking
+        :param int size: Initial size of the packet buffer in bytes
+        """
+        self.codec=codec
+        self.target=target
+        self.buffer=bytearray(size)
+
+    def packetLength(self,sequence,frames,terminator=False,position=None,session=None):
+        """
+        Returns the size in bytes of the packet :meth:`build` would produce
+        """
+        length=1+pdsIntLength(sequence)
+        if session is not None: length+=pdsIntLength(session)
+        if self.codec == OPUS:
+            for frame in frames:
+                frameLen=len(frame)
+                length+=pdsIntLength(frameLen | 0x2000 if terminator else frameLen)+frameLen
+            if not frames and terminator:
+                length+=pdsIntLength(0x2000)
+        else:
+            for frame in frames:
+                length+=1+len(frame)
+            if terminator: length+=1
+        if position is not None: length+=_POSITION.size
+        return length
+
+    def build(self,sequence,frames,terminator=False,position=None,session=None):
+        """
+        Builds a voice packet
+
+        :param int sequence: The sequence number of the first frame
+        :param frames: A list of encoded audio frames.  Opus packets
+            carry exactly one frame (or none, if only signalling the end
+            of a transmission)
+        :param bool terminator: True if this is the last packet of a transmission
+        :param position: An (x,y,z) tuple of floats for positional audio, or None
+        :param session: Only used when building packets in the format the
+            server sends (for example when testing); clients never send it
+        :return: A memoryview of the packet
+        """
+        length=self.packetLength(sequence,frames,terminator,position,session)
+        if length > len(self.buffer):
+            self.buffer=bytearray(max(length,2*len(self.buffer)))
+        buf=self.buffer
+        buf[0]=(self.codec << 5) | self.target
+        si=1
+        if session is not None: si=encodePDSInt(session,buf,si)
+        si=encodePDSInt(sequence,buf,si)
+        if self.codec == OPUS:
+            if len(frames) > 1:
+                raise ValueError("Opus voice packets carry a single frame")
+            if frames:
+                frame=frames[0]
+                frameLen=len(frame)
+                if frameLen > 0x1FFF:
+                    raise ValueError("Opus frame too long: %d bytes" % frameLen)
+                si=encodePDSInt(frameLen | 0x2000 if terminator else frameLen,buf,si)
+                buf[si:si+frameLen]=frame
+                si+=frameLen
+            elif terminator:
+                # An empty frame with only the terminator bit set
+                si=encodePDSInt(0x2000,buf,si)
+        else:
+            last=len(frames)-1
+            for i,frame in enumerate(frames):
+                frameLen=len(frame)
+                if frameLen > 0x7F:
+                    raise ValueError("Frame too long: %d bytes" % frameLen)
+                # The continuation bit is set on every frame but the last;
+                # a terminator is an extra empty frame
+                buf[si]=frameLen | 0x80 if (i < last or terminator) else frameLen
+                buf[si+1:si+1+frameLen]=frame
+                si+=1+frameLen
+            if terminator:
+                buf[si]=0
+                si+=1
+        if position is not None:
+            _POSITION.pack_into(buf,si,*position)
+            si+=_POSITION.size
+        return memoryview(buf)[:si]
+
+# One-byte strings for every possible header byte, so VoicePacket.prefix
+# never has to allocate
+_PREFIXES=tuple(struct.pack(">B",i) for i in range(256))
+
+class VoicePacket(object):
+    """
+    A voice packet as received from the server
+
+    Only the header byte and session are decoded when the packet is created.
+    The sequence number, frames, terminator flag and positional audio are
+    decoded the first time any of them is accessed, and frames are located
+    by offset into the original buffer rather than copied out of it.
+
+    .raw        The packet exactly as received, for relaying to other clients
+    .header     The header byte as an int
+    .codec      The codec type (one of the constants in this module)
+    .target     The voice target
+    .session    The session of the speaker, or None for PING packets
+    .prefix     The header byte as a one-byte string
+    .payload    A memoryview of everything after the session
+    .data       As payload, but a copy as a string
+    .sequence   The sequence number of the first frame
+    .frames     A list of (offset, length) pairs locating frames within .raw
+    .terminator True if this packet ends a transmission
+    .position   An (x,y,z) tuple of floats, or None
+    """
+
+    __slots__=("raw","header","session","bodyStart","_sequence","_frames","_terminator","_position")
+
+    def __init__(self,raw):
+        self.raw=raw
+        self.header=_unpackU8(raw,0)[0]
+        if self.header >> 5 == PING:
+            self.session=None
+            self.bodyStart=1
+        else:
+            self.session,sessLen=decodePDSInt(raw,1)
+            self.bodyStart=1+sessLen
+        self._frames=None
+
+    def _decode(self):
+        self._sequence,self._frames,self._terminator,self._position=getAudioFrames(self.raw,self.header >> 5,self.bodyStart)
+
+    @property
+    def codec(self):
+        return self.header >> 5
+
+    @property
+    def target(self):
+        return self.header & 0x1F
+
+    @property
+    def prefix(self):
+        return _PREFIXES[self.header]
+
+    @property
+    def payload(self):
+        return memoryview(self.raw)[self.bodyStart:]
+
+    @property
+    def data(self):
+        return self.raw[self.bodyStart:]
+
+    @property
+    def sequence(self):
+        if self._frames is None: self._decode()
+        return self._sequence
+
+    @property
+    def frames(self):
+        if self._frames is None: self._decode()
+        return self._frames
+
+    @property
+    def terminator(self):
+        if self._frames is None: self._decode()
+        return self._terminator
+
+    @property
+    def position(self):
+        if self._frames is None: self._decode()
+        return self._position
+
+    def frame(self,i):
+        """
+        Returns a memoryview of frame i
+        """
+        offset,length=self.frames[i]
+        return memoryview(self.raw)[offset:offset+length]
+
+    def relayData(self):
+        """
+        Returns the packet in the form a client sends it (without the
+        session), suitable for passing to MumbleClient.sendVoiceMessage
+        """
+        return self.prefix+self.raw[self.bodyStart:]
 
 def decodeAudioMessage(message):
-    prefix=message[0]
-    session,sessLen=decodePDSInt(message,1)
-    data=message[1+sessLen:]
-    getAudioFrames(data)
-    return prefix,session,data
-
-# Speex/celt only, not OPUS. WIP
-def getAudioFrames(data):
+    """
+    Wraps a voice packet received from the server in a :class:`VoicePacket`
+    """
+    return VoicePacket(message)
+
+def getAudioFrames(data,codec=CELT_ALPHA,si=0):
+    """
+    Decodes the body of a voice packet
+
+    data should contain everything after the header byte and (for packets
+    received from the server) the session; that is, the sequence number,
+    the audio frames and optionally positional audio.  codec is the codec
+    type from the top three bits of the header byte, and si the position
+    in data where the sequence number starts.
+
+    Returns a tuple of (sequence, frames, terminator, position).  frames is
+    a list of (offset, length) pairs locating each audio frame within data,
+    so nothing is copied; terminator is True if this packet ends the
+    transmission and position is an (x,y,z) tuple of floats or None.
+
+    For PING packets the sequence is the timestamp and there are no frames.
+    """
     audioFrames=[]
-    sequence,length = decodePDSInt(data,0)
-    position = length
-    lastPacket=False
-    #print sequence,len(data),position
-    while position < len(data) and not lastPacket:
-        frameLen = ord(data[position])
-        #print frameLen,
-        if frameLen>127:
-            frameLen=frameLen-127
-        else:
-            lastPacket=True
-        #print lastPacket,
-        frame = data[position + 1:position+frameLen+1]
-        audioFrames.append(frame)
-        position = position + 1 + frameLen
-    position=None   #Don't decode that yet, makes my brain hurt
-    return sequence,audioFrames,position
+    terminator=False
+    sequence,length = decodePDSInt(data,si)
+    position = si+length
+    end = len(data)
+    if codec == OPUS:
+        # A single frame, with a PDS int header of the length and a terminator bit
+        header,length = decodePDSInt(data,position)
+        position += length
+        frameLen = header & 0x1FFF
+        terminator = (header & 0x2000) != 0
+        if frameLen:
+            audioFrames.append((position,frameLen))
+        position += frameLen
+    elif codec != PING:
+        # CELT and Speex: a byte header per frame of the length, with the top
+        # bit set if another frame follows.  An empty final frame terminates.
+        while position < end:
+            header = _unpackU8(data,position)[0]
+            position += 1
+            frameLen = header & 0x7F
+            if frameLen:
+                audioFrames.append((position,frameLen))
+            elif not (header & 0x80):
+                terminator = True
+            position += frameLen
+            if not (header & 0x80): break
+    else:
+        return sequence,audioFrames,terminator,None
+    if position > end:
+        raise ValueError("Voice frame runs past end of packet (%d > %d)" % (position,end))
+    if end - position >= _POSITION.size:
+        coordinates = _POSITION.unpack_from(data,position)
+    else:
+        coordinates = None
+    return sequence,audioFrames,terminator,coordinates
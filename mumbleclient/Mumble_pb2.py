@@ -1,1920 +1,2446 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mumbleclient/Mumble.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
 
-from google.protobuf import descriptor
-from google.protobuf import message
-from google.protobuf import reflection
-from google.protobuf import service
-from google.protobuf import service_reflection
-from google.protobuf import descriptor_pb2
+_sym_db = _symbol_database.Default()
 
 
-_REJECT_REJECTTYPE = descriptor.EnumDescriptor(
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='mumbleclient/Mumble.proto',
+  package='MumbleProto',
+  syntax='proto2',
+  serialized_options=b'H\001',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x19mumbleclient/Mumble.proto\x12\x0bMumbleProto\"K\n\x07Version\x12\x0f\n\x07version\x18\x01 \x01(\r\x12\x0f\n\x07release\x18\x02 \x01(\t\x12\n\n\x02os\x18\x03 \x01(\t\x12\x12\n\nos_version\x18\x04 \x01(\t\"\x1b\n\tUDPTunnel\x12\x0e\n\x06packet\x18\x01 \x02(\x0c\"n\n\x0c\x41uthenticate\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0e\n\x06tokens\x18\x03 \x03(\t\x12\x15\n\rcelt_versions\x18\x04 \x03(\x05\x12\x13\n\x04opus\x18\x05 \x01(\x08:\x05\x66\x61lse\"\xd5\x01\n\x04Ping\x12\x11\n\ttimestamp\x18\x01 \x01(\x04\x12\x0c\n\x04good\x18\x02 \x01(\r\x12\x0c\n\x04late\x18\x03 \x01(\r\x12\x0c\n\x04lost\x18\x04 \x01(\r\x12\x0e\n\x06resync\x18\x05 \x01(\r\x12\x13\n\x0budp_packets\x18\x06 \x01(\r\x12\x13\n\x0btcp_packets\x18\x07 \x01(\r\x12\x14\n\x0cudp_ping_avg\x18\x08 \x01(\x02\x12\x14\n\x0cudp_ping_var\x18\t \x01(\x02\x12\x14\n\x0ctcp_ping_avg\x18\n \x01(\x02\x12\x14\n\x0ctcp_ping_var\x18\x0b \x01(\x02\"\xf7\x01\n\x06Reject\x12,\n\x04type\x18\x01 \x01(\x0e\x32\x1e.MumbleProto.Reject.RejectType\x12\x0e\n\x06reason\x18\x02 \x01(\t\"\xae\x01\n\nRejectType\x12\x08\n\x04None\x10\x00\x12\x10\n\x0cWrongVersion\x10\x01\x12\x13\n\x0fInvalidUsername\x10\x02\x12\x0f\n\x0bWrongUserPW\x10\x03\x12\x11\n\rWrongServerPW\x10\x04\x12\x11\n\rUsernameInUse\x10\x05\x12\x0e\n\nServerFull\x10\x06\x12\x11\n\rNoCertificate\x10\x07\x12\x15\n\x11\x41uthenticatorFail\x10\x08\"\x85\x01\n\x0cServerConfig\x12\x15\n\rmax_bandwidth\x18\x01 \x01(\r\x12\x14\n\x0cwelcome_text\x18\x02 \x01(\t\x12\x12\n\nallow_html\x18\x03 \x01(\x08\x12\x16\n\x0emessage_length\x18\x04 \x01(\r\x12\x1c\n\x14image_message_length\x18\x05 \x01(\r\"_\n\nServerSync\x12\x0f\n\x07session\x18\x01 \x01(\r\x12\x15\n\rmax_bandwidth\x18\x02 \x01(\r\x12\x14\n\x0cwelcome_text\x18\x03 \x01(\t\x12\x13\n\x0bpermissions\x18\x04 \x01(\x04\"#\n\rChannelRemove\x12\x12\n\nchannel_id\x18\x01 \x02(\r\"\xd6\x01\n\x0c\x43hannelState\x12\x12\n\nchannel_id\x18\x01 \x01(\r\x12\x0e\n\x06parent\x18\x02 \x01(\r\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\r\n\x05links\x18\x04 \x03(\r\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x11\n\tlinks_add\x18\x06 \x03(\r\x12\x14\n\x0clinks_remove\x18\x07 \x03(\r\x12\x18\n\ttemporary\x18\x08 \x01(\x08:\x05\x66\x61lse\x12\x13\n\x08position\x18\t \x01(\x05:\x01\x30\x12\x18\n\x10\x64\x65scription_hash\x18\n \x01(\x0c\"I\n\nUserRemove\x12\x0f\n\x07session\x18\x01 \x02(\r\x12\r\n\x05\x61\x63tor\x18\x02 \x01(\r\x12\x0e\n\x06reason\x18\x03 \x01(\t\x12\x0b\n\x03\x62\x61n\x18\x04 \x01(\x08\"\xec\x02\n\tUserState\x12\x0f\n\x07session\x18\x01 \x01(\r\x12\r\n\x05\x61\x63tor\x18\x02 \x01(\r\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\r\x12\x12\n\nchannel_id\x18\x05 \x01(\r\x12\x0c\n\x04mute\x18\x06 \x01(\x08\x12\x0c\n\x04\x64\x65\x61\x66\x18\x07 \x01(\x08\x12\x10\n\x08suppress\x18\x08 \x01(\x08\x12\x11\n\tself_mute\x18\t \x01(\x08\x12\x11\n\tself_deaf\x18\n \x01(\x08\x12\x0f\n\x07texture\x18\x0b \x01(\x0c\x12\x16\n\x0eplugin_context\x18\x0c \x01(\x0c\x12\x17\n\x0fplugin_identity\x18\r \x01(\t\x12\x0f\n\x07\x63omment\x18\x0e \x01(\t\x12\x0c\n\x04hash\x18\x0f \x01(\t\x12\x14\n\x0c\x63omment_hash\x18\x10 \x01(\x0c\x12\x14\n\x0ctexture_hash\x18\x11 \x01(\x0c\x12\x18\n\x10priority_speaker\x18\x12 \x01(\x08\x12\x11\n\trecording\x18\x13 \x01(\x08\"\xc4\x01\n\x07\x42\x61nList\x12+\n\x04\x62\x61ns\x18\x01 \x03(\x0b\x32\x1d.MumbleProto.BanList.BanEntry\x12\x14\n\x05query\x18\x02 \x01(\x08:\x05\x66\x61lse\x1av\n\x08\x42\x61nEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x02(\x0c\x12\x0c\n\x04mask\x18\x02 \x02(\r\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04hash\x18\x04 \x01(\t\x12\x0e\n\x06reason\x18\x05 \x01(\t\x12\r\n\x05start\x18\x06 \x01(\t\x12\x10\n\x08\x64uration\x18\x07 \x01(\r\"c\n\x0bTextMessage\x12\r\n\x05\x61\x63tor\x18\x01 \x01(\r\x12\x0f\n\x07session\x18\x02 \x03(\r\x12\x12\n\nchannel_id\x18\x03 \x03(\r\x12\x0f\n\x07tree_id\x18\x04 \x03(\r\x12\x0f\n\x07message\x18\x05 \x02(\t\"\xdf\x02\n\x10PermissionDenied\x12\x12\n\npermission\x18\x01 \x01(\r\x12\x12\n\nchannel_id\x18\x02 \x01(\r\x12\x0f\n\x07session\x18\x03 \x01(\r\x12\x0e\n\x06reason\x18\x04 \x01(\t\x12\x34\n\x04type\x18\x05 \x01(\x0e\x32&.MumbleProto.PermissionDenied.DenyType\x12\x0c\n\x04name\x18\x06 \x01(\t\"\xbd\x01\n\x08\x44\x65nyType\x12\x08\n\x04Text\x10\x00\x12\x0e\n\nPermission\x10\x01\x12\r\n\tSuperUser\x10\x02\x12\x0f\n\x0b\x43hannelName\x10\x03\x12\x0f\n\x0bTextTooLong\x10\x04\x12\x07\n\x03H9K\x10\x05\x12\x14\n\x10TemporaryChannel\x10\x06\x12\x16\n\x12MissingCertificate\x10\x07\x12\x0c\n\x08UserName\x10\x08\x12\x0f\n\x0b\x43hannelFull\x10\t\x12\x10\n\x0cNestingLimit\x10\n\"\xd4\x03\n\x03\x41\x43L\x12\x12\n\nchannel_id\x18\x01 \x02(\r\x12\x1a\n\x0cinherit_acls\x18\x02 \x01(\x08:\x04true\x12*\n\x06groups\x18\x03 \x03(\x0b\x32\x1a.MumbleProto.ACL.ChanGroup\x12&\n\x04\x61\x63ls\x18\x04 \x03(\x0b\x32\x18.MumbleProto.ACL.ChanACL\x12\x14\n\x05query\x18\x05 \x01(\x08:\x05\x66\x61lse\x1a\x9c\x01\n\tChanGroup\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x17\n\tinherited\x18\x02 \x01(\x08:\x04true\x12\x15\n\x07inherit\x18\x03 \x01(\x08:\x04true\x12\x19\n\x0binheritable\x18\x04 \x01(\x08:\x04true\x12\x0b\n\x03\x61\x64\x64\x18\x05 \x03(\r\x12\x0e\n\x06remove\x18\x06 \x03(\r\x12\x19\n\x11inherited_members\x18\x07 \x03(\r\x1a\x93\x01\n\x07\x43hanACL\x12\x18\n\napply_here\x18\x01 \x01(\x08:\x04true\x12\x18\n\napply_subs\x18\x02 \x01(\x08:\x04true\x12\x17\n\tinherited\x18\x03 \x01(\x08:\x04true\x12\x0f\n\x07user_id\x18\x04 \x01(\r\x12\r\n\x05group\x18\x05 \x01(\t\x12\r\n\x05grant\x18\x06 \x01(\r\x12\x0c\n\x04\x64\x65ny\x18\x07 \x01(\r\"(\n\nQueryUsers\x12\x0b\n\x03ids\x18\x01 \x03(\r\x12\r\n\x05names\x18\x02 \x03(\t\"E\n\nCryptSetup\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x14\n\x0c\x63lient_nonce\x18\x02 \x01(\x0c\x12\x14\n\x0cserver_nonce\x18\x03 \x01(\x0c\"\xd3\x01\n\x13\x43ontextActionModify\x12\x0e\n\x06\x61\x63tion\x18\x01 \x02(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\r\x12=\n\toperation\x18\x04 \x01(\x0e\x32*.MumbleProto.ContextActionModify.Operation\",\n\x07\x43ontext\x12\n\n\x06Server\x10\x01\x12\x0b\n\x07\x43hannel\x10\x02\x12\x08\n\x04User\x10\x04\" \n\tOperation\x12\x07\n\x03\x41\x64\x64\x10\x00\x12\n\n\x06Remove\x10\x01\"D\n\rContextAction\x12\x0f\n\x07session\x18\x01 \x01(\r\x12\x12\n\nchannel_id\x18\x02 \x01(\r\x12\x0e\n\x06\x61\x63tion\x18\x03 \x02(\t\"\x85\x01\n\x08UserList\x12)\n\x05users\x18\x01 \x03(\x0b\x32\x1a.MumbleProto.UserList.User\x1aN\n\x04User\x12\x0f\n\x07user_id\x18\x01 \x02(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tlast_seen\x18\x03 \x01(\t\x12\x14\n\x0clast_channel\x18\x04 \x01(\r\"\xb8\x01\n\x0bVoiceTarget\x12\n\n\x02id\x18\x01 \x01(\r\x12\x30\n\x07targets\x18\x02 \x03(\x0b\x32\x1f.MumbleProto.VoiceTarget.Target\x1ak\n\x06Target\x12\x0f\n\x07session\x18\x01 \x03(\r\x12\x12\n\nchannel_id\x18\x02 \x01(\r\x12\r\n\x05group\x18\x03 \x01(\t\x12\x14\n\x05links\x18\x04 \x01(\x08:\x05\x66\x61lse\x12\x17\n\x08\x63hildren\x18\x05 \x01(\x08:\x05\x66\x61lse\"P\n\x0fPermissionQuery\x12\x12\n\nchannel_id\x18\x01 \x01(\r\x12\x13\n\x0bpermissions\x18\x02 \x01(\r\x12\x14\n\x05\x66lush\x18\x03 \x01(\x08:\x05\x66\x61lse\"\\\n\x0c\x43odecVersion\x12\r\n\x05\x61lpha\x18\x01 \x02(\x05\x12\x0c\n\x04\x62\x65ta\x18\x02 \x02(\x05\x12\x1a\n\x0cprefer_alpha\x18\x03 \x02(\x08:\x04true\x12\x13\n\x04opus\x18\x04 \x01(\x08:\x05\x66\x61lse\"\xb8\x04\n\tUserStats\x12\x0f\n\x07session\x18\x01 \x01(\r\x12\x19\n\nstats_only\x18\x02 \x01(\x08:\x05\x66\x61lse\x12\x14\n\x0c\x63\x65rtificates\x18\x03 \x03(\x0c\x12\x31\n\x0b\x66rom_client\x18\x04 \x01(\x0b\x32\x1c.MumbleProto.UserStats.Stats\x12\x31\n\x0b\x66rom_server\x18\x05 \x01(\x0b\x32\x1c.MumbleProto.UserStats.Stats\x12\x13\n\x0budp_packets\x18\x06 \x01(\r\x12\x13\n\x0btcp_packets\x18\x07 \x01(\r\x12\x14\n\x0cudp_ping_avg\x18\x08 \x01(\x02\x12\x14\n\x0cudp_ping_var\x18\t \x01(\x02\x12\x14\n\x0ctcp_ping_avg\x18\n \x01(\x02\x12\x14\n\x0ctcp_ping_var\x18\x0b \x01(\x02\x12%\n\x07version\x18\x0c \x01(\x0b\x32\x14.MumbleProto.Version\x12\x15\n\rcelt_versions\x18\r \x03(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x0e \x01(\x0c\x12\x11\n\tbandwidth\x18\x0f \x01(\r\x12\x12\n\nonlinesecs\x18\x10 \x01(\r\x12\x10\n\x08idlesecs\x18\x11 \x01(\r\x12!\n\x12strong_certificate\x18\x12 \x01(\x08:\x05\x66\x61lse\x12\x13\n\x04opus\x18\x13 \x01(\x08:\x05\x66\x61lse\x1a\x41\n\x05Stats\x12\x0c\n\x04good\x18\x01 \x01(\r\x12\x0c\n\x04late\x18\x02 \x01(\r\x12\x0c\n\x04lost\x18\x03 \x01(\r\x12\x0e\n\x06resync\x18\x04 \x01(\r\"J\n\rSuggestConfig\x12\x0f\n\x07version\x18\x01 \x01(\r\x12\x12\n\npositional\x18\x02 \x01(\x08\x12\x14\n\x0cpush_to_talk\x18\x03 \x01(\x08\"\\\n\x0bRequestBlob\x12\x17\n\x0fsession_texture\x18\x01 \x03(\r\x12\x17\n\x0fsession_comment\x18\x02 \x03(\r\x12\x1b\n\x13\x63hannel_description\x18\x03 \x03(\rB\x02H\x01'
+)
+
+
+
+_REJECT_REJECTTYPE = _descriptor.EnumDescriptor(
   name='RejectType',
   full_name='MumbleProto.Reject.RejectType',
-  filename='RejectType',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
   values=[
-    descriptor.EnumValueDescriptor(
+    _descriptor.EnumValueDescriptor(
       name='None', index=0, number=0,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='WrongVersion', index=1, number=1,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='InvalidUsername', index=2, number=2,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='WrongUserPW', index=3, number=3,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='WrongServerPW', index=4, number=4,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='UsernameInUse', index=5, number=5,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='ServerFull', index=6, number=6,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='NoCertificate', index=7, number=7,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='AuthenticatorFail', index=8, number=8,
-      options=None,
-      type=None),
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
   ],
-  options=None,
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=550,
+  serialized_end=724,
 )
+_sym_db.RegisterEnumDescriptor(_REJECT_REJECTTYPE)
 
-_PERMISSIONDENIED_DENYTYPE = descriptor.EnumDescriptor(
+_PERMISSIONDENIED_DENYTYPE = _descriptor.EnumDescriptor(
   name='DenyType',
   full_name='MumbleProto.PermissionDenied.DenyType',
-  filename='DenyType',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
   values=[
-    descriptor.EnumValueDescriptor(
+    _descriptor.EnumValueDescriptor(
       name='Text', index=0, number=0,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='Permission', index=1, number=1,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='SuperUser', index=2, number=2,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='ChannelName', index=3, number=3,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='TextTooLong', index=4, number=4,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='H9K', index=5, number=5,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='TemporaryChannel', index=6, number=6,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='MissingCertificate', index=7, number=7,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='UserName', index=8, number=8,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='ChannelFull', index=9, number=9,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='NestingLimit', index=10, number=10,
-      options=None,
-      type=None),
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
   ],
-  options=None,
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2118,
+  serialized_end=2307,
 )
+_sym_db.RegisterEnumDescriptor(_PERMISSIONDENIED_DENYTYPE)
 
-_CONTEXTACTIONMODIFY_CONTEXT = descriptor.EnumDescriptor(
+_CONTEXTACTIONMODIFY_CONTEXT = _descriptor.EnumDescriptor(
   name='Context',
   full_name='MumbleProto.ContextActionModify.Context',
-  filename='Context',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
   values=[
-    descriptor.EnumValueDescriptor(
+    _descriptor.EnumValueDescriptor(
       name='Server', index=0, number=1,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='Channel', index=1, number=2,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='User', index=2, number=4,
-      options=None,
-      type=None),
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
   ],
-  options=None,
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3027,
+  serialized_end=3071,
 )
+_sym_db.RegisterEnumDescriptor(_CONTEXTACTIONMODIFY_CONTEXT)
 
-_CONTEXTACTIONMODIFY_OPERATION = descriptor.EnumDescriptor(
+_CONTEXTACTIONMODIFY_OPERATION = _descriptor.EnumDescriptor(
   name='Operation',
   full_name='MumbleProto.ContextActionModify.Operation',
-  filename='Operation',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
   values=[
-    descriptor.EnumValueDescriptor(
+    _descriptor.EnumValueDescriptor(
       name='Add', index=0, number=0,
-      options=None,
-      type=None),
-    descriptor.EnumValueDescriptor(
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
       name='Remove', index=1, number=1,
-      options=None,
-      type=None),
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
   ],
-  options=None,
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3073,
+  serialized_end=3105,
 )
+_sym_db.RegisterEnumDescriptor(_CONTEXTACTIONMODIFY_OPERATION)
 
 
-_VERSION = descriptor.Descriptor(
+_VERSION = _descriptor.Descriptor(
   name='Version',
   full_name='MumbleProto.Version',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='version', full_name='MumbleProto.Version.version', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='release', full_name='MumbleProto.Version.release', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='os', full_name='MumbleProto.Version.os', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='os_version', full_name='MumbleProto.Version.os_version', index=3,
       number=4, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=42,
+  serialized_end=117,
+)
 
 
-_UDPTUNNEL = descriptor.Descriptor(
+_UDPTUNNEL = _descriptor.Descriptor(
   name='UDPTunnel',
   full_name='MumbleProto.UDPTunnel',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='packet', full_name='MumbleProto.UDPTunnel.packet', index=0,
       number=1, type=12, cpp_type=9, label=2,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=119,
+  serialized_end=146,
+)
 
 
-_AUTHENTICATE = descriptor.Descriptor(
+_AUTHENTICATE = _descriptor.Descriptor(
   name='Authenticate',
   full_name='MumbleProto.Authenticate',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='username', full_name='MumbleProto.Authenticate.username', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='password', full_name='MumbleProto.Authenticate.password', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tokens', full_name='MumbleProto.Authenticate.tokens', index=2,
       number=3, type=9, cpp_type=9, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='celt_versions', full_name='MumbleProto.Authenticate.celt_versions', index=3,
       number=4, type=5, cpp_type=1, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='opus', full_name='MumbleProto.Authenticate.opus', index=4,
       number=5, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=148,
+  serialized_end=258,
+)
 
 
-_PING = descriptor.Descriptor(
+_PING = _descriptor.Descriptor(
   name='Ping',
   full_name='MumbleProto.Ping',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='timestamp', full_name='MumbleProto.Ping.timestamp', index=0,
       number=1, type=4, cpp_type=4, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='good', full_name='MumbleProto.Ping.good', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='late', full_name='MumbleProto.Ping.late', index=2,
       number=3, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='lost', full_name='MumbleProto.Ping.lost', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='resync', full_name='MumbleProto.Ping.resync', index=4,
       number=5, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_packets', full_name='MumbleProto.Ping.udp_packets', index=5,
       number=6, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_packets', full_name='MumbleProto.Ping.tcp_packets', index=6,
       number=7, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_ping_avg', full_name='MumbleProto.Ping.udp_ping_avg', index=7,
       number=8, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_ping_var', full_name='MumbleProto.Ping.udp_ping_var', index=8,
       number=9, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_ping_avg', full_name='MumbleProto.Ping.tcp_ping_avg', index=9,
       number=10, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_ping_var', full_name='MumbleProto.Ping.tcp_ping_var', index=10,
       number=11, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=261,
+  serialized_end=474,
+)
 
 
-_REJECT = descriptor.Descriptor(
+_REJECT = _descriptor.Descriptor(
   name='Reject',
   full_name='MumbleProto.Reject',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='type', full_name='MumbleProto.Reject.type', index=0,
       number=1, type=14, cpp_type=8, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='reason', full_name='MumbleProto.Reject.reason', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
     _REJECT_REJECTTYPE,
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=477,
+  serialized_end=724,
+)
 
 
-_SERVERCONFIG = descriptor.Descriptor(
+_SERVERCONFIG = _descriptor.Descriptor(
   name='ServerConfig',
   full_name='MumbleProto.ServerConfig',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='max_bandwidth', full_name='MumbleProto.ServerConfig.max_bandwidth', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='welcome_text', full_name='MumbleProto.ServerConfig.welcome_text', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='allow_html', full_name='MumbleProto.ServerConfig.allow_html', index=2,
       number=3, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='message_length', full_name='MumbleProto.ServerConfig.message_length', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='image_message_length', full_name='MumbleProto.ServerConfig.image_message_length', index=4,
       number=5, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=727,
+  serialized_end=860,
+)
 
 
-_SERVERSYNC = descriptor.Descriptor(
+_SERVERSYNC = _descriptor.Descriptor(
   name='ServerSync',
   full_name='MumbleProto.ServerSync',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.ServerSync.session', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='max_bandwidth', full_name='MumbleProto.ServerSync.max_bandwidth', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='welcome_text', full_name='MumbleProto.ServerSync.welcome_text', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='permissions', full_name='MumbleProto.ServerSync.permissions', index=3,
       number=4, type=4, cpp_type=4, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=862,
+  serialized_end=957,
+)
 
 
-_CHANNELREMOVE = descriptor.Descriptor(
+_CHANNELREMOVE = _descriptor.Descriptor(
   name='ChannelRemove',
   full_name='MumbleProto.ChannelRemove',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.ChannelRemove.channel_id', index=0,
       number=1, type=13, cpp_type=3, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=959,
+  serialized_end=994,
+)
 
 
-_CHANNELSTATE = descriptor.Descriptor(
+_CHANNELSTATE = _descriptor.Descriptor(
   name='ChannelState',
   full_name='MumbleProto.ChannelState',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.ChannelState.channel_id', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='parent', full_name='MumbleProto.ChannelState.parent', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.ChannelState.name', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='links', full_name='MumbleProto.ChannelState.links', index=3,
       number=4, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='description', full_name='MumbleProto.ChannelState.description', index=4,
       number=5, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='links_add', full_name='MumbleProto.ChannelState.links_add', index=5,
       number=6, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='links_remove', full_name='MumbleProto.ChannelState.links_remove', index=6,
       number=7, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='temporary', full_name='MumbleProto.ChannelState.temporary', index=7,
       number=8, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='position', full_name='MumbleProto.ChannelState.position', index=8,
       number=9, type=5, cpp_type=1, label=1,
-      default_value=0,
+      has_default_value=True, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='description_hash', full_name='MumbleProto.ChannelState.description_hash', index=9,
       number=10, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=997,
+  serialized_end=1211,
+)
 
 
-_USERREMOVE = descriptor.Descriptor(
+_USERREMOVE = _descriptor.Descriptor(
   name='UserRemove',
   full_name='MumbleProto.UserRemove',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.UserRemove.session', index=0,
       number=1, type=13, cpp_type=3, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='actor', full_name='MumbleProto.UserRemove.actor', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='reason', full_name='MumbleProto.UserRemove.reason', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='ban', full_name='MumbleProto.UserRemove.ban', index=3,
       number=4, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1213,
+  serialized_end=1286,
+)
 
 
-_USERSTATE = descriptor.Descriptor(
+_USERSTATE = _descriptor.Descriptor(
   name='UserState',
   full_name='MumbleProto.UserState',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.UserState.session', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='actor', full_name='MumbleProto.UserState.actor', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.UserState.name', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='user_id', full_name='MumbleProto.UserState.user_id', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.UserState.channel_id', index=4,
       number=5, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='mute', full_name='MumbleProto.UserState.mute', index=5,
       number=6, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='deaf', full_name='MumbleProto.UserState.deaf', index=6,
       number=7, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='suppress', full_name='MumbleProto.UserState.suppress', index=7,
       number=8, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='self_mute', full_name='MumbleProto.UserState.self_mute', index=8,
       number=9, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='self_deaf', full_name='MumbleProto.UserState.self_deaf', index=9,
       number=10, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='texture', full_name='MumbleProto.UserState.texture', index=10,
       number=11, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='plugin_context', full_name='MumbleProto.UserState.plugin_context', index=11,
       number=12, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='plugin_identity', full_name='MumbleProto.UserState.plugin_identity', index=12,
       number=13, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='comment', full_name='MumbleProto.UserState.comment', index=13,
       number=14, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='hash', full_name='MumbleProto.UserState.hash', index=14,
       number=15, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='comment_hash', full_name='MumbleProto.UserState.comment_hash', index=15,
       number=16, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='texture_hash', full_name='MumbleProto.UserState.texture_hash', index=16,
       number=17, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='priority_speaker', full_name='MumbleProto.UserState.priority_speaker', index=17,
       number=18, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='recording', full_name='MumbleProto.UserState.recording', index=18,
       number=19, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1289,
+  serialized_end=1653,
+)
 
 
-_BANLIST_BANENTRY = descriptor.Descriptor(
+_BANLIST_BANENTRY = _descriptor.Descriptor(
   name='BanEntry',
   full_name='MumbleProto.BanList.BanEntry',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='address', full_name='MumbleProto.BanList.BanEntry.address', index=0,
       number=1, type=12, cpp_type=9, label=2,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='mask', full_name='MumbleProto.BanList.BanEntry.mask', index=1,
       number=2, type=13, cpp_type=3, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.BanList.BanEntry.name', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='hash', full_name='MumbleProto.BanList.BanEntry.hash', index=3,
       number=4, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='reason', full_name='MumbleProto.BanList.BanEntry.reason', index=4,
       number=5, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='start', full_name='MumbleProto.BanList.BanEntry.start', index=5,
       number=6, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='duration', full_name='MumbleProto.BanList.BanEntry.duration', index=6,
       number=7, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1734,
+  serialized_end=1852,
+)
 
-_BANLIST = descriptor.Descriptor(
+_BANLIST = _descriptor.Descriptor(
   name='BanList',
   full_name='MumbleProto.BanList',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='bans', full_name='MumbleProto.BanList.bans', index=0,
       number=1, type=11, cpp_type=10, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='query', full_name='MumbleProto.BanList.query', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[_BANLIST_BANENTRY, ],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1656,
+  serialized_end=1852,
+)
 
 
-_TEXTMESSAGE = descriptor.Descriptor(
+_TEXTMESSAGE = _descriptor.Descriptor(
   name='TextMessage',
   full_name='MumbleProto.TextMessage',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='actor', full_name='MumbleProto.TextMessage.actor', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.TextMessage.session', index=1,
       number=2, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.TextMessage.channel_id', index=2,
       number=3, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tree_id', full_name='MumbleProto.TextMessage.tree_id', index=3,
       number=4, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='message', full_name='MumbleProto.TextMessage.message', index=4,
       number=5, type=9, cpp_type=9, label=2,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1854,
+  serialized_end=1953,
+)
 
 
-_PERMISSIONDENIED = descriptor.Descriptor(
+_PERMISSIONDENIED = _descriptor.Descriptor(
   name='PermissionDenied',
   full_name='MumbleProto.PermissionDenied',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='permission', full_name='MumbleProto.PermissionDenied.permission', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.PermissionDenied.channel_id', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.PermissionDenied.session', index=2,
       number=3, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='reason', full_name='MumbleProto.PermissionDenied.reason', index=3,
       number=4, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='type', full_name='MumbleProto.PermissionDenied.type', index=4,
       number=5, type=14, cpp_type=8, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.PermissionDenied.name', index=5,
       number=6, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
     _PERMISSIONDENIED_DENYTYPE,
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1956,
+  serialized_end=2307,
+)
 
 
-_ACL_CHANGROUP = descriptor.Descriptor(
+_ACL_CHANGROUP = _descriptor.Descriptor(
   name='ChanGroup',
   full_name='MumbleProto.ACL.ChanGroup',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.ACL.ChanGroup.name', index=0,
       number=1, type=9, cpp_type=9, label=2,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inherited', full_name='MumbleProto.ACL.ChanGroup.inherited', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inherit', full_name='MumbleProto.ACL.ChanGroup.inherit', index=2,
       number=3, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inheritable', full_name='MumbleProto.ACL.ChanGroup.inheritable', index=3,
       number=4, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='add', full_name='MumbleProto.ACL.ChanGroup.add', index=4,
       number=5, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='remove', full_name='MumbleProto.ACL.ChanGroup.remove', index=5,
       number=6, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inherited_members', full_name='MumbleProto.ACL.ChanGroup.inherited_members', index=6,
       number=7, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2472,
+  serialized_end=2628,
+)
 
-_ACL_CHANACL = descriptor.Descriptor(
+_ACL_CHANACL = _descriptor.Descriptor(
   name='ChanACL',
   full_name='MumbleProto.ACL.ChanACL',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='apply_here', full_name='MumbleProto.ACL.ChanACL.apply_here', index=0,
       number=1, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='apply_subs', full_name='MumbleProto.ACL.ChanACL.apply_subs', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inherited', full_name='MumbleProto.ACL.ChanACL.inherited', index=2,
       number=3, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='user_id', full_name='MumbleProto.ACL.ChanACL.user_id', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='group', full_name='MumbleProto.ACL.ChanACL.group', index=4,
       number=5, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='grant', full_name='MumbleProto.ACL.ChanACL.grant', index=5,
       number=6, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='deny', full_name='MumbleProto.ACL.ChanACL.deny', index=6,
       number=7, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2631,
+  serialized_end=2778,
+)
 
-_ACL = descriptor.Descriptor(
+_ACL = _descriptor.Descriptor(
   name='ACL',
   full_name='MumbleProto.ACL',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.ACL.channel_id', index=0,
       number=1, type=13, cpp_type=3, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='inherit_acls', full_name='MumbleProto.ACL.inherit_acls', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='groups', full_name='MumbleProto.ACL.groups', index=2,
       number=3, type=11, cpp_type=10, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='acls', full_name='MumbleProto.ACL.acls', index=3,
       number=4, type=11, cpp_type=10, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='query', full_name='MumbleProto.ACL.query', index=4,
       number=5, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[_ACL_CHANGROUP, _ACL_CHANACL, ],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2310,
+  serialized_end=2778,
+)
 
 
-_QUERYUSERS = descriptor.Descriptor(
+_QUERYUSERS = _descriptor.Descriptor(
   name='QueryUsers',
   full_name='MumbleProto.QueryUsers',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='ids', full_name='MumbleProto.QueryUsers.ids', index=0,
       number=1, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='names', full_name='MumbleProto.QueryUsers.names', index=1,
       number=2, type=9, cpp_type=9, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2780,
+  serialized_end=2820,
+)
 
 
-_CRYPTSETUP = descriptor.Descriptor(
+_CRYPTSETUP = _descriptor.Descriptor(
   name='CryptSetup',
   full_name='MumbleProto.CryptSetup',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='key', full_name='MumbleProto.CryptSetup.key', index=0,
       number=1, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='client_nonce', full_name='MumbleProto.CryptSetup.client_nonce', index=1,
       number=2, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='server_nonce', full_name='MumbleProto.CryptSetup.server_nonce', index=2,
       number=3, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2822,
+  serialized_end=2891,
+)
 
 
-_CONTEXTACTIONMODIFY = descriptor.Descriptor(
+_CONTEXTACTIONMODIFY = _descriptor.Descriptor(
   name='ContextActionModify',
   full_name='MumbleProto.ContextActionModify',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='action', full_name='MumbleProto.ContextActionModify.action', index=0,
       number=1, type=9, cpp_type=9, label=2,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='text', full_name='MumbleProto.ContextActionModify.text', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='context', full_name='MumbleProto.ContextActionModify.context', index=2,
       number=3, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='operation', full_name='MumbleProto.ContextActionModify.operation', index=3,
       number=4, type=14, cpp_type=8, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
     _CONTEXTACTIONMODIFY_CONTEXT,
     _CONTEXTACTIONMODIFY_OPERATION,
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2894,
+  serialized_end=3105,
+)
 
 
-_CONTEXTACTION = descriptor.Descriptor(
+_CONTEXTACTION = _descriptor.Descriptor(
   name='ContextAction',
   full_name='MumbleProto.ContextAction',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.ContextAction.session', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.ContextAction.channel_id', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='action', full_name='MumbleProto.ContextAction.action', index=2,
       number=3, type=9, cpp_type=9, label=2,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3107,
+  serialized_end=3175,
+)
 
 
-_USERLIST_USER = descriptor.Descriptor(
+_USERLIST_USER = _descriptor.Descriptor(
   name='User',
   full_name='MumbleProto.UserList.User',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='user_id', full_name='MumbleProto.UserList.User.user_id', index=0,
       number=1, type=13, cpp_type=3, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='name', full_name='MumbleProto.UserList.User.name', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='last_seen', full_name='MumbleProto.UserList.User.last_seen', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='last_channel', full_name='MumbleProto.UserList.User.last_channel', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3233,
+  serialized_end=3311,
+)
 
-_USERLIST = descriptor.Descriptor(
+_USERLIST = _descriptor.Descriptor(
   name='UserList',
   full_name='MumbleProto.UserList',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='users', full_name='MumbleProto.UserList.users', index=0,
       number=1, type=11, cpp_type=10, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[_USERLIST_USER, ],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3178,
+  serialized_end=3311,
+)
 
 
-_VOICETARGET_TARGET = descriptor.Descriptor(
+_VOICETARGET_TARGET = _descriptor.Descriptor(
   name='Target',
   full_name='MumbleProto.VoiceTarget.Target',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.VoiceTarget.Target.session', index=0,
       number=1, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.VoiceTarget.Target.channel_id', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='group', full_name='MumbleProto.VoiceTarget.Target.group', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      default_value=unicode("", "utf-8"),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='links', full_name='MumbleProto.VoiceTarget.Target.links', index=3,
       number=4, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='children', full_name='MumbleProto.VoiceTarget.Target.children', index=4,
       number=5, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3391,
+  serialized_end=3498,
+)
 
-_VOICETARGET = descriptor.Descriptor(
+_VOICETARGET = _descriptor.Descriptor(
   name='VoiceTarget',
   full_name='MumbleProto.VoiceTarget',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='id', full_name='MumbleProto.VoiceTarget.id', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='targets', full_name='MumbleProto.VoiceTarget.targets', index=1,
       number=2, type=11, cpp_type=10, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[_VOICETARGET_TARGET, ],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3314,
+  serialized_end=3498,
+)
 
 
-_PERMISSIONQUERY = descriptor.Descriptor(
+_PERMISSIONQUERY = _descriptor.Descriptor(
   name='PermissionQuery',
   full_name='MumbleProto.PermissionQuery',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='channel_id', full_name='MumbleProto.PermissionQuery.channel_id', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='permissions', full_name='MumbleProto.PermissionQuery.permissions', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='flush', full_name='MumbleProto.PermissionQuery.flush', index=2,
       number=3, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3500,
+  serialized_end=3580,
+)
 
 
-_CODECVERSION = descriptor.Descriptor(
+_CODECVERSION = _descriptor.Descriptor(
   name='CodecVersion',
   full_name='MumbleProto.CodecVersion',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='alpha', full_name='MumbleProto.CodecVersion.alpha', index=0,
       number=1, type=5, cpp_type=1, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='beta', full_name='MumbleProto.CodecVersion.beta', index=1,
       number=2, type=5, cpp_type=1, label=2,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='prefer_alpha', full_name='MumbleProto.CodecVersion.prefer_alpha', index=2,
       number=3, type=8, cpp_type=7, label=2,
-      default_value=True,
+      has_default_value=True, default_value=True,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='opus', full_name='MumbleProto.CodecVersion.opus', index=3,
       number=4, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3582,
+  serialized_end=3674,
+)
 
 
-_USERSTATS_STATS = descriptor.Descriptor(
+_USERSTATS_STATS = _descriptor.Descriptor(
   name='Stats',
   full_name='MumbleProto.UserStats.Stats',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='good', full_name='MumbleProto.UserStats.Stats.good', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='late', full_name='MumbleProto.UserStats.Stats.late', index=1,
       number=2, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='lost', full_name='MumbleProto.UserStats.Stats.lost', index=2,
       number=3, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='resync', full_name='MumbleProto.UserStats.Stats.resync', index=3,
       number=4, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4180,
+  serialized_end=4245,
+)
 
-_USERSTATS = descriptor.Descriptor(
+_USERSTATS = _descriptor.Descriptor(
   name='UserStats',
   full_name='MumbleProto.UserStats',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session', full_name='MumbleProto.UserStats.session', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='stats_only', full_name='MumbleProto.UserStats.stats_only', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='certificates', full_name='MumbleProto.UserStats.certificates', index=2,
       number=3, type=12, cpp_type=9, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='from_client', full_name='MumbleProto.UserStats.from_client', index=3,
       number=4, type=11, cpp_type=10, label=1,
-      default_value=None,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='from_server', full_name='MumbleProto.UserStats.from_server', index=4,
       number=5, type=11, cpp_type=10, label=1,
-      default_value=None,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_packets', full_name='MumbleProto.UserStats.udp_packets', index=5,
       number=6, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_packets', full_name='MumbleProto.UserStats.tcp_packets', index=6,
       number=7, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_ping_avg', full_name='MumbleProto.UserStats.udp_ping_avg', index=7,
       number=8, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='udp_ping_var', full_name='MumbleProto.UserStats.udp_ping_var', index=8,
       number=9, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_ping_avg', full_name='MumbleProto.UserStats.tcp_ping_avg', index=9,
       number=10, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='tcp_ping_var', full_name='MumbleProto.UserStats.tcp_ping_var', index=10,
       number=11, type=2, cpp_type=6, label=1,
-      default_value=0,
+      has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='version', full_name='MumbleProto.UserStats.version', index=11,
       number=12, type=11, cpp_type=10, label=1,
-      default_value=None,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='celt_versions', full_name='MumbleProto.UserStats.celt_versions', index=12,
       number=13, type=5, cpp_type=1, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='address', full_name='MumbleProto.UserStats.address', index=13,
       number=14, type=12, cpp_type=9, label=1,
-      default_value="",
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='bandwidth', full_name='MumbleProto.UserStats.bandwidth', index=14,
       number=15, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='onlinesecs', full_name='MumbleProto.UserStats.onlinesecs', index=15,
       number=16, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='idlesecs', full_name='MumbleProto.UserStats.idlesecs', index=16,
       number=17, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='strong_certificate', full_name='MumbleProto.UserStats.strong_certificate', index=17,
       number=18, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='opus', full_name='MumbleProto.UserStats.opus', index=18,
       number=19, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=True, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[_USERSTATS_STATS, ],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3677,
+  serialized_end=4245,
+)
 
 
-_SUGGESTCONFIG = descriptor.Descriptor(
+_SUGGESTCONFIG = _descriptor.Descriptor(
   name='SuggestConfig',
   full_name='MumbleProto.SuggestConfig',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='version', full_name='MumbleProto.SuggestConfig.version', index=0,
       number=1, type=13, cpp_type=3, label=1,
-      default_value=0,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='positional', full_name='MumbleProto.SuggestConfig.positional', index=1,
       number=2, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='push_to_talk', full_name='MumbleProto.SuggestConfig.push_to_talk', index=2,
       number=3, type=8, cpp_type=7, label=1,
-      default_value=False,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4247,
+  serialized_end=4321,
+)
 
 
-_REQUESTBLOB = descriptor.Descriptor(
+_REQUESTBLOB = _descriptor.Descriptor(
   name='RequestBlob',
   full_name='MumbleProto.RequestBlob',
-  filename='Mumble.proto',
+  filename=None,
+  file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
-    descriptor.FieldDescriptor(
+    _descriptor.FieldDescriptor(
       name='session_texture', full_name='MumbleProto.RequestBlob.session_texture', index=0,
       number=1, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='session_comment', full_name='MumbleProto.RequestBlob.session_comment', index=1,
       number=2, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    descriptor.FieldDescriptor(
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
       name='channel_description', full_name='MumbleProto.RequestBlob.channel_description', index=2,
       number=3, type=13, cpp_type=3, label=3,
-      default_value=[],
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],  # TODO(robinson): Implement.
+  nested_types=[],
   enum_types=[
   ],
-  options=None)
-
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4323,
+  serialized_end=4415,
+)
 
 _REJECT.fields_by_name['type'].enum_type = _REJECT_REJECTTYPE
+_REJECT_REJECTTYPE.containing_type = _REJECT
+_BANLIST_BANENTRY.containing_type = _BANLIST
 _BANLIST.fields_by_name['bans'].message_type = _BANLIST_BANENTRY
 _PERMISSIONDENIED.fields_by_name['type'].enum_type = _PERMISSIONDENIED_DENYTYPE
+_PERMISSIONDENIED_DENYTYPE.containing_type = _PERMISSIONDENIED
+_ACL_CHANGROUP.containing_type = _ACL
+_ACL_CHANACL.containing_type = _ACL
 _ACL.fields_by_name['groups'].message_type = _ACL_CHANGROUP
 _ACL.fields_by_name['acls'].message_type = _ACL_CHANACL
 _CONTEXTACTIONMODIFY.fields_by_name['operation'].enum_type = _CONTEXTACTIONMODIFY_OPERATION
+_CONTEXTACTIONMODIFY_CONTEXT.containing_type = _CONTEXTACTIONMODIFY
+_CONTEXTACTIONMODIFY_OPERATION.containing_type = _CONTEXTACTIONMODIFY
+_USERLIST_USER.containing_type = _USERLIST
 _USERLIST.fields_by_name['users'].message_type = _USERLIST_USER
+_VOICETARGET_TARGET.containing_type = _VOICETARGET
 _VOICETARGET.fields_by_name['targets'].message_type = _VOICETARGET_TARGET
+_USERSTATS_STATS.containing_type = _USERSTATS
 _USERSTATS.fields_by_name['from_client'].message_type = _USERSTATS_STATS
 _USERSTATS.fields_by_name['from_server'].message_type = _USERSTATS_STATS
 _USERSTATS.fields_by_name['version'].message_type = _VERSION
-
-class Version(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _VERSION
-
-class UDPTunnel(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _UDPTUNNEL
-
-class Authenticate(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _AUTHENTICATE
-
-class Ping(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _PING
-
-class Reject(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _REJECT
-
-class ServerConfig(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _SERVERCONFIG
-
-class ServerSync(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _SERVERSYNC
-
-class ChannelRemove(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CHANNELREMOVE
-
-class ChannelState(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CHANNELSTATE
-
-class UserRemove(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _USERREMOVE
-
-class UserState(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _USERSTATE
-
-class BanList(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  
-  class BanEntry(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _BANLIST_BANENTRY
-  DESCRIPTOR = _BANLIST
-
-class TextMessage(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _TEXTMESSAGE
-
-class PermissionDenied(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _PERMISSIONDENIED
-
-class ACL(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  
-  class ChanGroup(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _ACL_CHANGROUP
-  
-  class ChanACL(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _ACL_CHANACL
-  DESCRIPTOR = _ACL
-
-class QueryUsers(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _QUERYUSERS
-
-class CryptSetup(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CRYPTSETUP
-
-class ContextActionModify(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CONTEXTACTIONMODIFY
-
-class ContextAction(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CONTEXTACTION
-
-class UserList(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  
-  class User(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _USERLIST_USER
-  DESCRIPTOR = _USERLIST
-
-class VoiceTarget(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  
-  class Target(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _VOICETARGET_TARGET
-  DESCRIPTOR = _VOICETARGET
-
-class PermissionQuery(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _PERMISSIONQUERY
-
-class CodecVersion(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _CODECVERSION
-
-class UserStats(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  
-  class Stats(message.Message):
-    __metaclass__ = reflection.GeneratedProtocolMessageType
-    DESCRIPTOR = _USERSTATS_STATS
-  DESCRIPTOR = _USERSTATS
-
-class SuggestConfig(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _SUGGESTCONFIG
-
-class RequestBlob(message.Message):
-  __metaclass__ = reflection.GeneratedProtocolMessageType
-  DESCRIPTOR = _REQUESTBLOB
-
+DESCRIPTOR.message_types_by_name['Version'] = _VERSION
+DESCRIPTOR.message_types_by_name['UDPTunnel'] = _UDPTUNNEL
+DESCRIPTOR.message_types_by_name['Authenticate'] = _AUTHENTICATE
+DESCRIPTOR.message_types_by_name['Ping'] = _PING
+DESCRIPTOR.message_types_by_name['Reject'] = _REJECT
+DESCRIPTOR.message_types_by_name['ServerConfig'] = _SERVERCONFIG
+DESCRIPTOR.message_types_by_name['ServerSync'] = _SERVERSYNC
+DESCRIPTOR.message_types_by_name['ChannelRemove'] = _CHANNELREMOVE
+DESCRIPTOR.message_types_by_name['ChannelState'] = _CHANNELSTATE
+DESCRIPTOR.message_types_by_name['UserRemove'] = _USERREMOVE
+DESCRIPTOR.message_types_by_name['UserState'] = _USERSTATE
+DESCRIPTOR.message_types_by_name['BanList'] = _BANLIST
+DESCRIPTOR.message_types_by_name['TextMessage'] = _TEXTMESSAGE
+DESCRIPTOR.message_types_by_name['PermissionDenied'] = _PERMISSIONDENIED
+DESCRIPTOR.message_types_by_name['ACL'] = _ACL
+DESCRIPTOR.message_types_by_name['QueryUsers'] = _QUERYUSERS
+DESCRIPTOR.message_types_by_name['CryptSetup'] = _CRYPTSETUP
+DESCRIPTOR.message_types_by_name['ContextActionModify'] = _CONTEXTACTIONMODIFY
+DESCRIPTOR.message_types_by_name['ContextAction'] = _CONTEXTACTION
+DESCRIPTOR.message_types_by_name['UserList'] = _USERLIST
+DESCRIPTOR.message_types_by_name['VoiceTarget'] = _VOICETARGET
+DESCRIPTOR.message_types_by_name['PermissionQuery'] = _PERMISSIONQUERY
+DESCRIPTOR.message_types_by_name['CodecVersion'] = _CODECVERSION
+DESCRIPTOR.message_types_by_name['UserStats'] = _USERSTATS
+DESCRIPTOR.message_types_by_name['SuggestConfig'] = _SUGGESTCONFIG
+DESCRIPTOR.message_types_by_name['RequestBlob'] = _REQUESTBLOB
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Version = _reflection.GeneratedProtocolMessageType('Version', (_message.Message,), {
+  'DESCRIPTOR' : _VERSION,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.Version)
+  })
+_sym_db.RegisterMessage(Version)
+
+UDPTunnel = _reflection.GeneratedProtocolMessageType('UDPTunnel', (_message.Message,), {
+  'DESCRIPTOR' : _UDPTUNNEL,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.UDPTunnel)
+  })
+_sym_db.RegisterMessage(UDPTunnel)
+
+Authenticate = _reflection.GeneratedProtocolMessageType('Authenticate', (_message.Message,), {
+  'DESCRIPTOR' : _AUTHENTICATE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.Authenticate)
+  })
+_sym_db.RegisterMessage(Authenticate)
+
+Ping = _reflection.GeneratedProtocolMessageType('Ping', (_message.Message,), {
+  'DESCRIPTOR' : _PING,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.Ping)
+  })
+_sym_db.RegisterMessage(Ping)
+
+Reject = _reflection.GeneratedProtocolMessageType('Reject', (_message.Message,), {
+  'DESCRIPTOR' : _REJECT,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.Reject)
+  })
+_sym_db.RegisterMessage(Reject)
+
+ServerConfig = _reflection.GeneratedProtocolMessageType('ServerConfig', (_message.Message,), {
+  'DESCRIPTOR' : _SERVERCONFIG,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ServerConfig)
+  })
+_sym_db.RegisterMessage(ServerConfig)
+
+ServerSync = _reflection.GeneratedProtocolMessageType('ServerSync', (_message.Message,), {
+  'DESCRIPTOR' : _SERVERSYNC,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ServerSync)
+  })
+_sym_db.RegisterMessage(ServerSync)
+
+ChannelRemove = _reflection.GeneratedProtocolMessageType('ChannelRemove', (_message.Message,), {
+  'DESCRIPTOR' : _CHANNELREMOVE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ChannelRemove)
+  })
+_sym_db.RegisterMessage(ChannelRemove)
+
+ChannelState = _reflection.GeneratedProtocolMessageType('ChannelState', (_message.Message,), {
+  'DESCRIPTOR' : _CHANNELSTATE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ChannelState)
+  })
+_sym_db.RegisterMessage(ChannelState)
+
+UserRemove = _reflection.GeneratedProtocolMessageType('UserRemove', (_message.Message,), {
+  'DESCRIPTOR' : _USERREMOVE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.UserRemove)
+  })
+_sym_db.RegisterMessage(UserRemove)
+
+UserState = _reflection.GeneratedProtocolMessageType('UserState', (_message.Message,), {
+  'DESCRIPTOR' : _USERSTATE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.UserState)
+  })
+_sym_db.RegisterMessage(UserState)
+
+BanList = _reflection.GeneratedProtocolMessageType('BanList', (_message.Message,), {
+
+  'BanEntry' : _reflection.GeneratedProtocolMessageType('BanEntry', (_message.Message,), {
+    'DESCRIPTOR' : _BANLIST_BANENTRY,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.BanList.BanEntry)
+    })
+  ,
+  'DESCRIPTOR' : _BANLIST,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.BanList)
+  })
+_sym_db.RegisterMessage(BanList)
+_sym_db.RegisterMessage(BanList.BanEntry)
+
+TextMessage = _reflection.GeneratedProtocolMessageType('TextMessage', (_message.Message,), {
+  'DESCRIPTOR' : _TEXTMESSAGE,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.TextMessage)
+  })
+_sym_db.RegisterMessage(TextMessage)
+
+PermissionDenied = _reflection.GeneratedProtocolMessageType('PermissionDenied', (_message.Message,), {
+  'DESCRIPTOR' : _PERMISSIONDENIED,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.PermissionDenied)
+  })
+_sym_db.RegisterMessage(PermissionDenied)
+
+ACL = _reflection.GeneratedProtocolMessageType('ACL', (_message.Message,), {
+
+  'ChanGroup' : _reflection.GeneratedProtocolMessageType('ChanGroup', (_message.Message,), {
+    'DESCRIPTOR' : _ACL_CHANGROUP,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.ACL.ChanGroup)
+    })
+  ,
+
+  'ChanACL' : _reflection.GeneratedProtocolMessageType('ChanACL', (_message.Message,), {
+    'DESCRIPTOR' : _ACL_CHANACL,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.ACL.ChanACL)
+    })
+  ,
+  'DESCRIPTOR' : _ACL,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ACL)
+  })
+_sym_db.RegisterMessage(ACL)
+_sym_db.RegisterMessage(ACL.ChanGroup)
+_sym_db.RegisterMessage(ACL.ChanACL)
+
+QueryUsers = _reflection.GeneratedProtocolMessageType('QueryUsers', (_message.Message,), {
+  'DESCRIPTOR' : _QUERYUSERS,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.QueryUsers)
+  })
+_sym_db.RegisterMessage(QueryUsers)
+
+CryptSetup = _reflection.GeneratedProtocolMessageType('CryptSetup', (_message.Message,), {
+  'DESCRIPTOR' : _CRYPTSETUP,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.CryptSetup)
+  })
+_sym_db.RegisterMessage(CryptSetup)
+
+ContextActionModify = _reflection.GeneratedProtocolMessageType('ContextActionModify', (_message.Message,), {
+  'DESCRIPTOR' : _CONTEXTACTIONMODIFY,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ContextActionModify)
+  })
+_sym_db.RegisterMessage(ContextActionModify)
+
+ContextAction = _reflection.GeneratedProtocolMessageType('ContextAction', (_message.Message,), {
+  'DESCRIPTOR' : _CONTEXTACTION,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.ContextAction)
+  })
+_sym_db.RegisterMessage(ContextAction)
+
+UserList = _reflection.GeneratedProtocolMessageType('UserList', (_message.Message,), {
+
+  'User' : _reflection.GeneratedProtocolMessageType('User', (_message.Message,), {
+    'DESCRIPTOR' : _USERLIST_USER,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.UserList.User)
+    })
+  ,
+  'DESCRIPTOR' : _USERLIST,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.UserList)
+  })
+_sym_db.RegisterMessage(UserList)
+_sym_db.RegisterMessage(UserList.User)
+
+VoiceTarget = _reflection.GeneratedProtocolMessageType('VoiceTarget', (_message.Message,), {
+
+  'Target' : _reflection.GeneratedProtocolMessageType('Target', (_message.Message,), {
+    'DESCRIPTOR' : _VOICETARGET_TARGET,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.VoiceTarget.Target)
+    })
+  ,
+  'DESCRIPTOR' : _VOICETARGET,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.VoiceTarget)
+  })
+_sym_db.RegisterMessage(VoiceTarget)
+_sym_db.RegisterMessage(VoiceTarget.Target)
+
+PermissionQuery = _reflection.GeneratedProtocolMessageType('PermissionQuery', (_message.Message,), {
+  'DESCRIPTOR' : _PERMISSIONQUERY,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.PermissionQuery)
+  })
+_sym_db.RegisterMessage(PermissionQuery)
+
+CodecVersion = _reflection.GeneratedProtocolMessageType('CodecVersion', (_message.Message,), {
+  'DESCRIPTOR' : _CODECVERSION,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.CodecVersion)
+  })
+_sym_db.RegisterMessage(CodecVersion)
+
+UserStats = _reflection.GeneratedProtocolMessageType('UserStats', (_message.Message,), {
+
+  'Stats' : _reflection.GeneratedProtocolMessageType('Stats', (_message.Message,), {
+    'DESCRIPTOR' : _USERSTATS_STATS,
+    '__module__' : 'mumbleclient.Mumble_pb2'
+    # @@protoc_insertion_point(class_scope:MumbleProto.UserStats.Stats)
+    })
+  ,
+  'DESCRIPTOR' : _USERSTATS,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.UserStats)
+  })
+_sym_db.RegisterMessage(UserStats)
+_sym_db.RegisterMessage(UserStats.Stats)
+
+SuggestConfig = _reflection.GeneratedProtocolMessageType('SuggestConfig', (_message.Message,), {
+  'DESCRIPTOR' : _SUGGESTCONFIG,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.SuggestConfig)
+  })
+_sym_db.RegisterMessage(SuggestConfig)
+
+RequestBlob = _reflection.GeneratedProtocolMessageType('RequestBlob', (_message.Message,), {
+  'DESCRIPTOR' : _REQUESTBLOB,
+  '__module__' : 'mumbleclient.Mumble_pb2'
+  # @@protoc_insertion_point(class_scope:MumbleProto.RequestBlob)
+  })
+_sym_db.RegisterMessage(RequestBlob)
+
+
+DESCRIPTOR._options = None
+# @@protoc_insertion_point(module_scope)
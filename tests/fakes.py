@@ -0,0 +1,36 @@
+class FakeClock(object):
+    """A clock and callLater which only move when told to"""
+
+    def __init__(self,now=1000.0):
+        self.now=now
+        self.calls=[]
+
+    def __call__(self):
+        return self.now
+
+    def callLater(self,delay,f):
+        call=_Call(self.now+delay,f)
+        self.calls.append(call)
+        return call
+
+    def advance(self,seconds):
+        end=self.now+seconds
+        while True:
+            due=[call for call in self.calls if not call.cancelled and call.time <= end]
+            if not due: break
+            call=min(due,key=lambda c: c.time)
+            self.calls.remove(call)
+            self.now=max(self.now,call.time)
+            call.f()
+        self.now=end
+
+
+class _Call(object):
+
+    def __init__(self,time,f):
+        self.time=time
+        self.f=f
+        self.cancelled=False
+
+    def cancel(self):
+        self.cancelled=True
@@ -0,0 +1,135 @@
+import os
+import unittest
+
+try:
+    import asyncio
+    import ssl
+except ImportError:
+    asyncio=None
+
+from mumbleclient import MumbleClientCore
+from mumbleclient import MumbleConnection
+
+if asyncio is not None:
+    from mumbleclient import MumbleAsyncio
+
+from .test_MumbleClientCore import message, serverState
+
+
+CERTIFICATE=os.path.join(os.path.dirname(__file__),"localhost.pem")
+
+_Protocol=asyncio.Protocol if asyncio is not None else object
+
+
+class FakeServer(_Protocol):
+    """Logs in each connection, as session 5 of 5 and 6, and echoes text messages"""
+
+    def __init__(self,connections):
+        self.connections=connections
+        self.connection=MumbleConnection.MumbleConnection()
+
+    def connection_made(self,transport):
+        self.transport=transport
+        self.connections.append(self)
+
+    def data_received(self,data):
+        for event in self.connection.receiveData(data):
+            if event.name == "Authenticate":
+                for reply in serverState(5,6): self.connection.sendMessage(reply)
+            elif event.name == "TextMessage":
+                self.connection.sendMessage(message(MumbleConnection.TextMessage,actor=5,
+                                                    message=event.message.message))
+        self.transport.writelines(self.connection.dataToSend())
+
+
+if asyncio is not None:
+    class RecordingClient(MumbleAsyncio.AsyncioMumbleClient):
+
+        def __init__(self,settings,loop):
+            MumbleAsyncio.AsyncioMumbleClient.__init__(self,settings,loop)
+            self.recovered=loop.create_future()
+
+        def connectionRecovered(self,recoveryTime):
+            self.recovered.set_result(recoveryTime)
+
+
+@unittest.skipIf(asyncio is None,"asyncio needs Python 3")
+class AsyncioClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop=asyncio.new_event_loop()
+        context=ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(CERTIFICATE)
+        self.connections=[]
+        self.server=self.complete(self.loop.create_server(lambda: FakeServer(self.connections),
+                                                     "127.0.0.1",0,ssl=context))
+        self.settings=MumbleClientCore.MumbleSettings()
+        self.settings.host="127.0.0.1"
+        self.settings.port=self.server.sockets[0].getsockname()[1]
+        self.settings.pingInterval=None
+        # Cleanups run last first, so after those of the clients
+        self.addCleanup(self.stopServer)
+
+    def stopServer(self):
+        for connection in self.connections: connection.transport.close()
+        self.server.close()
+        self.complete(self.server.wait_closed())
+        # Let the transports finish closing
+        self.complete(asyncio.sleep(0.01))
+        self.loop.close()
+
+    def complete(self,awaitable,timeout=5.0):
+        return self.loop.run_until_complete(asyncio.wait_for(awaitable,timeout))
+
+    def connect(self):
+        client=RecordingClient(self.settings,self.loop)
+        self.complete(client.connect())
+        self.complete(client.sync())
+        self.addCleanup(self.disconnect,client)
+        return client
+
+    def disconnect(self,client):
+        self.complete(client.disconnect())
+
+    def say(self,client,text):
+        client.sendMessage(message(MumbleConnection.TextMessage,message=text))
+
+    def test_sync(self):
+        client=self.connect()
+        self.assertEqual(client.sessionID,5)
+        self.assertEqual(sorted(client.state.users),[5,6])
+
+    def test_waitFor(self):
+        client=self.connect()
+        waiting=client.waitFor(MumbleConnection.TextMessage,lambda message: message.message == u"two")
+        self.say(client,u"one")
+        self.say(client,u"two")
+        self.assertEqual(self.complete(waiting).message,u"two")
+
+    def test_waitForTimeout(self):
+        client=self.connect()
+        self.assertRaises(asyncio.TimeoutError,self.complete,client.waitFor(MumbleConnection.TextMessage,timeout=0.05))
+        self.assertIsNone(client._waiters[MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[MumbleConnection.TextMessage]])
+
+    def test_waitForCancelled(self):
+        client=self.connect()
+        waiting=client.waitFor(MumbleConnection.TextMessage)
+        waiting.cancel()
+        self.say(client,u"one")
+        self.complete(client.waitFor(MumbleConnection.TextMessage))
+        self.assertTrue(waiting.cancelled())
+
+    def test_disconnect(self):
+        client=self.connect()
+        self.complete(client.disconnect())
+        self.assertTrue(client.clientDisconnected.done())
+        self.assertIsNone(client._transport)
+
+    def test_reconnect(self):
+        self.settings.reconnect=MumbleClientCore.ReconnectPolicy(initialDelay=0.01,jitter=0.0)
+        client=self.connect()
+        self.connections[0].transport.abort()
+        self.assertGreaterEqual(self.complete(client.recovered),0)
+        self.assertEqual(len(self.connections),2)
+        self.assertEqual(client.sessionID,5)
+        self.assertFalse(client.clientDisconnected.done())
@@ -0,0 +1,456 @@
+import unittest
+
+from google.protobuf.message import DecodeError
+
+from mumbleclient import MumbleClientCore
+from mumbleclient import MumbleConnection
+from mumbleclient import MumbleJitterBuffer
+from mumbleclient import MumbleState
+from mumbleclient import MumbleVoiceProtocol
+
+from .fakes import FakeClock
+
+
+def message(messageType,**fields):
+    message=messageType()
+    for name,value in fields.items(): setattr(message,name,value)
+    return message
+
+
+def frame(*messages):
+    connection=MumbleConnection.MumbleConnection()
+    for message in messages: connection.sendMessage(message)
+    return b"".join(connection.dataToSend())
+
+
+class FakeAdapter(MumbleClientCore.MumbleClientCore):
+    """The I/O a client core needs, with no sockets and a fake clock"""
+
+    def __init__(self,settings=None,clock=None):
+        self.clock=clock if clock is not None else FakeClock()
+        self.written=[]
+        self.opened=0
+        self.closed=0
+        self.connected=0
+        self.disconnected=[]
+        self.initialStates=[]
+        self.recoveries=[]
+        self.voice=[]
+        self.unknown=[]
+        MumbleClientCore.MumbleClientCore.__init__(self,settings)
+
+    def serverSends(self,*messages):
+        self._dataReceived(frame(*messages))
+
+    def serverSendsVoice(self,session,sequence):
+        connection=MumbleConnection.MumbleConnection()
+        builder=MumbleVoiceProtocol.VoicePacketBuilder()
+        connection.sendVoiceMessage(builder.build(sequence,[b"frame"],session=session))
+        self._dataReceived(b"".join(connection.dataToSend()))
+
+    def sentNames(self):
+        events=MumbleConnection.MumbleConnection().receiveData(b"".join(self.written))
+        return [event.name for event in events]
+
+    def _callLater(self,delay,f):
+        return self.clock.callLater(delay,f)
+
+    def _dataQueued(self):
+        self.written.extend(self.connection.dataToSend())
+
+    def flush(self):
+        self._dataQueued()
+
+    def _openConnection(self):
+        self.opened+=1
+
+    def _closeConnection(self):
+        self.closed+=1
+
+    def _fireConnected(self):
+        self.connected+=1
+
+    def _fireDisconnected(self,reason):
+        self.disconnected.append(reason)
+
+    def initialStateReady(self,removedUsers,removedChannels):
+        self.initialStates.append(([user.session for user in removedUsers],
+                                   [channel.channel_id for channel in removedChannels]))
+
+    def connectionRecovered(self,recoveryTime):
+        self.recoveries.append(recoveryTime)
+
+    def VoicePacketReceived(self,packet,TCP=False):
+        self.voice.append((packet.session,packet.sequence))
+
+    def _unknownMessageReceived(self,type,data):
+        self.unknown.append((type,data))
+
+
+def settings(**values):
+    settings=MumbleClientCore.MumbleSettings()
+    settings.pingInterval=None
+    for name,value in values.items(): setattr(settings,name,value)
+    return settings
+
+
+def serverState(*sessions):
+    messages=[message(MumbleConnection.ChannelState,channel_id=0,name="Root")]
+    for session in sessions:
+        messages.append(message(MumbleConnection.UserState,session=session,name="user%d" % session))
+    messages.append(message(MumbleConnection.ServerSync,session=sessions[0]))
+    return messages
+
+
+class CoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client=FakeAdapter(settings(pingInterval=5.0))
+        self.client._connectionMade()
+
+    def test_login(self):
+        self.assertEqual(self.client.sentNames(),["Version","Authenticate","CodecVersion"])
+        self.client.serverSends(*serverState(5,6))
+        self.assertEqual(self.client.connected,1)
+        self.assertEqual(self.client.sessionID,5)
+        self.assertEqual(sorted(self.client.state.users),[5,6])
+
+    def test_pings(self):
+        self.client.clock.advance(4.9)
+        self.assertEqual(self.client.sentNames()[3:],[])
+        self.client.clock.advance(5.1)
+        self.assertEqual(self.client.sentNames()[3:],["Ping","Ping"])
+        self.client._connectionLost("lost")
+        self.client.clock.advance(60)
+        self.assertEqual(self.client.sentNames()[3:],["Ping","Ping"])
+
+    def test_voice(self):
+        self.client.serverSendsVoice(6,4)
+        self.assertEqual(self.client.voice,[(6,4)])
+
+    def test_unknown(self):
+        self.client._dataReceived(MumbleConnection._HEADER.pack(200,3)+b"abc")
+        self.assertEqual(self.client.unknown,[(200,b"abc")])
+
+    def test_disconnect(self):
+        client=FakeAdapter(settings(reconnect=MumbleClientCore.ReconnectPolicy()))
+        client._connectionMade()
+        client.serverSends(*serverState(5))
+        client.disconnect()
+        self.assertEqual(client.closed,1)
+        client._connectionLost("closed")
+        self.assertEqual(client.disconnected,["closed"])
+        self.assertEqual([call for call in client.clock.calls if not call.cancelled],[])
+
+
+class HandlingAdapter(FakeAdapter):
+    """Records the messages its FooReceived methods are called with"""
+
+    def __init__(self,settings=None):
+        self.calls=[]
+        FakeAdapter.__init__(self,settings)
+
+    def TextMessageReceived(self,message):
+        self.calls.append(("TextMessageReceived",message.message))
+
+    def UserStateReceived(self,message):
+        # The state is updated first, by _UserStateReceived
+        self.calls.append(("UserStateReceived",self.state.users[message.session].name))
+
+
+def textMessage(text):
+    return message(MumbleConnection.TextMessage,message=text)
+
+
+class HandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client=HandlingAdapter(settings())
+        self.client._connectionMade()
+        self.client.serverSends(*serverState(5))
+        del self.client.calls[:]
+
+    def test_methods(self):
+        self.client.serverSends(textMessage(u"hello"),
+                                message(MumbleConnection.UserState,session=6,name="bob"))
+        self.assertEqual(self.client.calls,[("TextMessageReceived",u"hello"),("UserStateReceived","bob")])
+
+    def test_registerHandler(self):
+        calls=self.client.calls
+        first=lambda message: calls.append(("first",message.message))
+        second=lambda message: calls.append(("second",message.message))
+        self.client.registerHandler(MumbleConnection.TextMessage,first)
+        self.client.registerHandler(MumbleConnection.TextMessage,second)
+        self.client.serverSends(textMessage(u"one"))
+        self.assertEqual(calls,[("TextMessageReceived",u"one"),("first",u"one"),("second",u"one")])
+        self.client.unregisterHandler(MumbleConnection.TextMessage,first)
+        self.client.serverSends(textMessage(u"two"))
+        self.assertEqual(calls[3:],[("TextMessageReceived",u"two"),("second",u"two")])
+        self.assertRaises(ValueError,self.client.unregisterHandler,MumbleConnection.TextMessage,first)
+
+    def test_refreshHandlers(self):
+        texts=[]
+        self.client.TextMessageReceived=lambda message: texts.append(message.message)
+        self.client.serverSends(textMessage(u"one"))
+        self.assertEqual(texts,[])
+        self.client.refreshHandlers()
+        self.client.serverSends(textMessage(u"two"))
+        self.assertEqual(texts,[u"two"])
+        self.assertEqual(self.client.calls,[("TextMessageReceived",u"one")])
+
+
+def unparseable(messageType):
+    # A length-delimited field 1 longer than the body
+    body=b"\x0a\x7f"
+    return MumbleConnection._HEADER.pack(MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType],len(body))+body
+
+
+class LazyParsingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client=FakeAdapter(settings())
+        self.client._connectionMade()
+        self.client.serverSends(*serverState(5))
+
+    def test_unhandled(self):
+        # Nothing handles TextMessage, so it is never parsed
+        self.client._dataReceived(unparseable(MumbleConnection.TextMessage))
+        self.client.registerHandler(MumbleConnection.TextMessage,lambda message: None)
+        self.assertRaises(DecodeError,self.client._dataReceived,unparseable(MumbleConnection.TextMessage))
+
+    def test_sharedState(self):
+        # Nor is UserState, by a client whose state another client keeps
+        self.assertRaises(DecodeError,self.client._dataReceived,unparseable(MumbleConnection.UserState))
+        client=FakeAdapter(settings())
+        client.shareState(self.client.state)
+        client._connectionMade()
+        client._dataReceived(unparseable(MumbleConnection.UserState))
+
+
+class BulkSyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client=HandlingAdapter(settings(bulkSync=True))
+        self.watched=[]
+        self.client.watchUsers(lambda user,changes: self.watched.append(user.session))
+        self.client._connectionMade()
+
+    def test_deferred(self):
+        self.client.serverSends(*serverState(5,6)[:-1])
+        self.assertEqual(sorted(self.client.state.users),[5,6])
+        self.assertEqual(self.client.calls,[])
+        self.assertEqual(self.watched,[])
+        self.client.serverSends(message(MumbleConnection.ServerSync,session=5))
+        self.assertEqual(self.client.initialStates,[([],[])])
+        self.assertEqual(self.client.calls,[])
+        self.client.serverSends(message(MumbleConnection.UserState,session=6,name="bob"))
+        self.assertEqual(self.client.calls,[("UserStateReceived","bob")])
+        self.assertEqual(self.watched,[6])
+
+    def test_otherMessages(self):
+        self.client.serverSends(textMessage(u"welcome"))
+        self.assertEqual(self.client.calls,[("TextMessageReceived",u"welcome")])
+
+    def test_registerDuringSync(self):
+        users=[]
+        texts=[]
+        self.client.registerHandler(MumbleConnection.UserState,lambda message: users.append(message.session))
+        self.client.registerHandler(MumbleConnection.TextMessage,lambda message: texts.append(message.message))
+        self.client.serverSends(message(MumbleConnection.UserState,session=6,name="bob"),textMessage(u"welcome"))
+        self.assertEqual((users,texts),([],[u"welcome"]))
+        self.client.serverSends(message(MumbleConnection.ServerSync,session=5),
+                                message(MumbleConnection.UserState,session=6,self_mute=True))
+        self.assertEqual(users,[6])
+
+
+class WaiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client=HandlingAdapter(settings())
+        self.client._connectionMade()
+        self.client.serverSends(*serverState(5,6,7))
+
+    def wait(self,messageType,predicate=None,timeout=None,key=None):
+        # As the adapters' waitFor does, with a list for the result
+        result=[]
+        waiter=self.client._addWaiter(messageType,predicate,timeout,key,result.append,
+                                      lambda: result.append("timed out"))
+        return waiter,result
+
+    def index(self,messageType):
+        return self.client._waiters[MumbleConnection._MESSAGE_LOOKUP_BY_OBJECT[messageType]]
+
+    def test_unkeyed(self):
+        waiter,result=self.wait(MumbleConnection.TextMessage)
+        self.client.serverSends(textMessage(u"one"),textMessage(u"two"))
+        self.assertEqual([message.message for message in result],[u"one"])
+        self.assertIsNone(self.index(MumbleConnection.TextMessage))
+
+    def test_predicate(self):
+        waiter,result=self.wait(MumbleConnection.TextMessage,lambda message: message.message == u"two")
+        self.client.serverSends(textMessage(u"one"))
+        self.assertEqual(result,[])
+        self.client.serverSends(textMessage(u"two"))
+        self.assertEqual([message.message for message in result],[u"two"])
+
+    def test_afterHandlers(self):
+        calls=self.client.calls
+        del calls[:]
+        self.client._addWaiter(MumbleConnection.TextMessage,None,None,None,
+                               lambda message: calls.append(("waiter",message.message)),None)
+        self.client.serverSends(textMessage(u"one"))
+        self.assertEqual(calls,[("TextMessageReceived",u"one"),("waiter",u"one")])
+
+    def test_keyed(self):
+        waiter6,result6=self.wait(MumbleConnection.UserState,key=6)
+        waiter7,result7=self.wait(MumbleConnection.UserState,key=7)
+        waiterAny,resultAny=self.wait(MumbleConnection.UserState)
+        self.client.serverSends(message(MumbleConnection.UserState,session=5,self_mute=True))
+        self.assertEqual((len(result6),len(result7),len(resultAny)),(0,0,1))
+        self.client.serverSends(message(MumbleConnection.UserState,session=6,self_mute=True))
+        self.assertEqual((len(result6),len(result7)),(1,0))
+        self.assertEqual(list(self.index(MumbleConnection.UserState).byKey),[7])
+        self.assertRaises(ValueError,self.wait,MumbleConnection.TextMessage,key=5)
+
+    def test_timeout(self):
+        waiter,result=self.wait(MumbleConnection.TextMessage,timeout=2.0)
+        self.client.clock.advance(1.9)
+        self.assertEqual(result,[])
+        self.client.clock.advance(0.1)
+        self.assertEqual(result,["timed out"])
+        self.assertIsNone(self.index(MumbleConnection.TextMessage))
+        self.client.serverSends(textMessage(u"late"))
+        self.assertEqual(result,["timed out"])
+
+    def test_resolvedBeforeTimeout(self):
+        waiter,result=self.wait(MumbleConnection.TextMessage,timeout=2.0)
+        self.client.serverSends(textMessage(u"one"))
+        self.assertTrue(waiter.timer.cancelled)
+        self.client.clock.advance(5)
+        self.assertEqual(len(result),1)
+
+    def test_cancel(self):
+        keyed,keyedResult=self.wait(MumbleConnection.UserState,key=6,timeout=2.0)
+        unkeyed,unkeyedResult=self.wait(MumbleConnection.UserState)
+        self.client._removeWaiter(keyed)
+        self.client._removeWaiter(unkeyed)
+        self.client._removeWaiter(unkeyed)
+        self.assertTrue(keyed.timer.cancelled)
+        self.assertIsNone(self.index(MumbleConnection.UserState))
+        self.client.serverSends(message(MumbleConnection.UserState,session=6,self_mute=True))
+        self.client.clock.advance(5)
+        self.assertEqual((keyedResult,unkeyedResult),([],[]))
+
+
+class ReconnectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy=MumbleClientCore.ReconnectPolicy(initialDelay=1.0,factor=2.0,jitter=0.0,maxAttempts=3)
+        self.client=FakeAdapter(settings(reconnect=self.policy))
+        self.client._connectionMade()
+        self.client.serverSends(*serverState(5,6,7))
+
+    def test_connected(self):
+        self.assertEqual(self.client.connected,1)
+        self.assertEqual(self.client.sessionID,5)
+        self.assertEqual(self.client.initialStates,[([],[])])
+        self.assertEqual(self.client.sentNames(),["Version","Authenticate","CodecVersion"])
+
+    def test_backoff(self):
+        self.client._connectionLost("lost")
+        self.assertIsNone(self.client.sessionID)
+        self.assertEqual(self.client.disconnected,[])
+        self.client.clock.advance(0.9)
+        self.assertEqual(self.client.opened,0)
+        self.client.clock.advance(0.1)
+        self.assertEqual((self.client.opened,self.client.reconnectAttempts),(1,1))
+        self.client._reconnectFailed("refused")
+        self.client.clock.advance(1.9)
+        self.assertEqual(self.client.opened,1)
+        self.client.clock.advance(0.1)
+        self.assertEqual((self.client.opened,self.client.reconnectAttempts),(2,2))
+
+    def test_recovered(self):
+        joinedOrLeft=[]
+        self.client.watchUsers(lambda user,changes: joinedOrLeft.append(changes["session"]),["session"])
+        self.client._connectionLost("lost")
+        self.client.clock.advance(1.0)
+        self.client._connectionMade()
+        self.assertTrue(self.client.state.resyncing)
+        self.client.serverSends(*serverState(5,7,8))
+        self.assertEqual(self.client.connected,1)
+        self.assertEqual(self.client.sessionID,5)
+        self.assertEqual(len(self.client.recoveries),1)
+        self.assertEqual(self.client.lastRecoveryTime,self.client.recoveries[0])
+        self.assertEqual(self.client.reconnectAttempts,0)
+        self.assertEqual(self.client.initialStates[-1],([6],[]))
+        self.assertEqual(sorted(self.client.state.users),[5,7,8])
+        self.assertEqual(joinedOrLeft,[(None,8),(6,None)])
+
+    def test_recoveredInBulk(self):
+        client=FakeAdapter(settings(reconnect=self.policy,bulkSync=True))
+        client._connectionMade()
+        client.serverSends(*serverState(5,6,7))
+        watched=[]
+        client.watchUsers(lambda user,changes: watched.append(user.session))
+        client._connectionLost("lost")
+        client.clock.advance(1.0)
+        client._connectionMade()
+        client.serverSends(*serverState(5,7))
+        # The watchers hear nothing of the resync, but the client does
+        self.assertEqual(watched,[])
+        self.assertEqual(client.initialStates[-1],([6],[]))
+        self.assertEqual(sorted(client.state.users),[5,7])
+
+    def test_giveUp(self):
+        for attempt in range(3):
+            if attempt: self.client._reconnectFailed("refused")
+            else: self.client._connectionLost("lost")
+            self.client.clock.advance(self.policy.delay(attempt))
+        self.assertEqual(self.client.opened,3)
+        self.client._reconnectFailed("refused")
+        self.assertEqual(self.client.disconnected,["refused"])
+        self.client.clock.advance(100)
+        self.assertEqual(self.client.opened,3)
+
+    def test_disconnectWhileWaiting(self):
+        self.client._connectionLost("lost")
+        self.client.disconnect()
+        self.assertEqual(self.client.disconnected,["lost"])
+        self.client.clock.advance(10)
+        self.assertEqual(self.client.opened,0)
+
+    def test_lostBeforeServerSync(self):
+        client=FakeAdapter(settings(reconnect=self.policy))
+        client._connectionMade()
+        client._connectionLost("refused")
+        self.assertEqual(client.disconnected,["refused"])
+        self.assertEqual(client.clock.calls,[])
+
+
+class JitterBufferTest(unittest.TestCase):
+
+    def connect(self,client):
+        client._connectionMade()
+        client.serverSends(*serverState(5,6))
+
+    def test_speakerLeaves(self):
+        client=FakeAdapter(settings(jitterBuffer=MumbleJitterBuffer.JitterPolicy()))
+        self.connect(client)
+        client.serverSendsVoice(6,0)
+        self.assertEqual(list(client.jitterBuffers.buffers),[6])
+        client.serverSends(message(MumbleConnection.UserRemove,session=6))
+        self.assertEqual(client.jitterBuffers.buffers,{})
+
+    def test_speakerLeavesSharedState(self):
+        # A client sharing another's state does not apply UserRemove itself
+        client=FakeAdapter(settings(jitterBuffer=MumbleJitterBuffer.JitterPolicy()))
+        client.shareState(MumbleState.MumbleState())
+        self.connect(client)
+        client.serverSendsVoice(6,0)
+        client.serverSends(message(MumbleConnection.UserRemove,session=6))
+        self.assertEqual(client.jitterBuffers.buffers,{})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from twisted.internet import defer
+from twisted.python import failure
+
+from mumbleclient import MumbleClientPool
+
+
+class FakeSettings(object):
+    pingInterval=5.0
+
+
+class FakeClient(object):
+    """Just what a ClientPool uses of a MumbleClient"""
+
+    def __init__(self):
+        self.settings=FakeSettings()
+        self.sessionID=None
+        self.state=None
+        self.clientConnected=defer.Deferred()
+        self.clientDisconnected=defer.Deferred()
+        self.controlConnected=None
+        self.connects=0
+        self.cancelled=False
+        self.disconnected=False
+        self.errors=[]
+        self.pings=0
+
+    def shareState(self,state):
+        self.state=state
+
+    def connect(self):
+        self.connects+=1
+        self.controlConnected=defer.Deferred(lambda d: setattr(self,"cancelled",True))
+        return self.controlConnected
+
+    def disconnect(self):
+        self.disconnected=True
+
+    def errorCallback(self,result):
+        self.errors.append(result)
+        return result
+
+    def sendPing(self):
+        self.pings+=1
+
+
+class ClientPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.primary=FakeClient()
+        self.pool=MumbleClientPool.ClientPool(self.primary,maxHandshakes=2)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def test_handshakeLimit(self):
+        clients=[self.pool.spawn(FakeClient()) for i in range(3)]
+        self.assertEqual([client.connects for client in clients],[1,1,0])
+        self.assertIs(clients[0].state,self.primary.state)
+        self.assertIsNone(clients[0].settings.pingInterval)
+        clients[0].controlConnected.callback(None)
+        clients[0].clientConnected.callback(True)
+        self.assertEqual(clients[2].connects,1)
+
+    def test_pingAll(self):
+        clients=[self.pool.spawn(FakeClient()) for i in range(2)]
+        self.primary.sessionID=1
+        clients[0].sessionID=2
+        self.pool._pingAll()
+        self.assertEqual((self.primary.pings,clients[0].pings,clients[1].pings),(1,1,0))
+
+    def test_connectFailed(self):
+        client=self.pool.spawn(FakeClient())
+        waiting=[self.pool.spawn(FakeClient()) for i in range(2)]
+        client.controlConnected.errback(failure.Failure(RuntimeError("refused")))
+        # The failure is reported and not left unhandled in the Deferred
+        self.assertEqual(len(client.errors),1)
+        self.assertIsNone(client.controlConnected.result)
+        self.assertNotIn(client,self.pool.clients)
+        self.assertEqual(waiting[1].connects,1)
+
+    def test_retireWaiting(self):
+        clients=[self.pool.spawn(FakeClient()) for i in range(3)]
+        self.pool.retire(clients[2])
+        self.assertNotIn(clients[2],self.pool.clients)
+        clients[0].controlConnected.callback(None)
+        clients[0].clientConnected.callback(True)
+        self.assertEqual(clients[2].connects,0)
+
+    def test_retireConnecting(self):
+        clients=[self.pool.spawn(FakeClient()) for i in range(3)]
+        self.pool.retire(clients[0])
+        self.assertTrue(clients[0].cancelled)
+        self.assertFalse(clients[0].disconnected)
+        self.assertEqual(clients[0].errors,[])
+        self.assertNotIn(clients[0],self.pool.clients)
+        self.assertEqual(clients[2].connects,1)
+
+    def test_retireConnected(self):
+        client=self.pool.spawn(FakeClient())
+        client.controlConnected.callback(None)
+        self.pool.retire(client)
+        self.assertTrue(client.disconnected)
+        self.assertFalse(client.cancelled)
+
+
+if __name__ == "__main__":
+    unittest.main()
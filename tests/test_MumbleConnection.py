@@ -0,0 +1,69 @@
+import unittest
+
+from mumbleclient import MumbleConnection
+from mumbleclient import MumbleVoiceProtocol
+
+
+def textMessage(text):
+    message=MumbleConnection.TextMessage()
+    message.message=text
+    return message
+
+
+def frame(message):
+    connection=MumbleConnection.MumbleConnection()
+    connection.sendMessage(message)
+    return b"".join(connection.dataToSend())
+
+
+class MumbleConnectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection=MumbleConnection.MumbleConnection()
+
+    def test_messages(self):
+        data=frame(textMessage(u"one"))+frame(textMessage(u"two"))
+        events=self.connection.receiveData(data)
+        self.assertEqual([event.name for event in events],["TextMessage","TextMessage"])
+        self.assertEqual([event.message.message for event in events],[u"one",u"two"])
+
+    def test_split(self):
+        data=frame(textMessage(u"one"))+frame(textMessage(u"two"))+frame(textMessage(u"three"))
+        events=[]
+        for i in range(0,len(data),4):
+            events.extend(self.connection.receiveData(data[i:i+4]))
+        self.assertEqual([event.message.message for event in events],[u"one",u"two",u"three"])
+        self.assertEqual(len(self.connection._buffer),0)
+
+    def test_eventsOutliveTheBuffer(self):
+        # Bodies are read lazily, so events from one chunk must still be
+        # readable after the next has been received
+        one=frame(textMessage(u"one"))
+        two=frame(textMessage(u"two"))
+        first=self.connection.receiveData(one[:3])
+        first+=self.connection.receiveData(one[3:]+two[:5])
+        second=self.connection.receiveData(two[5:])
+        self.assertEqual(first[0].message.message,u"one")
+        self.assertEqual(second[0].data,textMessage(u"two").SerializeToString())
+
+    def test_voice(self):
+        builder=MumbleVoiceProtocol.VoicePacketBuilder()
+        raw=builder.build(3,[b"frame"],session=9).tobytes()
+        self.connection.sendVoiceMessage(raw)
+        (packet,)=self.connection.receiveData(b"".join(self.connection.dataToSend()))
+        self.assertEqual((packet.session,packet.sequence),(9,3))
+        self.assertEqual(packet.frame(0).tobytes(),b"frame")
+
+    def test_unknown(self):
+        data=MumbleConnection._HEADER.pack(200,3)+b"abc"
+        (event,)=self.connection.receiveData(data)
+        self.assertEqual((event.type,event.data),(200,b"abc"))
+
+    def test_messageIds(self):
+        self.assertEqual(MumbleConnection.getMessageId(MumbleConnection.UserState()),9)
+        self.assertIsInstance(MumbleConnection.getMessageObject(9),MumbleConnection.UserState)
+        self.assertEqual(MumbleConnection.getMessageName(9),"UserState")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+from mumbleclient import MumbleDelayLine
+from tests.fakes import FakeClock
+
+
+class DelayLineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock=FakeClock()
+        self.line=MumbleDelayLine.DelayLine(self.clock.callLater,self.clock)
+        self.sent=[]
+
+    def addStream(self,name,delay=1.0,**kwargs):
+        return self.line.addStream(lambda data: self.sent.append((name,data,self.clock.now)),delay,**kwargs)
+
+    def test_delay(self):
+        stream=self.addStream("a")
+        stream.push("x")
+        self.clock.advance(0.5)
+        stream.push("y")
+        self.clock.advance(0.4)
+        self.assertEqual(self.sent,[])
+        self.clock.advance(1)
+        self.assertEqual([data for name,data,when in self.sent],["x","y"])
+        self.assertAlmostEqual(self.sent[0][2],1001.0,delta=self.line.tick)
+        self.assertAlmostEqual(self.sent[1][2],1001.5,delta=self.line.tick)
+        self.assertEqual(self.line.stats.count,2)
+
+    def test_streamsInterleave(self):
+        a=self.addStream("a",1.0)
+        b=self.addStream("b",0.5)
+        a.push(1)
+        b.push(2)
+        self.clock.advance(0.2)
+        a.push(3)
+        self.clock.advance(2)
+        self.assertEqual([(name,data) for name,data,when in self.sent],[("b",2),("a",1),("a",3)])
+
+    def test_drained(self):
+        drained=[]
+        stream=self.addStream("a",drained=drained.append)
+        stream.push(1)
+        stream.push(2)
+        self.clock.advance(2)
+        self.assertEqual(drained,[stream])
+
+    def test_clear(self):
+        stream=self.addStream("a")
+        stream.push(1)
+        stream.clear()
+        self.assertEqual(self.line._count,0)
+        stream.push(2)
+        self.assertEqual(self.line._count,1)
+        self.clock.advance(2)
+        self.assertEqual([data for name,data,when in self.sent],[2])
+        self.assertEqual(self.line._count,0)
+        self.assertEqual(sum(len(slot) for slot in self.line._slots),0)
+
+    def test_removeStream(self):
+        stream=self.addStream("a")
+        stream.push(1)
+        self.line.removeStream(stream)
+        stream.push(2)
+        self.clock.advance(2)
+        self.assertEqual(self.sent,[])
+
+    def test_pauseAndResume(self):
+        stream=self.addStream("a",paused=True)
+        stream.push(1)
+        self.clock.advance(2)
+        self.assertEqual(self.sent,[])
+        stream.resume()
+        self.clock.advance(0.01)
+        self.assertEqual([data for name,data,when in self.sent],[1])
+
+    def test_longDelay(self):
+        # Longer than one turn of the wheel
+        stream=self.addStream("a",delay=30.0)
+        stream.push(1)
+        self.clock.advance(29)
+        self.assertEqual(self.sent,[])
+        self.clock.advance(2)
+        self.assertEqual([data for name,data,when in self.sent],[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from mumbleclient import MumbleJitterBuffer
+from mumbleclient import MumbleOgg
+from mumbleclient import MumbleVoiceProtocol
+from tests.fakes import FakeClock
+
+
+_builder=MumbleVoiceProtocol.VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+
+def opusPacket(sequence,terminator=False):
+    # 20ms of Opus, so two sequence numbers a packet
+    raw=_builder.build(sequence,[MumbleOgg.SILENCE_20MS],terminator,session=1).tobytes()
+    return MumbleVoiceProtocol.VoicePacket(raw)
+
+
+class JitterBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock=FakeClock()
+        self.released=[]
+        self.buffer=MumbleJitterBuffer.JitterBuffer(lambda packet: self.released.append(packet.sequence),
+                                                    self.clock.callLater,self.clock)
+
+    def send(self,sequences,spacing=0.02,terminator=None):
+        for sequence in sequences:
+            self.buffer.add(opusPacket(sequence,sequence == terminator))
+            self.clock.advance(spacing)
+
+    def test_inOrder(self):
+        self.send([0,2,4,6],terminator=6)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,4,6])
+        self.assertEqual(self.buffer.stats.good,4)
+        self.assertEqual(self.buffer.stats.lost,0)
+        self.assertFalse(self.buffer.playing)
+
+    def test_lostCountsPackets(self):
+        self.send([0,2,4,8,10],terminator=10)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,4,8,10])
+        self.assertEqual(self.buffer.stats.good,5)
+        self.assertEqual(self.buffer.stats.lost,1)
+
+    def test_lostAfterStall(self):
+        # Nothing arrives for a while, so playout stops, then carries on
+        # two packets further along
+        self.send([0,2])
+        self.clock.advance(0.2)
+        self.send([8,10],terminator=10)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,8,10])
+        self.assertEqual(self.buffer.stats.lost,2)
+
+    def test_duplicate(self):
+        self.send([0,2,2,4],terminator=4)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,4])
+        self.assertEqual(self.buffer.stats.duplicate,1)
+
+    def test_duplicateAfterEnd(self):
+        self.send([0,2,4],terminator=4)
+        self.clock.advance(0.3)
+        self.send([4])
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,4])
+        self.assertEqual(self.buffer.stats.duplicate,1)
+        self.assertFalse(self.buffer.playing)
+
+    def test_lateAfterEnd(self):
+        self.buffer.add(opusPacket(0))
+        self.clock.advance(0.02)
+        self.buffer.add(opusPacket(4,True))
+        self.clock.advance(0.3)
+        self.buffer.add(opusPacket(2))
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,4])
+        self.assertEqual(self.buffer.stats.late,1)
+
+    def test_resync(self):
+        self.send([0,2])
+        self.send([5000,5002],terminator=5002)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[0,2,5000,5002])
+
+    def test_restartedSequence(self):
+        # A client starting its count again is a new transmission, not a
+        # repeat of the last one
+        self.send([100,102,104],terminator=104)
+        self.clock.advance(5)
+        self.send([0,2],terminator=2)
+        self.clock.advance(1)
+        self.assertEqual(self.released,[100,102,104,0,2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import io
+import struct
+import unittest
+
+from mumbleclient import MumbleOgg
+from mumbleclient import MumbleVoiceProtocol
+
+
+def readPages(data):
+    """Splits an Ogg stream into (header fields, segment table, body), checking each CRC"""
+    pages=[]
+    offset=0
+    while offset < len(data):
+        fields=MumbleOgg._PAGE_HEADER.unpack_from(data,offset)
+        count=fields[-1]
+        headerEnd=offset+MumbleOgg._PAGE_HEADER.size+count
+        segments=bytearray(data[offset+MumbleOgg._PAGE_HEADER.size:headerEnd])
+        end=headerEnd+sum(segments)
+        page=bytearray(data[offset:end])
+        crc=struct.unpack_from("<I",page,22)[0]
+        page[22:26]=b"\0\0\0\0"
+        assert MumbleOgg.oggCRC(page) == crc
+        pages.append((fields,segments,bytes(data[headerEnd:end])))
+        offset=end
+    return pages
+
+
+class OggTest(unittest.TestCase):
+
+    def test_crc(self):
+        self.assertEqual(MumbleOgg.oggCRC(b"123456789"),0x89a1897f)
+        self.assertEqual(MumbleOgg.oggCRC(b"6789",MumbleOgg.oggCRC(b"12345")),0x89a1897f)
+
+    def test_opusPacketSamples(self):
+        self.assertEqual(MumbleOgg.opusPacketSamples(MumbleOgg.SILENCE_20MS),960)
+        self.assertEqual(MumbleOgg.opusPacketSamples(MumbleOgg.SILENCE_10MS),480)
+        self.assertEqual(MumbleOgg.opusPacketSamples(b"\xf9"),1920)
+        self.assertEqual(MumbleOgg.opusPacketSamples(b"\xf3\x03"),3*480)
+        self.assertEqual(MumbleOgg.opusPacketSamples(b"\x0b\x03"),3*960)
+        self.assertEqual(MumbleOgg.opusPacketSamples(b""),0)
+        self.assertRaises(ValueError,MumbleOgg.opusPacketSamples,b"\x0b")
+
+    def test_pages(self):
+        out=io.BytesIO()
+        writer=MumbleOgg.OggOpusWriter(out,serial=7,pageSamples=4800)
+        for i in range(12):
+            writer.writePacket(i*2,MumbleOgg.SILENCE_20MS)
+        writer.close()
+        pages=readPages(out.getvalue())
+        self.assertTrue(pages[0][2].startswith(b"OpusHead"))
+        self.assertTrue(pages[1][2].startswith(b"OpusTags"))
+        self.assertEqual(pages[0][0][2],0x02)
+        self.assertEqual(pages[-1][0][2],0x04)
+        self.assertEqual([fields[5] for fields,segments,body in pages],list(range(len(pages))))
+        self.assertTrue(all(fields[4] == 7 for fields,segments,body in pages))
+        # Five 20ms packets make a 100ms page
+        self.assertEqual([fields[3] for fields,segments,body in pages[2:]],[4800,9600,11520])
+        self.assertEqual(writer.granule,12*960)
+
+    def test_gapFilledWithSilence(self):
+        out=io.BytesIO()
+        writer=MumbleOgg.OggOpusWriter(out)
+        writer.writePacket(0,MumbleOgg.SILENCE_20MS)
+        writer.writePacket(7,b"\xf8real")
+        writer.close()
+        self.assertEqual(writer.granule,960+5*480+960)
+        body=b"".join(body for fields,segments,body in readPages(out.getvalue())[2:])
+        self.assertTrue(body.endswith(b"\xf8real"))
+
+    def test_longPacketLacing(self):
+        out=io.BytesIO()
+        writer=MumbleOgg.OggOpusWriter(out)
+        writer.writePacket(0,b"\xf8"+b"x"*599)
+        writer.close()
+        fields,segments,body=readPages(out.getvalue())[2]
+        self.assertEqual(list(segments),[255,255,90])
+        self.assertEqual(len(body),600)
+
+    def test_remuxer(self):
+        files={}
+        class Output(io.BytesIO):
+            def close(self):
+                files[self.session]=self.getvalue()
+                io.BytesIO.close(self)
+        def opener(session):
+            f=Output()
+            f.session=session
+            return f
+        remuxer=MumbleOgg.OpusRemuxer(opener)
+        opus=MumbleVoiceProtocol.VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+        speex=MumbleVoiceProtocol.VoicePacketBuilder(MumbleVoiceProtocol.SPEEX)
+        for i in range(3):
+            for session in (1,2):
+                packet=MumbleVoiceProtocol.VoicePacket(opus.build(i*2,[MumbleOgg.SILENCE_20MS],session=session).tobytes())
+                remuxer.addPacket(packet.prefix,packet.session,packet.data)
+            packet=MumbleVoiceProtocol.VoicePacket(speex.build(i,[b"s"],session=3).tobytes())
+            remuxer.addPacket(packet.prefix,packet.session,packet.data)
+        remuxer.close()
+        self.assertEqual(sorted(files),[1,2])
+        pages=readPages(files[1])
+        self.assertEqual(pages[-1][0][3],3*960)
+
+
+if __name__ == "__main__":
+    unittest.main()
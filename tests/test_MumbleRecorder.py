@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mumbleclient import MumbleRecorder
+from mumbleclient import MumbleVoiceProtocol
+
+
+class RecorderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory=tempfile.mkdtemp()
+        self.path=os.path.join(self.directory,"voice.rec")
+        self.builder=MumbleVoiceProtocol.VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def packet(self,sequence,session=1):
+        raw=self.builder.build(sequence,[b"frame%d" % sequence],session=session).tobytes()
+        return MumbleVoiceProtocol.VoicePacket(raw)
+
+    def record(self,count,close=True,interval=1.0):
+        recorder=MumbleRecorder.Recorder(self.path,interval=interval,bufferSize=256)
+        packets=[]
+        for i in range(count):
+            packet=self.packet(i,session=1+i%3)
+            recorder.recordPacket(packet,1000.0+i*0.1)
+            packets.append(packet)
+        if close: recorder.close()
+        else: recorder.flush()
+        return packets
+
+    def check(self,reader,packets,start=0):
+        read=list(reader)
+        self.assertEqual(len(read),len(packets)-start)
+        for i,(recorded,packet) in enumerate(zip(read,packets[start:])):
+            self.assertEqual(recorded.time,1000.0+(i+start)*0.1)
+            self.assertEqual(recorded.session,packet.session)
+            self.assertEqual(recorded.codec,MumbleVoiceProtocol.OPUS)
+            self.assertEqual(recorded.relayData(),packet.relayData())
+
+    def test_roundTrip(self):
+        packets=self.record(50)
+        with MumbleRecorder.Reader(self.path) as reader:
+            self.assertEqual(reader.startTime,1000.0)
+            self.check(reader,packets)
+
+    def test_unclosed(self):
+        packets=self.record(50,close=False)
+        with MumbleRecorder.Reader(self.path) as reader:
+            self.check(reader,packets)
+
+    def test_timeRange(self):
+        packets=self.record(100,interval=0.5)
+        with MumbleRecorder.Reader(self.path) as reader:
+            read=list(reader.packets(1002.05,1004.0))
+        self.assertEqual([packet.time for packet in read],[1000.0+i*0.1 for i in range(21,40)])
+
+    def test_record(self):
+        recorder=MumbleRecorder.Recorder(self.path)
+        packet=self.packet(7,session=5)
+        recorder.record(packet.prefix,packet.session,packet.data,1000.0)
+        recorder.close()
+        with MumbleRecorder.Reader(self.path) as reader:
+            (recorded,)=list(reader)
+        self.assertEqual((recorded.session,recorded.relayData()),(5,packet.relayData()))
+
+    def test_pingNotRecorded(self):
+        recorder=MumbleRecorder.Recorder(self.path)
+        ping=MumbleVoiceProtocol.decodeAudioMessage(b"\x20\x05")
+        recorder.recordPacket(ping,1000.0)
+        recorder.record(ping.prefix,ping.session,ping.data,1000.0)
+        recorder.close()
+        with MumbleRecorder.Reader(self.path) as reader:
+            self.assertEqual(list(reader),[])
+
+    def test_notARecording(self):
+        with open(self.path,"wb") as f:
+            f.write(b"\0"*64)
+        self.assertRaises(ValueError,MumbleRecorder.Reader,self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
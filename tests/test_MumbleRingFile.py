@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mumbleclient import MumbleRingFile
+
+
+class RingFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory=tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open(self,dataSize=1024,entries=16,name="delay.ring"):
+        return MumbleRingFile.RingFile(os.path.join(self.directory,name),dataSize=dataSize,entries=entries)
+
+    def drain(self,buffer):
+        packets=[]
+        while len(buffer):
+            packets.append((buffer.headTime(),bytes(buffer.popleft())))
+        return packets
+
+    def test_fifo(self):
+        ring=self.open()
+        a=ring.buffer(1)
+        b=ring.buffer(2)
+        a.append(1.0,b"a1")
+        b.append(1.5,b"b1")
+        a.append(2.0,b"a2")
+        self.assertEqual(self.drain(a),[(1.0,b"a1"),(2.0,b"a2")])
+        self.assertEqual(self.drain(b),[(1.5,b"b1")])
+        self.assertEqual(len(ring),0)
+        ring.close()
+
+    def test_wrap(self):
+        # Many times the ring's size, in both entries and data
+        ring=self.open(dataSize=100,entries=4)
+        buffer=ring.buffer(1)
+        for i in range(100):
+            buffer.append(float(i),b"packet%02d" % i)
+            buffer.append(i+0.5,bytearray(b"extra%02d" % i))
+            self.assertEqual(self.drain(buffer),[(float(i),b"packet%02d" % i),(i+0.5,b"extra%02d" % i)])
+        self.assertEqual(ring.dropped,0)
+        ring.close()
+
+    def test_full(self):
+        ring=self.open(dataSize=1024,entries=4)
+        buffer=ring.buffer(1)
+        for i in range(6):
+            buffer.append(float(i),b"x")
+        self.assertEqual(len(buffer),4)
+        self.assertEqual(ring.dropped,2)
+        ring.close()
+        ring=self.open(dataSize=10,entries=16,name="small.ring")
+        buffer=ring.buffer(1)
+        buffer.append(0.0,b"12345678")
+        buffer.append(1.0,b"12345678")
+        self.assertEqual(len(buffer),1)
+        self.assertEqual(ring.dropped,1)
+        ring.close()
+
+    def test_recovery(self):
+        ring=self.open()
+        a=ring.buffer(1)
+        b=ring.buffer(2)
+        for i in range(3):
+            a.append(float(i),b"a%d" % i)
+            b.append(i+0.5,b"b%d" % i)
+        a.popleft()
+        ring.close()
+        ring=self.open()
+        self.assertEqual(sorted(ring.recoveredSessions()),[1,2])
+        a=ring.buffer(1)
+        self.assertEqual(ring.recoveredSessions(),[2])
+        ring.discardUnclaimed()
+        self.assertEqual(ring.recoveredSessions(),[])
+        a.append(9.0,b"a9")
+        self.assertEqual(self.drain(a),[(1.0,b"a1"),(2.0,b"a2"),(9.0,b"a9")])
+        self.assertEqual(len(ring),0)
+        ring.close()
+
+    def test_shift(self):
+        ring=self.open()
+        buffer=ring.buffer(1)
+        buffer.append(1.0,b"a")
+        buffer.append(2.0,b"b")
+        buffer.shift(10.0)
+        self.assertEqual((buffer.headTime(),buffer.tailTime()),(11.0,12.0))
+        self.assertEqual(self.drain(buffer),[(11.0,b"a"),(12.0,b"b")])
+        ring.close()
+
+    def test_clear(self):
+        ring=self.open()
+        a=ring.buffer(1)
+        b=ring.buffer(2)
+        a.append(1.0,b"a")
+        b.append(2.0,b"b")
+        a.clear()
+        self.assertEqual(len(a),0)
+        self.assertEqual(self.drain(b),[(2.0,b"b")])
+        self.assertEqual(len(ring),0)
+        ring.close()
+
+    def test_notARingFile(self):
+        with open(os.path.join(self.directory,"delay.ring"),"wb") as f:
+            f.write(b"\0"*128)
+        self.assertRaises(ValueError,self.open)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mumbleclient import Mumble_pb2
+from mumbleclient import MumbleState
+
+
+def userState(session,**fields):
+    message=Mumble_pb2.UserState()
+    message.session=session
+    for name,value in fields.items(): setattr(message,name,value)
+    return message
+
+
+def channelState(channel_id,**fields):
+    message=Mumble_pb2.ChannelState()
+    message.channel_id=channel_id
+    for name,value in fields.items():
+        if name.startswith("links"): getattr(message,name).extend(value)
+        else: setattr(message,name,value)
+    return message
+
+
+class MumbleStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state=MumbleState.MumbleState()
+        self.state.updateChannel(channelState(0,name="Root"))
+        self.state.updateChannel(channelState(1,name="Match",parent=0))
+        self.state.updateChannel(channelState(2,name="Red",parent=1))
+        self.state.updateChannel(channelState(3,name="Blue",parent=1))
+
+    def test_rootUsers(self):
+        # The server leaves channel_id out for users in the root channel
+        user,changes=self.state.updateUser(userState(5,name="alice"))
+        self.assertEqual(user.channel_id,0)
+        self.assertEqual(self.state.usersIn(0),set([5]))
+        self.assertEqual(changes["session"],(None,5))
+        self.assertEqual(changes["channel_id"],(None,0))
+        self.state.removeUser(5)
+        self.assertEqual(self.state.usersIn(0),frozenset())
+        self.assertNotIn(None,self.state._channelUsers)
+
+    def test_userMoves(self):
+        self.state.updateUser(userState(5,name="alice",channel_id=2))
+        user,changes=self.state.updateUser(userState(5,channel_id=3))
+        self.assertEqual(changes,{"channel_id":(2,3)})
+        self.assertEqual(self.state.usersIn(2),frozenset())
+        self.assertEqual(self.state.usersIn(3),set([5]))
+        user,changes=self.state.updateUser(userState(5,channel_id=0))
+        self.assertEqual(self.state.usersIn(0),set([5]))
+
+    def test_userIndexes(self):
+        self.state.updateUser(userState(5,name="alice",user_id=12))
+        self.state.updateUser(userState(6,name="bob"))
+        self.assertEqual(self.state.userByName("alice").session,5)
+        self.assertEqual(self.state.userByUserId(12).session,5)
+        self.state.updateUser(userState(5,name="carol"))
+        self.assertIsNone(self.state.userByName("alice"))
+        self.assertEqual(self.state.userByName("carol").session,5)
+        self.assertEqual(self.state.findFreeName("bob"),"bob0")
+        self.assertEqual(self.state.findFreeName("dave"),"dave")
+
+    def test_channelIndexes(self):
+        self.assertEqual(self.state.channelPath(2),("Match","Red"))
+        self.assertEqual(self.state.channelByPath("Match/Blue").channel_id,3)
+        self.assertEqual(self.state.childChannels(1),set([2,3]))
+        self.assertEqual(self.state.findChannel("Red").channel_id,2)
+        self.state.updateChannel(channelState(1,name="Final"))
+        self.assertEqual(self.state.channelPath(3),("Final","Blue"))
+        self.assertIsNone(self.state.channelByPath("Match/Blue"))
+        self.state.updateChannel(channelState(3,parent=0))
+        self.assertEqual(self.state.channelPath(3),("Blue",))
+        self.assertEqual(self.state.childChannels(1),set([2]))
+        self.state.removeChannel(2)
+        self.assertIsNone(self.state.findChannel("Red"))
+        self.assertEqual(self.state.childChannels(1),frozenset())
+
+    def test_links(self):
+        channel,changes=self.state.updateChannel(channelState(2,links=[3]))
+        self.assertEqual(channel.links,set([3]))
+        self.assertEqual(changes["links"],(frozenset(),frozenset([3])))
+
+    def test_channelFields(self):
+        channel,changes=self.state.updateChannel(channelState(2,position=4,temporary=True))
+        self.assertEqual(changes,{"position":(0,4),"temporary":(False,True)})
+        channel,changes=self.state.updateChannel(channelState(2,links_add=[1,3]))
+        self.assertEqual(changes,{"links":(frozenset(),frozenset([1,3]))})
+        channel,changes=self.state.updateChannel(channelState(2,links_remove=[1],position=4))
+        self.assertEqual(changes,{"links":(frozenset([1,3]),frozenset([3]))})
+        channel,changes=self.state.updateChannel(channelState(2,description="red team"))
+        key=MumbleState.BlobStore.key("red team")
+        self.assertEqual(changes,{"description_hash":(None,key)})
+        self.assertEqual(self.state.blobs.get(key),"red team")
+        channel,changes=self.state.updateChannel(channelState(2,description_hash=b"other"))
+        self.assertEqual(changes,{"description_hash":(key,b"other")})
+        self.assertNotIn(key,self.state.blobs)
+
+    def test_blobs(self):
+        user,changes=self.state.updateUser(userState(5,comment="hello"))
+        self.assertEqual(self.state.blobs.get(user.comment_hash),"hello")
+        self.state.updateUser(userState(6,comment="hello"))
+        self.assertEqual(len(self.state.blobs),1)
+        self.state.removeUser(5)
+        self.state.removeUser(6)
+        self.assertEqual(len(self.state.blobs),0)
+
+    def test_snapshot(self):
+        self.state.updateUser(userState(5,name="alice",channel_id=2,comment="hi"))
+        self.state.updateUser(userState(6,name="bob"))
+        restored=MumbleState.MumbleState()
+        restored.restore(self.state.snapshot())
+        self.assertEqual(restored.usersIn(2),set([5]))
+        self.assertEqual(restored.usersIn(0),set([6]))
+        self.assertEqual(restored.channelPath(3),("Match","Blue"))
+        self.assertEqual(restored.blobs.get(restored.users[5].comment_hash),"hi")
+        self.assertRaises(ValueError,restored.restore,b"nonsense")
+
+    def test_saveAndLoad(self):
+        directory=tempfile.mkdtemp()
+        try:
+            path=os.path.join(directory,"state")
+            self.state.save(path)
+            loaded=MumbleState.MumbleState()
+            loaded.load(path)
+            self.assertEqual(loaded.channelPath(2),("Match","Red"))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_resync(self):
+        self.state.updateUser(userState(5,name="alice",channel_id=2))
+        self.state.updateUser(userState(6,name="bob",channel_id=3))
+        self.state.beginResync()
+        self.assertTrue(self.state.resyncing)
+        for id,name,parent in ((0,"Root",None),(1,"Match",0),(2,"Red",1)):
+            fields={"name":name}
+            if parent is not None: fields["parent"]=parent
+            self.state.updateChannel(channelState(id,**fields))
+        user,changes=self.state.updateUser(userState(5,name="alice"))
+        self.assertEqual(changes,{"channel_id":(2,0)})
+        users,channels=self.state.endResync()
+        self.assertEqual([user.session for user in users],[6])
+        self.assertEqual([channel.channel_id for channel in channels],[3])
+        self.assertFalse(self.state.resyncing)
+        self.assertEqual(self.state.usersIn(0),set([5]))
+        self.assertEqual(self.state.usersIn(2),frozenset())
+        self.assertEqual(self.state.usersIn(3),frozenset())
+
+
+class ChangeWatchersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.watchers=MumbleState.ChangeWatchers()
+        self.calls=[]
+
+    def callback(self,record,changes):
+        self.calls.append((record,changes))
+
+    def test_all(self):
+        self.watchers.add(self.callback)
+        self.watchers.notify("user",{"name":(None,"alice")})
+        self.watchers.notify("user",{})
+        self.assertEqual(self.calls,[("user",{"name":(None,"alice")})])
+        self.watchers.remove(self.callback)
+        self.watchers.notify("user",{"name":("alice","bob")})
+        self.assertEqual(len(self.calls),1)
+
+    def test_byField(self):
+        self.watchers.add(self.callback,["channel_id"])
+        self.watchers.notify("user",{"name":(None,"alice")})
+        self.assertEqual(self.calls,[])
+        self.watchers.notify("user",{"channel_id":(0,2)})
+        self.assertEqual(self.calls,[("user",{"channel_id":(0,2)})])
+
+    def test_calledOnce(self):
+        self.watchers.add(self.callback,["channel_id","mute"])
+        changes={"channel_id":(0,2),"mute":(False,True),"name":(None,"alice")}
+        self.watchers.notify("user",changes)
+        self.assertEqual(self.calls,[("user",changes)])
+
+    def test_remove(self):
+        other=[]
+        self.watchers.add(self.callback,["channel_id","mute"])
+        self.watchers.add(lambda record,changes: other.append(record),["mute"])
+        self.watchers.remove(self.callback)
+        self.assertNotIn("channel_id",self.watchers._byField)
+        self.watchers.notify("user",{"channel_id":(0,2),"mute":(False,True)})
+        self.assertEqual(self.calls,[])
+        self.assertEqual(other,["user"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from OpenSSL import SSL
+
+from mumbleclient import MumbleTLS
+
+
+def writeCertificate(directory):
+    key=ec.generate_private_key(ec.SECP256R1(),default_backend())
+    name=x509.Name([x509.NameAttribute(NameOID.COMMON_NAME,u"localhost")])
+    now=datetime.datetime.utcnow()
+    certificate=(x509.CertificateBuilder().subject_name(name).issuer_name(name)
+                 .public_key(key.public_key()).serial_number(1)
+                 .not_valid_before(now-datetime.timedelta(days=1))
+                 .not_valid_after(now+datetime.timedelta(days=1))
+                 .sign(key,hashes.SHA256(),default_backend()))
+    keyFile=os.path.join(directory,"key.pem")
+    certificateFile=os.path.join(directory,"certificate.pem")
+    with open(keyFile,"wb") as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM,serialization.PrivateFormat.TraditionalOpenSSL,
+                                  serialization.NoEncryption()))
+    with open(certificateFile,"wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    return keyFile,certificateFile
+
+
+class ResumingCertificateOptionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory=tempfile.mkdtemp()
+        keyFile,certificateFile=writeCertificate(self.directory)
+        # TLS 1.2, so the session is ready as soon as the handshake is done
+        self.serverContext=SSL.Context(SSL.TLSv1_2_METHOD)
+        self.serverContext.use_privatekey_file(keyFile)
+        self.serverContext.use_certificate_file(certificateFile)
+        self.serverContext.set_session_id(b"test")
+        self.serverContext.set_session_cache_mode(SSL.SESS_CACHE_SERVER)
+        self.sessionCache=os.path.join(self.directory,"session")
+        # OpenSSL forgets the session of a connection freed without a
+        # shutdown, so the server's connections are kept
+        self.servers=[]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def handshake(self,client):
+        server=SSL.Connection(self.serverContext,None)
+        server.set_accept_state()
+        self.servers.append(server)
+        client.set_connect_state()
+        for i in range(10):
+            done=True
+            for connection in (client,server):
+                try:
+                    connection.do_handshake()
+                except SSL.WantReadError:
+                    done=False
+            for source,destination in ((client,server),(server,client)):
+                try:
+                    destination.bio_write(source.bio_read(65536))
+                except SSL.WantReadError:
+                    pass
+            if done: return
+        self.fail("The handshake did not finish")
+
+    def test_resumeWithinProcess(self):
+        options=MumbleTLS.ResumingCertificateOptions()
+        first=options.clientConnectionForTLS(object())
+        self.handshake(first)
+        self.assertEqual(MumbleTLS.sessionReused(first),False if MumbleTLS._CAN_CHECK_REUSE else None)
+        second=options.clientConnectionForTLS(object())
+        self.handshake(second)
+        if MumbleTLS._CAN_CHECK_REUSE:
+            self.assertTrue(MumbleTLS.sessionReused(second))
+
+    @unittest.skipUnless(MumbleTLS._CAN_SERIALISE,"Sessions cannot be serialised with this pyOpenSSL")
+    def test_resumeFromCache(self):
+        options=MumbleTLS.ResumingCertificateOptions(self.sessionCache)
+        self.handshake(options.clientConnectionForTLS(object()))
+        self.assertTrue(os.path.exists(self.sessionCache))
+        # As in a later process
+        reloaded=MumbleTLS.ResumingCertificateOptions(self.sessionCache)
+        self.assertIsNotNone(reloaded._session)
+        connection=reloaded.clientConnectionForTLS(object())
+        self.assertIsNotNone(reloaded._session)
+        self.handshake(connection)
+        if MumbleTLS._CAN_CHECK_REUSE:
+            self.assertTrue(MumbleTLS.sessionReused(connection))
+
+    def test_unusableSession(self):
+        options=MumbleTLS.ResumingCertificateOptions()
+        options._session=object()
+        connection=options.clientConnectionForTLS(object())
+        self.assertIsNone(options._session)
+        self.handshake(connection)
+
+    def test_unreadableCache(self):
+        with open(self.sessionCache,"wb") as f:
+            f.write(b"not a session")
+        options=MumbleTLS.ResumingCertificateOptions(self.sessionCache)
+        self.assertIsNone(options._session)
+        self.handshake(options.clientConnectionForTLS(object()))
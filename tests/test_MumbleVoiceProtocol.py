@@ -0,0 +1,132 @@
+import struct
+import unittest
+
+from mumbleclient import MumbleVoiceProtocol
+from mumbleclient.MumbleVoiceProtocol import VoicePacketBuilder, VoicePacket
+
+
+# One value at each end of every width of encoding
+_PDS_VALUES=[0,1,0x7F,0x80,0x3FFF,0x4000,0x1FFFFF,0x200000,0xFFFFFFF,0x10000000,
+             0xFFFFFFFF,0x100000000,0x7FFFFFFFFFFFFFFF,-1,-4,-5,-0x80,-0x4000,-0x100000000]
+
+
+class PDSIntTest(unittest.TestCase):
+
+    def encode(self,value):
+        buf=bytearray(MumbleVoiceProtocol.pdsIntLength(value))
+        self.assertEqual(MumbleVoiceProtocol.encodePDSInt(value,buf),len(buf))
+        return buf
+
+    def test_roundTrip(self):
+        for value in _PDS_VALUES:
+            buf=self.encode(value)
+            for data in (bytes(buf),buf,memoryview(buf)):
+                self.assertEqual(MumbleVoiceProtocol.decodePDSInt(data),(value,len(buf)))
+
+    def test_knownEncodings(self):
+        self.assertEqual(bytes(self.encode(5)),b"\x05")
+        self.assertEqual(bytes(self.encode(0x2000)),b"\xa0\x00")
+        self.assertEqual(bytes(self.encode(0x12345)),b"\xc1\x23\x45")
+        self.assertEqual(bytes(self.encode(-1)),b"\xfc")
+        self.assertEqual(bytes(self.encode(-5)),b"\xf8\x04")
+
+    def test_offset(self):
+        buf=bytearray(b"\xff")+self.encode(0x4000)
+        self.assertEqual(MumbleVoiceProtocol.decodePDSInt(buf,1),(0x4000,3))
+
+    def test_batch(self):
+        data=b"".join(bytes(self.encode(value)) for value in _PDS_VALUES)
+        self.assertEqual(MumbleVoiceProtocol.decodePDSInts(data),(_PDS_VALUES,len(data)))
+        values,position=MumbleVoiceProtocol.decodePDSInts(data,0,3)
+        self.assertEqual(values,_PDS_VALUES[:3])
+        self.assertEqual(MumbleVoiceProtocol.decodePDSInts(data,position),(_PDS_VALUES[3:],len(data)))
+        self.assertRaises(ValueError,MumbleVoiceProtocol.decodePDSInts,data,0,len(_PDS_VALUES)+1)
+
+    def test_repeatedNegativeMarker(self):
+        self.assertRaises(ValueError,MumbleVoiceProtocol.decodePDSInt,b"\xf8\xf8\x01")
+
+
+class VoicePacketTest(unittest.TestCase):
+
+    def test_ping(self):
+        packet=MumbleVoiceProtocol.decodeAudioMessage(b"\x20\x05")
+        self.assertEqual(packet.codec,MumbleVoiceProtocol.PING)
+        self.assertIsNone(packet.session)
+        self.assertEqual(packet.sequence,5)
+        self.assertEqual(packet.frames,[])
+
+    def test_header(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.SPEEX,target=31)
+        packet=VoicePacket(builder.build(1,[b"s"],session=300).tobytes())
+        self.assertEqual((packet.codec,packet.target,packet.session),(MumbleVoiceProtocol.SPEEX,31,300))
+        self.assertEqual(packet.prefix,struct.pack(">B",(MumbleVoiceProtocol.SPEEX << 5) | 31))
+        self.assertEqual(packet.payload.tobytes(),packet.data)
+
+    def test_getAudioFrames(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.CELT_BETA)
+        data=builder.build(17,[b"ab",b"cde"],position=(0.5,0.25,2.0)).tobytes()
+        sequence,frames,terminator,position=MumbleVoiceProtocol.getAudioFrames(data,MumbleVoiceProtocol.CELT_BETA,1)
+        self.assertEqual(sequence,17)
+        self.assertEqual([data[offset:offset+length] for offset,length in frames],[b"ab",b"cde"])
+        self.assertFalse(terminator)
+        self.assertEqual(position,(0.5,0.25,2.0))
+
+    def test_emptyCeltTerminator(self):
+        # A CELT or Speex transmission can end with an empty frame of its own
+        data=b"\x00\x07\x03\x82ab\x00"
+        packet=VoicePacket(data)
+        self.assertEqual(packet.sequence,3)
+        self.assertEqual(packet.frame(0).tobytes(),b"ab")
+        self.assertTrue(packet.terminator)
+
+
+class VoicePacketBuilderTest(unittest.TestCase):
+
+    def roundTrip(self,builder,sequence,frames,terminator=False,position=None,session=7):
+        raw=builder.build(sequence,frames,terminator,position,session).tobytes()
+        self.assertEqual(len(raw),builder.packetLength(sequence,frames,terminator,position,session))
+        return VoicePacket(raw)
+
+    def test_opusFrame(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+        packet=self.roundTrip(builder,1234,[b"opus"*30])
+        self.assertEqual(packet.codec,MumbleVoiceProtocol.OPUS)
+        self.assertEqual(packet.session,7)
+        self.assertEqual(packet.sequence,1234)
+        self.assertEqual([packet.frame(i).tobytes() for i in range(len(packet.frames))],[b"opus"*30])
+        self.assertFalse(packet.terminator)
+
+    def test_opusTerminatorWithFrame(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+        packet=self.roundTrip(builder,5,[b"last"],terminator=True)
+        self.assertEqual(packet.frame(0).tobytes(),b"last")
+        self.assertTrue(packet.terminator)
+
+    def test_opusTerminatorWithoutFrame(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+        self.assertEqual(builder.build(5,[],terminator=True).tobytes(),b"\x80\x05\xa0\x00")
+        packet=self.roundTrip(builder,5,[],terminator=True)
+        self.assertEqual(packet.sequence,5)
+        self.assertEqual(packet.frames,[])
+        self.assertTrue(packet.terminator)
+
+    def test_celtFrames(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.CELT_ALPHA)
+        frames=[b"a"*10,b"b"*20,b"c"*30]
+        packet=self.roundTrip(builder,99,frames,terminator=True)
+        self.assertEqual([packet.frame(i).tobytes() for i in range(len(packet.frames))],frames)
+        self.assertTrue(packet.terminator)
+
+    def test_position(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.OPUS)
+        packet=self.roundTrip(builder,3,[b"x"],position=(1.0,-2.5,3.25))
+        self.assertEqual(packet.position,(1.0,-2.5,3.25))
+
+    def test_relayData(self):
+        builder=VoicePacketBuilder(MumbleVoiceProtocol.OPUS,target=2)
+        packet=self.roundTrip(builder,8,[b"frame"])
+        self.assertEqual(packet.relayData(),builder.build(8,[b"frame"]).tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()